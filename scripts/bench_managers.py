@@ -0,0 +1,76 @@
+"""Compare per-call overhead of the aspect managers.
+
+Usage: python scripts/bench_managers.py [iterations]
+
+Runs a trivial step through AspectManager, OptimizedAspectManager and
+CompiledAspectManager with 3, 5 and 8 pass-through aspects, then with 3
+aspects whose hooks are all ``@noop_hook``, and prints the mean cost per call
+in nanoseconds.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from wanaspects import AspectManager, CompiledAspectManager, OptimizedAspectManager  # noqa: E402
+from wanaspects.core.aspect import noop_hook  # noqa: E402
+from wanaspects.core.context import AdviceContext  # noqa: E402
+
+
+class PassThroughAspect:
+    def before(self, ctx: AdviceContext) -> None:
+        pass
+
+    def around(self, ctx: AdviceContext, call: Callable[[], Any]) -> Any:
+        return call()
+
+    def after(self, ctx: AdviceContext, result: Any, error: Exception | None) -> None:
+        pass
+
+
+class NoOpAspect:
+    @noop_hook
+    def before(self, ctx: AdviceContext) -> None:
+        pass
+
+    @noop_hook
+    def around(self, ctx: AdviceContext, call: Callable[[], Any]) -> Any:
+        return call()
+
+    @noop_hook
+    def after(self, ctx: AdviceContext, result: Any, error: Exception | None) -> None:
+        pass
+
+
+def bench(manager: Any, iterations: int) -> float:
+    ctx = AdviceContext(step_name="bench", container_shape="single")
+    run = manager.run
+
+    def unit() -> int:
+        return 1
+
+    start = time.perf_counter_ns()
+    for _ in range(iterations):
+        run(ctx, unit)
+    return (time.perf_counter_ns() - start) / iterations
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    managers = (AspectManager, OptimizedAspectManager, CompiledAspectManager)
+    print(f"{'aspects':>8}" + "".join(f"{m.__name__:>26}" for m in managers))
+    for count in (3, 5, 8):
+        row = [bench(m([PassThroughAspect() for _ in range(count)]), iterations) for m in managers]
+        print(f"{count:>8}" + "".join(f"{ns:>23.0f} ns" for ns in row))
+    row = [bench(m([NoOpAspect() for _ in range(3)]), iterations) for m in managers]
+    print(f"{'3 no-op':>8}" + "".join(f"{ns:>23.0f} ns" for ns in row))
+
+
+if __name__ == "__main__":
+    main()
@@ -13,37 +13,42 @@ from .aspects import (
     TracingAspect,
 )
 from .aspects.conditional_context import ConditionalContextPropagationAspect
+from .aspects.logging import LogSink
+from .aspects.observability import ObservabilityAspect
 from .aspects.sampled_metrics import SampledMetricsAspect
 from .aspects.smart_logging import SmartLoggingAspect
+from .aspects.tail_buffer import TailBufferAspect
+from .compiled_manager import CompiledAspectManager
 from .config import load_config
 from .context import current_context
+from .executors import AspectProcessPoolExecutor, AspectThreadPoolExecutor, wrap_submit
 from .manager import AspectManager
 from .optimized_manager import OptimizedAspectManager
+from .provenance import config_hash, default_context_factory, package_versions
+from .routing_manager import Route, RoutingAspectManager
+from .switchable_manager import SwitchableAspectManager, global_manager
 from .telemetry import init_telemetry
 
 
-def default_bundle() -> list[object]:
+def default_bundle(*, log_sink: LogSink = "stdlib") -> list[object]:
+    """Full observability: logging, tracing and metrics fused in one aspect."""
     return [
         ContextPropagationAspect(),
-        LoggingAspect(),
-        TracingAspect(),
-        MetricsAspect(),
+        ObservabilityAspect(log_sink=log_sink),
         ContractAspect(),
     ]
 
 
-def dev_bundle() -> list[object]:
+def dev_bundle(*, log_sink: LogSink = "stdlib") -> list[object]:
     """Development bundle with full verbose logging for debugging."""
     return [
         ContextPropagationAspect(),
-        SmartLoggingAspect(tier="development"),  # Full logging
-        TracingAspect(),
-        MetricsAspect(),
+        ObservabilityAspect(tier="development", log_sink=log_sink),  # Full logging
         ContractAspect(),
     ]
 
 
-def prod_bundle() -> list[object]:
+def prod_bundle(*, log_sink: LogSink = "stdlib") -> list[object]:
     """Production bundle optimized for performance while maintaining observability.
 
     Optimizations:
@@ -51,15 +56,15 @@ def prod_bundle() -> list[object]:
     - Smart logging: Only errors and boundary events (not noisy internal calls)
     - Sampled metrics: 10% sampling for metrics (100% error tracking)
     - Full tracing: OpenTelemetry spans for distributed tracing
+    - Fused observability: logging, tracing and metrics share one aspect
     - No contracts: Validation overhead removed in production
 
     Target: ~100x overhead (achieves <100x with realistic workloads)
     """
     return [
         ConditionalContextPropagationAspect(),  # Only for boundaries
-        SmartLoggingAspect(tier="production"),  # Errors + boundaries only
-        TracingAspect(),
-        SampledMetricsAspect(sample_rate=0.1),  # 10% sampling, 100% errors
+        # Errors + boundaries logged, spans for every step, 10% metrics (100% errors)
+        ObservabilityAspect(tier="production", metrics_sample_rate=0.1, log_sink=log_sink),
         # ContractAspect(),  # Disabled in prod for performance
     ]
 
@@ -68,26 +73,39 @@ def bundle_from_config() -> list[object]:
     cfg = load_config()
     name = (cfg.bundle or "default").lower()
     if name == "prod":
-        return prod_bundle()
+        return prod_bundle(log_sink=cfg.log_sink)
     if name == "dev":
-        return dev_bundle()
-    return default_bundle()
+        return dev_bundle(log_sink=cfg.log_sink)
+    return default_bundle(log_sink=cfg.log_sink)
 
 
 __all__ = [
     "AspectManager",
     "OptimizedAspectManager",
+    "CompiledAspectManager",
+    "RoutingAspectManager",
+    "Route",
+    "SwitchableAspectManager",
+    "global_manager",
     "ContextPropagationAspect",
     "ConditionalContextPropagationAspect",
     "LoggingAspect",
     "SmartLoggingAspect",
+    "ObservabilityAspect",
     "TracingAspect",
     "MetricsAspect",
     "SampledMetricsAspect",
+    "TailBufferAspect",
     "ContractAspect",
     "ChainContractError",
     "ContractViolation",
     "current_context",
+    "AspectThreadPoolExecutor",
+    "AspectProcessPoolExecutor",
+    "wrap_submit",
+    "default_context_factory",
+    "package_versions",
+    "config_hash",
     "init_telemetry",
     "bundle_from_config",
     "dev_bundle",
@@ -0,0 +1,256 @@
+"""Aggregate high-frequency events in memory and report them as periodic summaries.
+
+:class:`Aggregator` keeps one :class:`AggregateStats` per key (a step, a SQL
+fingerprint, a cache namespace, ...) and hands a summary of each key to a
+callback once per interval, when too many keys pile up, and at interpreter
+shutdown. A shared daemon thread writes the summaries of intervals that ended
+without further traffic, so a quiet key still reports on time. Recording is a
+dict lookup and a few integer updates under a lock, so the cost per event does
+not depend on how many summaries are written.
+"""
+
+from __future__ import annotations
+
+import atexit
+import bisect
+import os
+import threading
+import time
+import weakref
+from collections.abc import Callable, Hashable, Mapping
+from typing import Any, Generic, TypeVar
+
+__all__ = ["AggregateStats", "Aggregator", "LatencyHistogram"]
+
+K = TypeVar("K", bound=Hashable)
+
+# Bucket upper bounds grow by 2**(1/4) from 1µs to beyond an hour, so a
+# percentile is reported within ~19% of the true value.
+_GROWTH = 2**0.25
+_SMALLEST_MS = 0.001
+_BUCKET_COUNT = 212
+_BOUNDS = tuple(_SMALLEST_MS * _GROWTH**i for i in range(_BUCKET_COUNT))
+_PERCENTILES = (50, 90, 99)
+_DEFAULT_INTERVAL_S = 60.0
+_DEFAULT_MAX_KEYS = 10_000
+# How often the idle flusher looks for intervals that ended without traffic.
+_IDLE_TICK_S = 1.0
+
+
+class LatencyHistogram:
+    """Latency distribution in milliseconds with exact min/max/mean."""
+
+    __slots__ = ("_buckets", "count", "max", "min", "total")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self._buckets: dict[int, int] = {}
+
+    def record(self, value_ms: float) -> None:
+        self.count += 1
+        self.total += value_ms
+        self.min = min(self.min, value_ms)
+        self.max = max(self.max, value_ms)
+        index = bisect.bisect_left(_BOUNDS, value_ms)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+
+    def percentile(self, q: float) -> float | None:
+        """Approximate ``q``-th percentile (0-100), clamped to the observed range."""
+        if not self.count:
+            return None
+        rank = q / 100.0 * self.count
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                bound = _BOUNDS[index] if index < _BUCKET_COUNT else self.max
+                return min(max(bound, self.min), self.max)
+        return self.max
+
+    def summary(self) -> dict[str, float]:
+        """``min_ms``, ``max_ms``, ``mean_ms`` and ``p50_ms``/``p90_ms``/``p99_ms``."""
+        if not self.count:
+            return {}
+        data = {
+            "min_ms": self.min,
+            "max_ms": self.max,
+            "mean_ms": self.total / self.count,
+        }
+        for q in _PERCENTILES:
+            data[f"p{q}_ms"] = self.percentile(q) or 0.0
+        return data
+
+
+class AggregateStats:
+    """What one key saw during one interval."""
+
+    __slots__ = ("count", "errors", "latency", "totals")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors: dict[str, int] = {}
+        self.totals: dict[str, int] = {}
+        self.latency = LatencyHistogram()
+
+    def summary(self) -> dict[str, Any]:
+        """Flat fields for a summary record: ``count``, totals, ``errors``, latency."""
+        data: dict[str, Any] = {"count": self.count}
+        data.update(self.totals)
+        if self.errors:
+            data["errors"] = dict(self.errors)
+        for name, value in self.latency.summary().items():
+            data[f"duration_{name}"] = value
+        return data
+
+
+class Aggregator(Generic[K]):
+    """Accumulate events per key and pass each key's summary to ``emit``.
+
+    ``emit(key, fields)`` is called from the thread that records the first
+    event after an interval has elapsed, from :meth:`flush`, at interpreter
+    shutdown and, when no event arrives, from a shared daemon thread within
+    about a second of the interval's end (pass ``idle_flush=False`` to only
+    report on traffic). ``fields`` is :meth:`AggregateStats.summary` plus
+    ``interval_s``, the seconds the summary covers. When ``max_keys`` keys
+    collect within one interval the aggregator flushes early, which bounds its
+    memory.
+
+    Live aggregators are tracked weakly: one that is dropped is not kept alive
+    for the shutdown flush, so call :meth:`close` to write its last interval.
+    """
+
+    def __init__(
+        self,
+        emit: Callable[[K, dict[str, Any]], None],
+        interval_s: float = _DEFAULT_INTERVAL_S,
+        *,
+        max_keys: int = _DEFAULT_MAX_KEYS,
+        idle_flush: bool = True,
+    ) -> None:
+        if interval_s <= 0:
+            msg = f"interval_s must be positive, got {interval_s}"
+            raise ValueError(msg)
+        if max_keys <= 0:
+            msg = f"max_keys must be positive, got {max_keys}"
+            raise ValueError(msg)
+        self._emit = emit
+        self.interval_s = interval_s
+        self._max_keys = max_keys
+        self._lock = threading.Lock()
+        self._stats: dict[K, AggregateStats] = {}
+        self._started = time.monotonic()
+        self._deadline = self._started + interval_s
+        _LIVE.add(self)
+        if idle_flush:
+            _IDLE.add(self)
+            _start_idle_flusher()
+
+    def record(
+        self,
+        key: K,
+        duration_ms: float | None = None,
+        *,
+        error_kind: str | None = None,
+        totals: Mapping[str, int] | None = None,
+    ) -> None:
+        """Count one event for ``key``; ``totals`` are added to per-key sums."""
+        due = False
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = AggregateStats()
+            stats.count += 1
+            if duration_ms is not None:
+                stats.latency.record(duration_ms)
+            if error_kind is not None:
+                stats.errors[error_kind] = stats.errors.get(error_kind, 0) + 1
+            if totals:
+                sums = stats.totals
+                for name, value in totals.items():
+                    sums[name] = sums.get(name, 0) + value
+            if len(self._stats) >= self._max_keys or time.monotonic() >= self._deadline:
+                due = True
+        if due:
+            self.flush()
+
+    def snapshot(self) -> dict[K, dict[str, Any]]:
+        """Summaries of the current interval so far, without resetting it."""
+        with self._lock:
+            return {key: stats.summary() for key, stats in self._stats.items()}
+
+    def flush(self) -> None:
+        """Emit every key's summary now and start a new interval."""
+        now = time.monotonic()
+        with self._lock:
+            stats, self._stats = self._stats, {}
+            elapsed = now - self._started
+            self._started = now
+            self._deadline = now + self.interval_s
+        for key, entry in stats.items():
+            fields = entry.summary()
+            fields["interval_s"] = round(elapsed, 3)
+            self._emit(key, fields)
+
+    def _flush_if_due(self) -> None:
+        with self._lock:
+            due = bool(self._stats) and time.monotonic() >= self._deadline
+        if due:
+            self.flush()
+
+    def close(self) -> None:
+        """Flush and stop reporting when idle and at shutdown."""
+        _LIVE.discard(self)
+        _IDLE.discard(self)
+        self.flush()
+
+
+# Aggregators still reporting, flushed at shutdown, and the subset the idle
+# flusher visits. Weak, so registering does not keep an aggregator alive.
+_LIVE: weakref.WeakSet[Aggregator[Any]] = weakref.WeakSet()
+_IDLE: weakref.WeakSet[Aggregator[Any]] = weakref.WeakSet()
+_flusher_lock = threading.Lock()
+_flusher: threading.Thread | None = None
+
+
+def _flush_idle() -> None:
+    while True:
+        time.sleep(_IDLE_TICK_S)
+        for aggregator in list(_IDLE):
+            try:
+                aggregator._flush_if_due()
+            except Exception:  # pragma: no cover - a failing sink must not stop the flusher
+                pass
+
+
+def _start_idle_flusher() -> None:
+    global _flusher  # noqa: PLW0603
+    if _flusher is not None:
+        return
+    with _flusher_lock:
+        if _flusher is None:
+            _flusher = threading.Thread(
+                target=_flush_idle, name="wanaspects-aggregation", daemon=True
+            )
+            _flusher.start()
+
+
+def _after_fork_in_child() -> None:
+    # The flusher thread does not survive fork; start a new one on demand.
+    global _flusher, _flusher_lock  # noqa: PLW0603
+    _flusher = None
+    _flusher_lock = threading.Lock()
+    if _IDLE:
+        _start_idle_flusher()
+
+
+@atexit.register
+def _flush_all() -> None:
+    for aggregator in list(_LIVE):
+        aggregator.flush()
+
+
+if hasattr(os, "register_at_fork"):  # pragma: no branch - POSIX
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -1,14 +1,12 @@
 from __future__ import annotations
 
-from collections.abc import Callable
 from typing import Any
 
-from ..context import reset_current_context, set_current_context
-from ..core.aspect import Aspect
 from ..core.context import AdviceContext
+from .context import ContextPropagationAspect
 
 
-class ConditionalContextPropagationAspect(Aspect):
+class ConditionalContextPropagationAspect(ContextPropagationAspect):
     """Context propagation aspect that only propagates for boundary calls.
 
     In high-performance scenarios, context propagation adds overhead (44x) for
@@ -29,6 +27,7 @@ class ConditionalContextPropagationAspect(Aspect):
             propagate_all: If True, always propagate (like regular ContextPropagationAspect).
                           If False (default), only propagate for boundary calls.
         """
+        super().__init__()
         self.propagate_all = propagate_all
 
     def _should_propagate(self, ctx: AdviceContext) -> bool:
@@ -49,11 +48,8 @@ class ConditionalContextPropagationAspect(Aspect):
 
     def before(self, ctx: AdviceContext) -> None:
         if self._should_propagate(ctx):
-            set_current_context(ctx)
-
-    def around(self, ctx: AdviceContext, call: Callable[[], Any]) -> Any:
-        return call()
+            super().before(ctx)
 
     def after(self, ctx: AdviceContext, result: Any, error: Exception | None) -> None:
         if self._should_propagate(ctx):
-            reset_current_context()
+            super().after(ctx, result, error)
@@ -4,18 +4,51 @@ from collections.abc import Callable
 from typing import Any
 
 from ..context import reset_current_context, set_current_context
-from ..core.aspect import Aspect
+from ..core.aspect import Aspect, noop_hook
 from ..core.context import AdviceContext
+from ..core.frame import _CURRENT_STATE, _owned_state
+from ..propagation import PropagatedContext, inherited
 
 
 class ContextPropagationAspect(Aspect):
-    """Expose the current AdviceContext via contextvars for downstream helpers."""
+    """Expose the current AdviceContext via contextvars for downstream helpers.
+
+    In a worker process started with :func:`~wanaspects.propagation.inject_env`
+    (or built with ``inherited_context=extract(payload)`` for an
+    :func:`~wanaspects.propagation.inject` payload), root steps publish their
+    context with the parent's run_id/tenant/config_hash filled in and run under
+    the parent's trace context, so their spans join the spawning step's trace.
+    """
+
+    def __init__(self, inherited_context: PropagatedContext | None = None) -> None:
+        # Read once, when the worker builds its bundle.
+        self._inherited = inherited_context if inherited_context is not None else inherited()
 
     def before(self, ctx: AdviceContext) -> None:
-        set_current_context(ctx)
+        owned = _owned_state(ctx)
+        if owned is None:
+            # Hooks driven outside a manager: push a state of our own.
+            set_current_context(ctx)
+            return
+        state, frame = owned
+        parent = self._inherited
+        if parent is not None and state.context is None:
+            _CURRENT_STATE.set(state._replace(context=parent.apply(ctx)))
+            frame.scratch[id(self)] = parent.attach()
+        else:
+            _CURRENT_STATE.set(state._replace(context=ctx))
 
+    @noop_hook
     def around(self, ctx: AdviceContext, call: Callable[[], Any]) -> Any:
         return call()
 
     def after(self, ctx: AdviceContext, result: Any, error: Exception | None) -> None:
-        reset_current_context()
+        owned = _owned_state(ctx)
+        if owned is None:
+            reset_current_context()
+            return
+        state, frame = owned
+        parent = state.parent
+        _CURRENT_STATE.set(state._replace(context=None if parent is None else parent.context))
+        if frame._scratch:
+            PropagatedContext.detach(frame._scratch.pop(id(self), None))
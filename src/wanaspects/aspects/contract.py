@@ -3,23 +3,30 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import Any
 
-from ..core.aspect import Aspect
+from ..core.aspect import Aspect, noop_hook
 from ..core.context import AdviceContext
-from ..guards import ChainContractError, _reset_allow_materialize, _set_allow_materialize
+from ..core.frame import _CURRENT_STATE, _owned_state
+from ..guards import ChainContractError
 
 
 class ContractAspect(Aspect):
     def before(self, ctx: AdviceContext) -> None:
         if ctx.boundary not in ("none", "geo", "io"):
             raise ChainContractError(f"Unknown boundary '{ctx.boundary}'. Valid: none, geo, io.")
+        # Enable materialization only for boundary steps. The permission lives in
+        # the step's ambient state, so it covers sync, async and streamed bodies
+        # alike and ends with the step.
+        owned = _owned_state(ctx)
+        if owned is not None:
+            allow = ctx.boundary != "none"
+            state = owned[0]
+            if state.allow_materialize is not allow:
+                _CURRENT_STATE.set(state._replace(allow_materialize=allow))
 
+    @noop_hook
     def around(self, ctx: AdviceContext, call: Callable[[], Any]) -> Any:
-        # Enable materialization only for boundary steps
-        token = _set_allow_materialize(ctx.boundary != "none")
-        try:
-            return call()
-        finally:
-            _reset_allow_materialize(token)
+        return call()
 
+    @noop_hook
     def after(self, ctx: AdviceContext, result: Any, error: Exception | None) -> None:
         return None
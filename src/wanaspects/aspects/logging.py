@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-import contextvars
 import logging
-import time
 from collections.abc import Callable
-from typing import Any
+from typing import Any, Literal
 
-from ..core.aspect import Aspect
+from ..core.aspect import Aspect, noop_hook
+from ..core.batch import BatchResult
 from ..core.context import AdviceContext
+from ..core.frame import current_frame
+from ..core.stream import StreamResult
+from ..rate_limit import KeyedRateLimiter
 
 # optional structlog integration
 _structlog: Any | None
@@ -16,18 +18,86 @@ try:  # pragma: no cover - import environment dependent
 except Exception:  # pragma: no cover
     _structlog = None
 
-_DURATION_MS: contextvars.ContextVar[float | None] = contextvars.ContextVar(
-    "wanaspects_logging_duration_ms", default=None
-)
+
+LogSink = Literal["stdlib", "structlog", "native"]
+_SINKS: frozenset[str] = frozenset({"stdlib", "structlog", "native"})
+# Pseudo source location for records built without a caller lookup.
+_NO_FILE = "(unknown file)"
+
+
+def _step_duration_ms(ctx: AdviceContext, result: Any) -> float | None:
+    """Wall time of the step ``ctx`` from its stream result or the manager's frame."""
+    if isinstance(result, StreamResult):
+        return result.duration_ms
+    frame = current_frame()
+    if frame is not None and frame.ctx is ctx:
+        return frame.duration_ms
+    return None
 
 
 class LoggingAspect(Aspect):
-    def __init__(self) -> None:
+    """Emit ``step_start``/``step_end`` records with the step's correlation fields.
+
+    Each event is built and emitted once, through one ``sink``:
+
+    - ``stdlib`` (default): ``logging.getLogger("wanaspects").log(...)`` with the
+      fields as record attributes (dots become underscores, e.g. ``error_kind``);
+    - ``structlog``: ``structlog.get_logger("wanaspects")`` with the fields as
+      keyword arguments (``error.kind``); falls back to ``stdlib`` when
+      structlog is not installed;
+    - ``native``: like ``stdlib`` but builds the ``LogRecord`` directly and hands
+      it to the logger's handlers, skipping the caller lookup ``Logger.log``
+      does. Records carry no file/line information.
+
+    Fields are only built for levels the ``wanaspects`` logger has enabled, so
+    ``step_start`` (DEBUG) costs one level check when the logger is at INFO.
+
+    With ``error_rate`` set, error ``step_end`` records are limited to that
+    many per second (bursts of ``error_burst``) per step and exception class.
+    Dropped records are counted, and the next record written for the pair
+    carries ``suppressed=<count>``, so an error storm costs a counter
+    increment per call instead of a formatted record. Counts still pending
+    when the storm ends are written by :meth:`flush_suppressed` (and
+    :meth:`close`) as one ``step_errors_suppressed`` record per pair.
+    """
+
+    def __init__(
+        self,
+        sink: LogSink = "stdlib",
+        *,
+        error_rate: float | None = None,
+        error_burst: int = 10,
+    ) -> None:
+        if sink not in _SINKS:
+            msg = f"sink must be one of {sorted(_SINKS)}, got {sink!r}"
+            raise ValueError(msg)
         self._logger = logging.getLogger("wanaspects")
+        self._structlog: Any | None = None
+        if sink == "structlog" and _structlog is not None:
+            self._structlog = _structlog.get_logger("wanaspects")
+        self.sink: LogSink = "stdlib" if sink == "structlog" and _structlog is None else sink
+        # stdlib record attributes cannot be dotted
+        dotted = self._structlog is not None
+        self._error_keys = ("error.kind", "error.msg") if dotted else ("error_kind", "error_msg")
+        self._error_limiter: KeyedRateLimiter[tuple[str, type]] | None = None
+        if error_rate is not None:
+            self._error_limiter = KeyedRateLimiter(error_rate, error_burst)
+
+    def _enabled(self, level: int) -> bool:
+        """Whether an event at ``level`` would be emitted; check it before building fields.
 
-    @staticmethod
-    def _sanitize_for_stdlib(fields: dict[str, Any]) -> dict[str, Any]:
-        return {key.replace(".", "_"): value for key, value in fields.items()}
+        ``Logger.isEnabledFor`` caches its answer per level and the cache is
+        cleared by ``setLevel``/``logging.disable``. structlog filters on its
+        own, so events bound for it are always built.
+        """
+        return self._structlog is not None or self._logger.isEnabledFor(level)
+
+    def _admit_error(self, ctx: AdviceContext, error: Exception) -> int | None:
+        """``None`` when the error record is rate-limited, else the count it replaces."""
+        limiter = self._error_limiter
+        if limiter is None:
+            return 0
+        return limiter.acquire((ctx.step_name, error.__class__))
 
     def _event_fields(
         self,
@@ -35,58 +105,70 @@ class LoggingAspect(Aspect):
         status: str | None = None,
         duration_ms: float | None = None,
         error: Exception | None = None,
+        result: Any = None,
     ) -> dict[str, Any]:
-        data: dict[str, Any] = {
-            "step": ctx.step_name,
-            "shape": ctx.container_shape,
-            "boundary": ctx.boundary,
-        }
-        if ctx.run_id is not None:
-            data["run_id"] = ctx.run_id
-        if ctx.tenant is not None:
-            data["tenant"] = ctx.tenant
-        if ctx.trace_id is not None:
-            data["trace_id"] = ctx.trace_id
-        if ctx.span_id is not None:
-            data["span_id"] = ctx.span_id
-        if ctx.config_hash is not None:
-            data["config_hash"] = ctx.config_hash
-        if ctx.package_versions:
-            data["versions"] = ctx.package_versions
+        data = dict(ctx.log_fields)
         if status is not None:
             data["status"] = status
         if duration_ms is not None:
             data["duration_ms"] = duration_ms
         if error is not None:
-            data["error.kind"] = error.__class__.__name__
-            data["error.msg"] = str(error)
+            kind_key, msg_key = self._error_keys
+            data[kind_key] = error.__class__.__name__
+            data[msg_key] = str(error)
+        if isinstance(result, BatchResult):
+            data["items"] = result.items
+            data["failed"] = result.failed
+        elif isinstance(result, StreamResult):
+            data["items"] = result.items
+            data["first_item_ms"] = result.first_item_ms
         return data
 
+    def _emit(self, event: str, level: int, fields: dict[str, Any]) -> None:
+        """Send one record to the configured sink; callers check :meth:`_enabled` first."""
+        if self._structlog is not None:
+            self._structlog.log(level, event, **fields)
+        elif self.sink == "native":
+            logger = self._logger
+            logger.handle(
+                logger.makeRecord(logger.name, level, _NO_FILE, 0, event, (), None, extra=fields)
+            )
+        else:
+            self._logger.log(level, event, extra=fields)
+
+    def flush_suppressed(self) -> None:
+        """Write the dropped error counts no ``step_end`` has reported yet."""
+        limiter = self._error_limiter
+        if limiter is None or not self._enabled(logging.ERROR):
+            return
+        kind_key = self._error_keys[0]
+        for (step, kind), count in limiter.drain().items():
+            fields = {"step": step, kind_key: kind.__name__, "suppressed": count}
+            self._emit("step_errors_suppressed", logging.ERROR, fields)
+
+    def close(self) -> None:
+        """Report pending suppressed error counts."""
+        self.flush_suppressed()
+
     def before(self, ctx: AdviceContext) -> None:
-        fields = self._event_fields(ctx)
-        if _structlog is not None:
-            _structlog.get_logger("wanaspects").debug("step_start", **fields)
-        # Always emit stdlib logging for capture without extra setup
-        self._logger.debug("step_start", extra=self._sanitize_for_stdlib(fields))
+        if self._enabled(logging.DEBUG):
+            self._emit("step_start", logging.DEBUG, self._event_fields(ctx))
 
+    @noop_hook
     def around(self, ctx: AdviceContext, call: Callable[[], Any]) -> Any:
-        start = time.perf_counter()
-        try:
-            return call()
-        finally:
-            elapsed_ms = (time.perf_counter() - start) * 1000.0
-            _DURATION_MS.set(elapsed_ms)
+        # Timing comes from the manager's StepFrame; nothing to wrap.
+        return call()
 
     def after(self, ctx: AdviceContext, result: Any, error: Exception | None) -> None:
-        status = "error" if error else "ok"
-        duration_ms = _DURATION_MS.get(None)
-        _DURATION_MS.set(None)
-        fields = self._event_fields(ctx, status, duration_ms, error)
-        if _structlog is not None:
-            logger = _structlog.get_logger("wanaspects")
-            if error:
-                logger.error("step_end", **fields)
-            else:
-                logger.info("step_end", **fields)
         level = logging.ERROR if error else logging.INFO
-        self._logger.log(level, "step_end", extra=self._sanitize_for_stdlib(fields))
+        if not self._enabled(level):
+            return
+        suppressed = 0 if error is None else self._admit_error(ctx, error)
+        if suppressed is None:
+            return
+        status = "error" if error else "ok"
+        duration_ms = _step_duration_ms(ctx, result)
+        fields = self._event_fields(ctx, status, duration_ms, error, result)
+        if suppressed:
+            fields["suppressed"] = suppressed
+        self._emit("step_end", level, fields)
@@ -2,13 +2,38 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import re
 from collections.abc import Mapping
 from typing import Any
 
-__all__ = ["log_db_query", "log_cache_operation", "log_api_call"]
+from ..aggregation import Aggregator
+
+__all__ = [
+    "CacheOperationAggregator",
+    "DbQueryAggregator",
+    "fingerprint_sql",
+    "log_db_query",
+    "log_cache_operation",
+    "log_api_call",
+]
 
 HTTP_ERROR_THRESHOLD = 500
+_FINGERPRINT_CACHE_SIZE = 2048
+_LOOKUP_TOTALS = {"hit": "hits", "miss": "misses"}
+_OTHER_NAMESPACE = "other"
+
+# Applied in order by fingerprint_sql().
+_SQL_NORMALIZERS: tuple[tuple[re.Pattern[str], str], ...] = (
+    (re.compile(r"/\*.*?\*/", re.DOTALL), " "),  # block comments
+    (re.compile(r"--[^\n]*"), " "),  # line comments
+    (re.compile(r"'(?:[^']|'')*'"), "?"),  # string literals
+    (re.compile(r"(?<![\w$.])-?\d+(?:\.\d+)?(?:e[+-]?\d+)?\b", re.IGNORECASE), "?"),  # numbers
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)"), "(?)"),  # IN (?, ?, ...)
+    (re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+"), "(?)"),  # VALUES (?), (?), ...
+    (re.compile(r"\s+"), " "),
+)
 
 
 def _emit(  # noqa: PLR0913
@@ -35,6 +60,89 @@ def _error_fields(error: Exception | None) -> dict[str, Any]:
     }
 
 
+@functools.lru_cache(maxsize=_FINGERPRINT_CACHE_SIZE)
+def fingerprint_sql(statement: str) -> str:
+    """Normalise ``statement`` so queries differing only in literals compare equal.
+
+    Comments are removed, string and numeric literals become ``?``, lists of
+    literals (``IN (1, 2, 3)``, multi-row ``VALUES``) collapse to ``(?)`` and
+    whitespace is collapsed. Driver placeholders (``%s``, ``:name``, ``$1``)
+    are kept. Results are cached for the hot statements of a process.
+
+    Example:
+        fingerprint_sql("SELECT * FROM t WHERE id IN (1, 2) AND name = 'x'")
+        # -> "SELECT * FROM t WHERE id IN (?) AND name = ?"
+    """
+    for pattern, replacement in _SQL_NORMALIZERS:
+        statement = pattern.sub(replacement, statement)
+    return statement.strip()
+
+
+class DbQueryAggregator:
+    """Per-fingerprint query statistics, written as periodic summary records.
+
+    Pass it to :func:`log_db_query` as ``aggregator``: each query is then
+    counted under :func:`fingerprint_sql` of its statement instead of being
+    logged, and one ``db.query.summary`` record per fingerprint is written to
+    ``logger`` every ``interval_s`` seconds (and at shutdown). Its ``db``
+    payload holds ``fingerprint``, ``count``, ``row_count`` (total), ``errors``
+    by kind and ``duration_min_ms``/``max``/``mean``/``p50``/``p90``/``p99``.
+    Failed queries, and queries slower than ``slow_query_ms`` when set, are
+    still logged individually.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        interval_s: float = 60.0,
+        *,
+        slow_query_ms: float | None = None,
+        max_fingerprints: int = 1000,
+    ) -> None:
+        self.logger = logger
+        self.slow_query_ms = slow_query_ms
+        self._aggregator: Aggregator[str] = Aggregator(
+            self._emit_summary, interval_s, max_keys=max_fingerprints
+        )
+
+    def record(
+        self,
+        statement: str,
+        *,
+        duration_ms: float | None = None,
+        row_count: int | None = None,
+        error_kind: str | None = None,
+    ) -> str:
+        """Count one execution of ``statement``; returns its fingerprint."""
+        fingerprint = fingerprint_sql(statement)
+        self._aggregator.record(
+            fingerprint,
+            duration_ms,
+            error_kind=error_kind,
+            totals=None if row_count is None else {"row_count": row_count},
+        )
+        return fingerprint
+
+    def is_slow(self, duration_ms: float | None) -> bool:
+        threshold = self.slow_query_ms
+        return threshold is not None and duration_ms is not None and duration_ms > threshold
+
+    def _emit_summary(self, fingerprint: str, summary: dict[str, Any]) -> None:
+        if self.logger.isEnabledFor(logging.INFO):
+            payload = {"fingerprint": fingerprint, **summary}
+            _emit(self.logger, logging.INFO, "db.query.summary", "db", payload, None)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Per-fingerprint statistics of the current interval so far."""
+        return self._aggregator.snapshot()
+
+    def flush(self) -> None:
+        self._aggregator.flush()
+
+    def close(self) -> None:
+        self._aggregator.close()
+
+
 def log_db_query(  # noqa: PLR0913
     logger: logging.Logger,
     statement: str,
@@ -45,13 +153,35 @@ def log_db_query(  # noqa: PLR0913
     success: bool = True,
     error: Exception | None = None,
     extra: Mapping[str, Any] | None = None,
+    aggregator: DbQueryAggregator | None = None,
 ) -> None:
-    """Log a database query with consistent structured fields."""
+    """Log a database query with consistent structured fields.
+
+    With an ``aggregator``, successful queries are only counted (see
+    :class:`DbQueryAggregator`); failed and slow ones are logged as well, with
+    the statement's ``fingerprint`` in the payload.
+    """
+
+    succeeded = success and error is None
+    fingerprint: str | None = None
+    slow = False
+    if aggregator is not None:
+        error_kind = None
+        if not succeeded:
+            error_kind = "unsuccessful" if error is None else error.__class__.__name__
+        fingerprint = aggregator.record(
+            statement, duration_ms=duration_ms, row_count=row_count, error_kind=error_kind
+        )
+        slow = aggregator.is_slow(duration_ms)
+        if succeeded and not slow:
+            return
 
     payload: dict[str, Any] = {
         "statement": statement,
-        "success": success and error is None,
+        "success": succeeded,
     }
+    if fingerprint is not None:
+        payload["fingerprint"] = fingerprint
     if parameters is not None:
         payload["parameters"] = parameters
     if duration_ms is not None:
@@ -63,9 +193,129 @@ def log_db_query(  # noqa: PLR0913
         payload.update(_error_fields(error))
 
     level = logging.INFO if payload["success"] else logging.ERROR
+    if slow and payload["success"]:
+        level = logging.WARNING
     _emit(logger, level, "db.query", "db", payload, extra)
 
 
+class CacheOperationAggregator:
+    """Per-namespace cache statistics, exported as metrics and periodic summaries.
+
+    Pass it to :func:`log_cache_operation` as ``aggregator``: each successful
+    operation then costs a few counter updates instead of a log record. Every
+    ``interval_s`` seconds (and at shutdown) one ``cache.summary`` record per
+    namespace is written to ``logger``. Its ``cache_event`` payload holds
+    ``namespace``, ``count``, a count per operation (``get``, ``set``,
+    ``invalidate``, ...), ``hits``/``misses``/``hit_ratio``, ``errors`` by
+    kind and ``duration_min_ms``/``max``/``mean``/``p50``/``p90``/``p99``.
+    Failed operations are still logged individually.
+
+    When OpenTelemetry is installed, operations are also counted on
+    ``wanchain_cache_operations_total`` and timed on
+    ``wanchain_cache_operation_duration_seconds``, with ``namespace``,
+    ``operation`` and ``outcome`` (``hit``/``miss``/``ok``/``error``)
+    attributes. Namespaces without a name are reported as ``"default"``;
+    once ``max_namespaces`` distinct names have been seen, further ones are
+    counted under ``"other"``, which bounds both memory and metric
+    cardinality.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        interval_s: float = 60.0,
+        *,
+        max_namespaces: int = 1000,
+    ) -> None:
+        self.logger = logger
+        self.max_namespaces = max_namespaces
+        # Room for every namespace plus "other": it never needs to flush early.
+        self._aggregator: Aggregator[str] = Aggregator(
+            self._emit_summary, interval_s, max_keys=max_namespaces + 2
+        )
+        # namespaces reported under their own name, at most max_namespaces
+        self._namespaces: set[str] = set()
+        # (operation, outcome) -> totals added per event, built once
+        self._totals: dict[tuple[str, str], dict[str, int]] = {}
+        # (namespace, operation, outcome) -> metric attributes, built once
+        self._attributes: dict[tuple[str, str, str], dict[str, str]] = {}
+        self._counter: Any | None = None
+        self._histogram: Any | None = None
+        try:  # pragma: no cover - environment dependent
+            from opentelemetry import metrics as _metrics  # noqa: PLC0415
+
+            meter = _metrics.get_meter("wanaspects")
+            self._counter = meter.create_counter("wanchain_cache_operations_total")
+            self._histogram = meter.create_histogram("wanchain_cache_operation_duration_seconds")
+        except Exception:
+            self._counter = None
+            self._histogram = None
+
+    def record(
+        self,
+        operation: str,
+        *,
+        namespace: str | None = None,
+        hit: bool | None = None,
+        duration_ms: float | None = None,
+        error_kind: str | None = None,
+    ) -> None:
+        """Count one cache operation."""
+        namespace = namespace or "default"
+        if namespace not in self._namespaces:
+            if len(self._namespaces) >= self.max_namespaces:
+                namespace = _OTHER_NAMESPACE
+            else:
+                self._namespaces.add(namespace)
+        if error_kind is not None:
+            outcome = "error"
+        elif hit is None:
+            outcome = "ok"
+        else:
+            outcome = "hit" if hit else "miss"
+        totals = self._totals.get((operation, outcome))
+        if totals is None:
+            totals = {operation: 1}
+            if outcome in _LOOKUP_TOTALS:
+                totals[_LOOKUP_TOTALS[outcome]] = 1
+            self._totals[(operation, outcome)] = totals
+        self._aggregator.record(namespace, duration_ms, error_kind=error_kind, totals=totals)
+        if self._counter is not None:
+            key = (namespace, operation, outcome)
+            attributes = self._attributes.get(key)
+            if attributes is None:
+                attributes = self._attributes[key] = {
+                    "namespace": namespace,
+                    "operation": operation,
+                    "outcome": outcome,
+                }
+            try:
+                self._counter.add(1, attributes=attributes)
+                if duration_ms is not None and self._histogram is not None:
+                    self._histogram.record(duration_ms / 1000.0, attributes=attributes)
+            except Exception:
+                pass
+
+    def _emit_summary(self, namespace: str, summary: dict[str, Any]) -> None:
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        payload = {"namespace": namespace, **summary}
+        lookups = summary.get("hits", 0) + summary.get("misses", 0)
+        if lookups:
+            payload["hit_ratio"] = summary.get("hits", 0) / lookups
+        _emit(self.logger, logging.INFO, "cache.summary", "cache_event", payload, None)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Per-namespace statistics of the current interval so far."""
+        return self._aggregator.snapshot()
+
+    def flush(self) -> None:
+        self._aggregator.flush()
+
+    def close(self) -> None:
+        self._aggregator.close()
+
+
 def log_cache_operation(  # noqa: PLR0913
     logger: logging.Logger,
     *,
@@ -77,13 +327,33 @@ def log_cache_operation(  # noqa: PLR0913
     success: bool = True,
     error: Exception | None = None,
     extra: Mapping[str, Any] | None = None,
+    aggregator: CacheOperationAggregator | None = None,
 ) -> None:
-    """Log cache operations (get, set, invalidate, etc.)."""
+    """Log cache operations (get, set, invalidate, etc.).
+
+    With an ``aggregator``, successful operations are only counted (see
+    :class:`CacheOperationAggregator`); failed ones are logged as well.
+    """
+
+    succeeded = success and error is None
+    if aggregator is not None:
+        error_kind = None
+        if not succeeded:
+            error_kind = "unsuccessful" if error is None else error.__class__.__name__
+        aggregator.record(
+            operation,
+            namespace=namespace,
+            hit=hit,
+            duration_ms=duration_ms,
+            error_kind=error_kind,
+        )
+        if succeeded:
+            return
 
     payload: dict[str, Any] = {
         "operation": operation,
         "key": key,
-        "success": success and error is None,
+        "success": succeeded,
     }
     if namespace is not None:
         payload["namespace"] = namespace
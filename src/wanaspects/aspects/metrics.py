@@ -1,25 +1,25 @@
 from __future__ import annotations
 
-import contextvars
-import time
 from collections.abc import Callable
 from typing import Any
 
-from ..core.aspect import Aspect
+from ..core.aspect import Aspect, noop_hook
+from ..core.batch import BatchResult
 from ..core.context import AdviceContext
-
-_DURATION_SECONDS: contextvars.ContextVar[float | None] = contextvars.ContextVar(
-    "wanaspects_metrics_duration_seconds", default=None
-)
+from ..core.frame import current_frame
+from ..core.stream import StreamResult
 
 
 class MetricsAspect(Aspect):
     def __init__(self) -> None:
         self._steps_total: dict[tuple[str, str, str, str], int] = {}
         self._step_errors_total: dict[tuple[str, str, str, str], int] = {}
+        self._batch_items_total: dict[tuple[str, str, str, str], int] = {}
         self._counter_steps: Any | None = None
         self._hist_duration: Any | None = None
         self._counter_errors: Any | None = None
+        self._counter_batch_items: Any | None = None
+        self._hist_first_item: Any | None = None
         # Optional OpenTelemetry metrics
         self._otel = False
         # optional OpenTelemetry metrics
@@ -31,53 +31,85 @@ class MetricsAspect(Aspect):
             self._counter_steps = meter.create_counter("wanchain_steps_total")
             self._hist_duration = meter.create_histogram("wanchain_step_duration_seconds")
             self._counter_errors = meter.create_counter("wanchain_step_errors_total")
+            self._counter_batch_items = meter.create_counter("wanchain_batch_items_total")
+            self._hist_first_item = meter.create_histogram("wanchain_stream_first_item_seconds")
             self._otel = True
         except Exception:
             self._otel = False
 
+    @noop_hook
     def before(self, ctx: AdviceContext) -> None:
         return None
 
+    @noop_hook
     def around(self, ctx: AdviceContext, call: Callable[[], Any]) -> Any:
-        start = time.perf_counter()
-        try:
-            return call()
-        finally:
-            duration = time.perf_counter() - start
-            _DURATION_SECONDS.set(duration)
+        # Timing comes from the manager's StepFrame; nothing to wrap.
+        return call()
 
     def after(self, ctx: AdviceContext, result: Any, error: Exception | None) -> None:
         status = "error" if error else "ok"
-        duration = _DURATION_SECONDS.get(None)
-        _DURATION_SECONDS.set(None)
+        duration: float | None = None
+        if isinstance(result, StreamResult):
+            duration = result.duration_ms / 1000.0
+        else:
+            frame = current_frame()
+            if frame is not None and frame.ctx is ctx:
+                duration = frame.duration_seconds
+        self._record(ctx, status, duration, error, result)
+
+    def _record(
+        self,
+        ctx: AdviceContext,
+        status: str,
+        duration: float | None,
+        error: Exception | None,
+        result: Any,
+    ) -> None:
+        """Update the counters and OTel instruments for one finished step."""
         key = (ctx.step_name, ctx.container_shape, ctx.boundary, status)
         self._steps_total[key] = self._steps_total.get(key, 0) + 1
         if error is not None:
-            err_key = (
-                ctx.step_name,
-                ctx.container_shape,
-                ctx.boundary,
-                error.__class__.__name__,
-            )
-            self._step_errors_total[err_key] = self._step_errors_total.get(err_key, 0) + 1
+            self._record_error(ctx, error)
+        if isinstance(result, BatchResult):
+            self._record_batch(ctx, result)
         if self._otel and self._counter_steps is not None and self._hist_duration is not None:
             try:
-                attrs = {
-                    "step": ctx.step_name,
-                    "shape": ctx.container_shape,
-                    "boundary": ctx.boundary,
-                    "status": status,
-                }
+                attrs = ctx.metric_attributes(status)
                 self._counter_steps.add(1, attributes=attrs)
                 if duration is not None:
                     self._hist_duration.record(duration, attributes=attrs)
-                if error is not None and self._counter_errors is not None:
-                    err_attrs = {
-                        "step": ctx.step_name,
-                        "shape": ctx.container_shape,
-                        "boundary": ctx.boundary,
-                        "error_kind": error.__class__.__name__,
-                    }
-                    self._counter_errors.add(1, attributes=err_attrs)
+                if (
+                    isinstance(result, StreamResult)
+                    and result.first_item_ms is not None
+                    and self._hist_first_item is not None
+                ):
+                    self._hist_first_item.record(result.first_item_ms / 1000.0, attributes=attrs)
             except Exception:
                 pass
+
+    def _record_error(self, ctx: AdviceContext, error: Exception) -> None:
+        """Count one error, in both the local totals and the OTel error counter."""
+        error_type = error.__class__.__name__
+        err_key = (ctx.step_name, ctx.container_shape, ctx.boundary, error_type)
+        self._step_errors_total[err_key] = self._step_errors_total.get(err_key, 0) + 1
+        if self._otel and self._counter_errors is not None:
+            try:
+                self._counter_errors.add(1, attributes=ctx.error_metric_attributes(error_type))
+            except Exception:
+                pass
+
+    def _record_batch(self, ctx: AdviceContext, batch: BatchResult) -> None:
+        """Count a batch's items once, with per-item error kinds when collected."""
+        counts = (("ok", batch.items - batch.failed), ("error", batch.failed))
+        for status, count in counts:
+            if not count:
+                continue
+            key = (ctx.step_name, ctx.container_shape, ctx.boundary, status)
+            self._batch_items_total[key] = self._batch_items_total.get(key, 0) + count
+            if self._counter_batch_items is not None:
+                try:
+                    self._counter_batch_items.add(count, attributes=ctx.metric_attributes(status))
+                except Exception:
+                    pass
+        for _, exc in batch.errors:
+            self._record_error(ctx, exc)
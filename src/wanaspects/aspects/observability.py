@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from typing import Any
+
+from ..core.aspect import Aspect
+from ..core.context import AdviceContext
+from .logging import LogSink
+from .sampled_metrics import SampledMetricsAspect, _sample_interval
+from .smart_logging import LoggingTier, SmartLoggingAspect
+from .tracing import TracingAspect, _trace
+
+
+class ObservabilityAspect(Aspect):
+    """Logging, tracing and metrics for a step in a single aspect.
+
+    Wraps a :class:`SmartLoggingAspect`, a :class:`TracingAspect` and a
+    :class:`SampledMetricsAspect` and calls their hooks, so records, spans and
+    instruments are exactly theirs, but the manager dispatches one ``before``,
+    one ``around`` and one ``after`` instead of up to nine hooks.
+
+    Sampling keeps every error; successful steps are logged (when the tier
+    allows it) every ``1/log_sample_rate`` calls and counted every
+    ``1/metrics_sample_rate`` calls. ``log_sink`` selects where records go
+    (see :class:`LoggingAspect`). The ``aggregate`` tier counts every call,
+    unsampled, into ``step_summary`` records written every
+    ``summary_interval_s`` seconds until :meth:`close`. ``error_log_rate`` and
+    ``error_log_burst`` rate-limit error records per step and exception class
+    (``error_rate``/``error_burst`` on :class:`LoggingAspect`); metrics still
+    count every error.
+
+    Example:
+        # What prod_bundle() uses: errors + boundaries logged, 10% metrics
+        aspect = ObservabilityAspect(tier="production", metrics_sample_rate=0.1)
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        tier: LoggingTier = "development",
+        *,
+        log_sample_rate: float = 1.0,
+        metrics_sample_rate: float = 1.0,
+        tracing: bool = True,
+        log_sink: LogSink = "stdlib",
+        summary_interval_s: float = 60.0,
+        error_log_rate: float | None = None,
+        error_log_burst: int = 10,
+    ) -> None:
+        # Validate here so the error names this aspect's keyword.
+        _sample_interval("log_sample_rate", log_sample_rate)
+        _sample_interval("metrics_sample_rate", metrics_sample_rate)
+        self.tier = tier
+        self.log_sample_rate = log_sample_rate
+        self.metrics_sample_rate = metrics_sample_rate
+        self._logging = SmartLoggingAspect(
+            tier,
+            log_sink,
+            summary_interval_s=summary_interval_s,
+            error_rate=error_log_rate,
+            error_burst=error_log_burst,
+            sample_rate=log_sample_rate,
+        )
+        self._tracing = TracingAspect() if tracing and _trace is not None else None
+        self._metrics = SampledMetricsAspect(metrics_sample_rate)
+
+    def before(self, ctx: AdviceContext) -> None:
+        self._logging.before(ctx)
+
+    def around(self, ctx: AdviceContext, call: Callable[[], Any]) -> Any:
+        if self._tracing is None:
+            return call()
+        return self._tracing.around(ctx, call)
+
+    async def around_async(self, ctx: AdviceContext, call: Callable[[], Awaitable[Any]]) -> Any:
+        if self._tracing is None:
+            return await call()
+        return await self._tracing.around_async(ctx, call)
+
+    def around_stream(self, ctx: AdviceContext, stream: Iterator[Any]) -> Iterator[Any]:
+        if self._tracing is None:
+            return stream
+        return self._tracing.around_stream(ctx, stream)
+
+    def around_astream(self, ctx: AdviceContext, stream: AsyncIterator[Any]) -> AsyncIterator[Any]:
+        if self._tracing is None:
+            return stream
+        return self._tracing.around_astream(ctx, stream)
+
+    def after(self, ctx: AdviceContext, result: Any, error: Exception | None) -> None:
+        self._metrics.after(ctx, result, error)
+        self._logging.after(ctx, result, error)
+
+    def close(self) -> None:
+        """Write the pending ``step_summary`` records and suppressed error counts."""
+        self._logging.close()
@@ -9,6 +9,14 @@ _MIN_SAMPLE_RATE = 0.0
 _MAX_SAMPLE_RATE = 1.0
 
 
+def _sample_interval(name: str, rate: float) -> int:
+    """Validate a sample rate and return its interval (1 call in every N is kept)."""
+    if not _MIN_SAMPLE_RATE < rate <= _MAX_SAMPLE_RATE:
+        msg = f"{name} must be between {_MIN_SAMPLE_RATE} and {_MAX_SAMPLE_RATE}, got {rate}"
+        raise ValueError(msg)
+    return int(_MAX_SAMPLE_RATE / rate)
+
+
 class SampledMetricsAspect(MetricsAspect):
     """Metrics aspect with configurable sampling for high-throughput scenarios.
 
@@ -38,16 +46,9 @@ class SampledMetricsAspect(MetricsAspect):
                         Errors are always tracked regardless of sample rate.
         """
         super().__init__()
-        if not _MIN_SAMPLE_RATE < sample_rate <= _MAX_SAMPLE_RATE:
-            msg = (
-                "sample_rate must be between "
-                f"{_MIN_SAMPLE_RATE} and {_MAX_SAMPLE_RATE}, got {sample_rate}"
-            )
-            raise ValueError(msg)
-
+        self._sample_interval = _sample_interval("sample_rate", sample_rate)
         self.sample_rate = sample_rate
         self._counter = 0
-        self._sample_interval = int(_MAX_SAMPLE_RATE / sample_rate)
 
     def _should_sample(self, error: Exception | None) -> bool:
         """Determine if this call should be sampled for metrics.
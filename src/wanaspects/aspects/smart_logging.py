@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import logging
 from typing import Any, Literal
 
+from ..aggregation import Aggregator
 from ..core.context import AdviceContext
-from .logging import LoggingAspect
+from .logging import LoggingAspect, LogSink, _step_duration_ms
+from .sampled_metrics import _sample_interval
 
-LoggingTier = Literal["development", "production", "debug"]
+LoggingTier = Literal["development", "production", "debug", "aggregate"]
+# (step, shape, boundary, status)
+SummaryKey = tuple[str, str, str, str]
 
 
 class SmartLoggingAspect(LoggingAspect):
@@ -15,14 +20,35 @@ class SmartLoggingAspect(LoggingAspect):
     - development: Full verbose logging (all before/after events)
     - production: Smart logging (errors + boundaries only, skip noisy internal calls)
     - debug: Trace-correlated logging (log when trace_id present, useful for debugging)
+    - aggregate: Errors logged as they happen; every call counted into one
+      ``step_summary`` record per (step, shape, boundary, status) every
+      ``summary_interval_s`` seconds, even when idle, and on :meth:`close`,
+      with the call count, error kinds and latency min/max/mean/p50/p90/p99
 
     This reduces logging overhead in production while maintaining comprehensive
-    error tracking and boundary observability.
+    error tracking and boundary observability. With ``sample_rate`` below 1.0,
+    only every ``1/sample_rate``-th successful ``step_end`` the tier would log
+    is written; errors and summaries are never sampled.
     """
 
-    def __init__(self, tier: LoggingTier = "production") -> None:
-        super().__init__()
+    def __init__(  # noqa: PLR0913
+        self,
+        tier: LoggingTier = "production",
+        sink: LogSink = "stdlib",
+        *,
+        summary_interval_s: float = 60.0,
+        error_rate: float | None = None,
+        error_burst: int = 10,
+        sample_rate: float = 1.0,
+    ) -> None:
+        super().__init__(sink, error_rate=error_rate, error_burst=error_burst)
         self.tier = tier
+        self.sample_rate = sample_rate
+        self._sample_interval = _sample_interval("sample_rate", sample_rate)
+        self._sample_counter = 0
+        self._summaries: Aggregator[SummaryKey] | None = None
+        if tier == "aggregate":
+            self._summaries = Aggregator(self._emit_summary, summary_interval_s)
 
     def _should_log_before(self, ctx: AdviceContext) -> bool:
         """Determine if step_start should be logged."""
@@ -55,6 +81,47 @@ class SmartLoggingAspect(LoggingAspect):
 
         return False
 
+    def _sampled(self, error: Exception | None) -> bool:
+        """Keep every error and one in ``1/sample_rate`` successful records."""
+        if error is not None or self._sample_interval == 1:
+            return True
+        self._sample_counter += 1
+        return self._sample_counter % self._sample_interval == 0
+
+    def _emit_summary(self, key: SummaryKey, summary: dict[str, Any]) -> None:
+        if not self._enabled(logging.INFO):
+            return
+        step, shape, boundary, status = key
+        fields = {"step": step, "shape": shape, "boundary": boundary, "status": status}
+        fields.update(summary)
+        self._emit("step_summary", logging.INFO, fields)
+
+    def _summarize(
+        self, ctx: AdviceContext, duration_ms: float | None, error: Exception | None
+    ) -> None:
+        """Count the call into its interval summary (``aggregate`` tier only)."""
+        summaries = self._summaries
+        if summaries is None:
+            return
+        status = "error" if error else "ok"
+        summaries.record(
+            (ctx.step_name, ctx.container_shape, ctx.boundary, status),
+            duration_ms,
+            error_kind=None if error is None else error.__class__.__name__,
+        )
+
+    def flush_summaries(self) -> None:
+        """Write the pending ``step_summary`` records now (``aggregate`` tier)."""
+        if self._summaries is not None:
+            self._summaries.flush()
+
+    def close(self) -> None:
+        """Write the pending summaries and suppressed error counts."""
+        summaries, self._summaries = self._summaries, None
+        if summaries is not None:
+            summaries.close()
+        super().close()
+
     def before(self, ctx: AdviceContext) -> None:
         """Log step_start only if appropriate for tier."""
         if self._should_log_before(ctx):
@@ -62,5 +129,7 @@ class SmartLoggingAspect(LoggingAspect):
 
     def after(self, ctx: AdviceContext, result: Any, error: Exception | None) -> None:
         """Log step_end based on tier and context."""
-        if self._should_log_after(ctx, error):
+        if self._summaries is not None:
+            self._summarize(ctx, _step_duration_ms(ctx, result), error)
+        if self._should_log_after(ctx, error) and self._sampled(error):
             super().after(ctx, result, error)
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from ..core.aspect import Aspect, noop_hook
+from ..core.context import AdviceContext
+from ..core.frame import StepFrame, current_frame
+from ..core.stream import StreamResult
+from ..tail_buffer import _BUFFER_KEY, _active_buffer, _TailBuffer
+
+_DEFAULT_CAPACITY = 1000
+
+
+class TailBufferAspect(Aspect):
+    """Buffer the log records of a step and write them only if it fails or is slow.
+
+    Records below the handler's ``flush_level`` (DEBUG/INFO by default) that
+    are emitted while the step runs, by the logging aspects or by any logger
+    in the step's code, go to a ring buffer of the last ``capacity`` records
+    on the step's frame. They are written when the step raises or takes longer
+    than ``latency_threshold_ms`` (when set), and dropped otherwise, so a
+    successful step pays one append per record. Nested steps share the
+    outermost step's buffer; a failing nested step writes it out early.
+
+    Requires :func:`~wanaspects.tail_buffer.enable_tail_buffering`. List it
+    before the logging aspects so it also holds their ``step_start`` records.
+
+    Example:
+        enable_tail_buffering()
+        manager = AspectManager([TailBufferAspect(latency_threshold_ms=500), *default_bundle()])
+    """
+
+    def __init__(
+        self, capacity: int = _DEFAULT_CAPACITY, latency_threshold_ms: float | None = None
+    ) -> None:
+        if capacity <= 0:
+            msg = f"capacity must be positive, got {capacity}"
+            raise ValueError(msg)
+        self.capacity = capacity
+        self.latency_threshold_ms = latency_threshold_ms
+
+    def before(self, ctx: AdviceContext) -> None:
+        frame = current_frame()
+        if frame is None or frame.ctx is not ctx:
+            return
+        if _active_buffer() is None:
+            frame.scratch[_BUFFER_KEY] = _TailBuffer(self.capacity)
+
+    @noop_hook
+    def around(self, ctx: AdviceContext, call: Callable[[], Any]) -> Any:
+        return call()
+
+    def _slow(self, frame: StepFrame, result: Any) -> bool:
+        threshold = self.latency_threshold_ms
+        if threshold is None:
+            return False
+        duration_ms: float | None
+        if isinstance(result, StreamResult):
+            duration_ms = result.duration_ms
+        else:
+            duration_ms = frame.duration_ms
+        return duration_ms is not None and duration_ms > threshold
+
+    def after(self, ctx: AdviceContext, result: Any, error: Exception | None) -> None:
+        frame = current_frame()
+        if frame is None or frame.ctx is not ctx:
+            return
+        keep = error is not None or self._slow(frame, result)
+        owned = frame._scratch.get(_BUFFER_KEY) if frame._scratch else None
+        if owned is not None:
+            owned.finish(keep=keep)
+        elif keep:
+            buffer = _active_buffer()
+            if buffer is not None:
+                buffer.flush()
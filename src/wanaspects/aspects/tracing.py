@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from functools import partial
 from typing import Any
 
-from ..core.aspect import Aspect
+from ..core.aspect import Aspect, noop_hook
+from ..core.batch import BatchResult
 from ..core.context import AdviceContext
+from ..core.stream import abracket_stream, bracket_stream
 
 # optional OpenTelemetry integration
 _trace: Any | None
@@ -20,38 +23,103 @@ except Exception:  # pragma: no cover
     _OtelStatusCode = None
 
 
+def _current_span(ctx: AdviceContext) -> Any:
+    """Start the step's span, with its attributes, as the current span.
+
+    Errors are recorded once, by :func:`_record_error`, not by OTel on exit.
+    """
+    assert _trace is not None
+    return _trace.get_tracer("wanaspects").start_as_current_span(
+        ctx.step_name,
+        attributes=ctx.span_attributes,
+        record_exception=False,
+        set_status_on_exception=False,
+    )
+
+
+def _stream_span(ctx: AdviceContext) -> Any:
+    """Start a span for a whole stream; it is made current per item, not here."""
+    assert _trace is not None
+    return _trace.get_tracer("wanaspects").start_span(ctx.step_name, attributes=ctx.span_attributes)
+
+
+def _set_result_attributes(span: Any, result: Any) -> None:
+    if isinstance(result, BatchResult) and getattr(span, "set_attribute", None):
+        span.set_attribute("wanchain.batch.items", result.items)
+        span.set_attribute("wanchain.batch.failed", result.failed)
+
+
+def _record_error(span: Any, exc: Exception) -> None:
+    if (
+        getattr(span, "record_exception", None)
+        and _OtelStatus is not None
+        and _OtelStatusCode is not None
+    ):
+        span.record_exception(exc)
+        span.set_status(_OtelStatus(_OtelStatusCode.ERROR))
+
+
+def _ending(span: Any, stream: Iterator[Any]) -> Iterator[Any]:
+    try:
+        yield from stream
+    finally:
+        span.end()
+
+
+async def _aending(span: Any, stream: AsyncIterator[Any]) -> AsyncIterator[Any]:
+    try:
+        async for item in stream:
+            yield item
+    finally:
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+        span.end()
+
+
 class TracingAspect(Aspect):
+    @noop_hook
     def before(self, ctx: AdviceContext) -> None:
         return None
 
     def around(self, ctx: AdviceContext, call: Callable[[], Any]) -> Any:
         if _trace is None:
             return call()
-        tracer = _trace.get_tracer("wanaspects")
-        with tracer.start_as_current_span(ctx.step_name) as span:
+        with _current_span(ctx) as span:
             try:
-                # attributes per naming spec
-                if getattr(span, "set_attribute", None):  # NonRecordingSpan safe guard
-                    span.set_attribute("wanchain.step.name", ctx.step_name)
-                    span.set_attribute("wanchain.container.shape", ctx.container_shape)
-                    span.set_attribute("wanchain.boundary", ctx.boundary)
-                    if ctx.run_id is not None:
-                        span.set_attribute("wanchain.run.id", ctx.run_id)
-                    if ctx.tenant is not None:
-                        span.set_attribute("wanchain.tenant", ctx.tenant)
-                    if ctx.package_versions:
-                        # Store as a string to keep attribute scalar
-                        span.set_attribute("wanchain.versions", str(ctx.package_versions))
-                return call()
+                result = call()
+                _set_result_attributes(span, result)
+                return result
             except Exception as exc:  # noqa: BLE001
-                if (
-                    getattr(span, "record_exception", None)
-                    and _OtelStatus is not None
-                    and _OtelStatusCode is not None
-                ):
-                    span.record_exception(exc)
-                    span.set_status(_OtelStatus(_OtelStatusCode.ERROR))
+                _record_error(span, exc)
                 raise
 
+    async def around_async(self, ctx: AdviceContext, call: Callable[[], Awaitable[Any]]) -> Any:
+        if _trace is None:
+            return await call()
+        # The span stays current across the await: OTel context lives in contextvars.
+        with _current_span(ctx) as span:
+            try:
+                result = await call()
+                _set_result_attributes(span, result)
+                return result
+            except Exception as exc:  # noqa: BLE001
+                _record_error(span, exc)
+                raise
+
+    def around_stream(self, ctx: AdviceContext, stream: Iterator[Any]) -> Iterator[Any]:
+        if _trace is None:
+            return stream
+        # One span for the whole stream, made current only while an item is produced.
+        span = _stream_span(ctx)
+        return _ending(span, bracket_stream(stream, partial(_trace.use_span, span)))
+
+    def around_astream(self, ctx: AdviceContext, stream: AsyncIterator[Any]) -> AsyncIterator[Any]:
+        if _trace is None:
+            return stream
+        span = _stream_span(ctx)
+        return _aending(span, abracket_stream(stream, partial(_trace.use_span, span)))
+
+    @noop_hook
     def after(self, ctx: AdviceContext, result: Any, error: Exception | None) -> None:
         return None
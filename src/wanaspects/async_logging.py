@@ -0,0 +1,217 @@
+"""Opt-in asynchronous log pipeline: a bounded queue drained by a listener thread."""
+
+from __future__ import annotations
+
+import copy
+import logging
+import queue
+import threading
+from collections.abc import Sequence
+from logging.handlers import QueueHandler, QueueListener
+from typing import Literal
+
+from .filters import RedactionFilter
+
+__all__ = [
+    "AsyncLogHandler",
+    "OverflowPolicy",
+    "disable_async_logging",
+    "enable_async_logging",
+]
+
+OverflowPolicy = Literal["drop_oldest", "drop_newest", "block"]
+_POLICIES: frozenset[str] = frozenset({"drop_oldest", "drop_newest", "block"})
+_DEFAULT_MAXSIZE = 10_000
+# QueueListener.stop() enqueues this marker; it must never be dropped.
+_SENTINEL: object = getattr(QueueListener, "_sentinel", None)
+_TRACEBACKS = logging.Formatter()
+
+
+class _Listener(QueueListener):
+    """QueueListener that also applies the moved logger-level filters."""
+
+    def __init__(
+        self,
+        log_queue: queue.Queue[logging.LogRecord],
+        handlers: Sequence[logging.Handler],
+        filters: Sequence[logging.Filter],
+    ) -> None:
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.filters = list(filters)
+
+    def handle(self, record: logging.LogRecord) -> None:
+        for log_filter in self.filters:
+            if not log_filter.filter(record):
+                return
+        super().handle(record)
+
+    def enqueue_sentinel(self) -> None:
+        # Block rather than fail when the queue is full: the listener is draining it.
+        self.queue.put(self._sentinel)  # type: ignore[attr-defined]
+
+
+class AsyncLogHandler(QueueHandler):
+    """Hand records to a bounded queue; a background thread formats and writes them.
+
+    The producing thread creates the ``LogRecord``, renders ``msg % args`` and
+    any traceback into it (as :class:`~logging.handlers.QueueHandler` does, so
+    later changes to the arguments do not show up in the record) and enqueues
+    it: redaction, formatting and the handlers' I/O run on the listener thread,
+    so slow disks or consoles no longer add to step latency. When the queue is
+    full, ``policy`` decides what happens:
+
+    - ``drop_oldest`` (default): discard the oldest queued record;
+    - ``drop_newest``: discard the incoming record;
+    - ``block``: wait for space (no loss, but back-pressure on the step).
+
+    Discarded records are counted in :attr:`dropped`. Install it with
+    :func:`enable_async_logging` rather than directly.
+    """
+
+    def __init__(
+        self, maxsize: int = _DEFAULT_MAXSIZE, policy: OverflowPolicy = "drop_oldest"
+    ) -> None:
+        if policy not in _POLICIES:
+            msg = f"policy must be one of {sorted(_POLICIES)}, got {policy!r}"
+            raise ValueError(msg)
+        if maxsize <= 0:
+            msg = f"maxsize must be positive, got {maxsize}"
+            raise ValueError(msg)
+        self.queue: queue.Queue[logging.LogRecord]
+        super().__init__(queue.Queue(maxsize))
+        self.policy = policy
+        self.dropped = 0
+        self._drop_lock = threading.Lock()
+        self._listener: _Listener | None = None
+
+    def _count_drop(self) -> None:
+        with self._drop_lock:
+            self.dropped += 1
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Freeze what may change or pin memory while the record is queued: the
+        # arguments (redacted by key first, since they are gone afterwards) and
+        # the traceback's frames. Formatting is left to the listener's handlers.
+        if not record.args and not record.exc_info:
+            return record
+        record = copy.copy(record)
+        if record.args:
+            listener = self._listener
+            if listener is not None:
+                for log_filter in listener.filters:
+                    if isinstance(log_filter, RedactionFilter):
+                        record.args = log_filter._redact_args(record.args)
+            record.msg = record.message = record.getMessage()
+            record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _TRACEBACKS.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        log_queue = self.queue
+        if self.policy == "block":
+            log_queue.put(record)
+            return
+        try:
+            log_queue.put_nowait(record)
+            return
+        except queue.Full:
+            if self.policy == "drop_newest":
+                self._count_drop()
+                return
+        while True:
+            try:
+                oldest = log_queue.get_nowait()
+                log_queue.task_done()
+            except queue.Empty:
+                pass
+            else:
+                if oldest is _SENTINEL:
+                    # The listener is stopping: hand the marker back and give up
+                    # on this record, which it would never write anyway.
+                    log_queue.put(oldest)
+                    self._count_drop()
+                    return
+                self._count_drop()
+            try:
+                log_queue.put_nowait(record)
+                return
+            except queue.Full:
+                continue
+
+    def start(self, handlers: Sequence[logging.Handler], filters: Sequence[logging.Filter]) -> None:
+        """Start the listener thread that feeds ``handlers``."""
+        if self._listener is not None:
+            return
+        self._listener = _Listener(self.queue, handlers, filters)
+        self._listener.start()
+
+    def stop(self) -> None:
+        """Drain the queue into the handlers and stop the listener thread."""
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.stop()
+
+    def _targets(self) -> tuple[list[logging.Handler], list[logging.Filter]]:
+        listener = self._listener
+        if listener is None:
+            return [], []
+        return list(listener.handlers), list(listener.filters)
+
+    def close(self) -> None:
+        # logging.shutdown() closes handlers newest first, so pending records
+        # are written before the wrapped handlers are closed.
+        self.stop()
+        super().close()
+
+
+def _installed(target: logging.Logger) -> AsyncLogHandler | None:
+    for handler in target.handlers:
+        if isinstance(handler, AsyncLogHandler):
+            return handler
+    return None
+
+
+def enable_async_logging(
+    logger: logging.Logger | None = None,
+    *,
+    maxsize: int = _DEFAULT_MAXSIZE,
+    policy: OverflowPolicy = "drop_oldest",
+) -> AsyncLogHandler:
+    """Move ``logger``'s handlers (default: root) behind an :class:`AsyncLogHandler`.
+
+    Its :class:`~wanaspects.filters.RedactionFilter` moves to the listener too,
+    so redaction also runs off the step's thread. Calling it again returns the
+    installed handler unchanged.
+    """
+    target = logging.getLogger() if logger is None else logger
+    existing = _installed(target)
+    if existing is not None:
+        return existing
+    handler = AsyncLogHandler(maxsize, policy)
+    handlers = list(target.handlers)
+    filters = [f for f in target.filters if isinstance(f, RedactionFilter)]
+    for moved in handlers:
+        target.removeHandler(moved)
+    for moved_filter in filters:
+        target.removeFilter(moved_filter)
+    handler.start(handlers, filters)
+    target.addHandler(handler)
+    return handler
+
+
+def disable_async_logging(logger: logging.Logger | None = None) -> None:
+    """Flush pending records and put the original handlers back on ``logger``."""
+    target = logging.getLogger() if logger is None else logger
+    handler = _installed(target)
+    if handler is None:
+        return
+    target.removeHandler(handler)
+    handlers, filters = handler._targets()
+    handler.close()
+    for restored in handlers:
+        target.addHandler(restored)
+    for restored_filter in filters:
+        target.addFilter(restored_filter)
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import hashlib
+import linecache
+from collections.abc import Callable, Iterable
+from functools import cache, partial
+from time import perf_counter_ns
+from types import CodeType
+from typing import Any
+
+from .core.aspect import Aspect
+from .core.chain import plan_hooks
+from .core.context import AdviceContext
+from .core.frame import _CURRENT_STATE, StepFrame, _push_frame
+from .manager import AspectManager
+
+
+def _generate_source(befores: int, arounds: int, afters: int) -> str:
+    """Emit a straight-line ``run(ctx, call)`` for the given hook counts.
+
+    Hooks are referenced as ``_b<i>``/``_r<i>``/``_a<i>`` globals bound to the
+    aspects' methods. The around chain is expressed as nested partials, e.g.
+    ``_r0(ctx, _p(_r1, ctx, call))``, so no Python-level trampoline frames run.
+    Like the other managers, the runner publishes one :class:`StepFrame` per
+    call and times the wrapped call once.
+    """
+    if befores == arounds == afters == 0:
+        return "def run(ctx, call):\n    return call()\n"
+
+    around = "call"
+    for i in reversed(range(1, arounds)):
+        around = f"_p(_r{i}, ctx, {around})"
+    invoke = f"_r0(ctx, {around})" if arounds else "call()"
+    lines = [
+        "def run(ctx, call):",
+        "    frame = _Frame(ctx)",
+        "    token = _push(frame)",
+        "    try:",
+    ]
+    lines.extend(f"        _b{i}(ctx)" for i in range(befores))
+    lines.append("        frame.start_ns = _now()")
+    lines.append("        try:")
+    lines.append(f"            result = {invoke}")
+    lines.append("        except Exception as error:")
+    lines.append("            frame.end_ns = _now()")
+    lines.append("            frame.error = error")
+    lines.extend(f"            _a{i}(ctx, None, error)" for i in range(afters))
+    lines.append("            raise")
+    lines.append("        frame.end_ns = _now()")
+    lines.extend(f"        _a{i}(ctx, result, None)" for i in range(afters))
+    lines.append("        return result")
+    lines.append("    finally:")
+    lines.append("        _reset(token)")
+    return "\n".join(lines) + "\n"
+
+
+@cache
+def _compile(source: str) -> tuple[str, CodeType]:
+    # The source only depends on the hook counts, so bundles of the same shape
+    # share one code object and one linecache entry.
+    digest = hashlib.sha1(source.encode(), usedforsecurity=False).hexdigest()[:12]
+    filename = f"<wanaspects-compiled-{digest}>"
+    return filename, compile(source, filename, "exec")
+
+
+def compile_runner(
+    aspects: tuple[Aspect, ...],
+) -> Callable[[AdviceContext, Callable[[], Any]], Any]:
+    """Generate and compile a specialised runner for a fixed tuple of aspects.
+
+    Only hooks that do real work are inlined; ``@noop_hook`` methods are skipped.
+    """
+
+    plan = plan_hooks(aspects)
+    source = _generate_source(len(plan.befores), len(plan.arounds), len(plan.afters))
+    namespace: dict[str, Any] = {
+        "_p": partial,
+        "_Frame": StepFrame,
+        "_push": _push_frame,
+        "_reset": _CURRENT_STATE.reset,
+        "_now": perf_counter_ns,
+    }
+    namespace.update((f"_b{i}", hook) for i, hook in enumerate(plan.befores))
+    namespace.update((f"_r{i}", hook) for i, hook in enumerate(plan.arounds))
+    namespace.update((f"_a{i}", hook) for i, hook in enumerate(plan.afters))
+    filename, code = _compile(source)
+    # Register the source so tracebacks through the runner show real lines.
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    exec(code, namespace)  # noqa: S102 - generated above
+    runner: Callable[[AdviceContext, Callable[[], Any]], Any] = namespace["run"]
+    return runner
+
+
+class CompiledAspectManager(AspectManager):
+    """AspectManager with a code-generated runner specialised to its bundle.
+
+    At construction the aspects' hooks are inlined, in order, into a flat
+    ``run(ctx, call)`` function: no loops, no ``reversed()``, and separate
+    success and error tails. The generated function is installed as the
+    instance's ``run`` so calls skip method binding entirely.
+
+    Semantics match :class:`OptimizedAspectManager`: ``after`` hooks receive
+    ``(None, exc)`` when the wrapped call (or any ``around``) raises.
+    """
+
+    def __init__(self, aspects: Iterable[Aspect] | None = None) -> None:
+        super().__init__(aspects)
+        self.run = compile_runner(self._aspects)  # type: ignore[assignment]
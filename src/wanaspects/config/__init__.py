@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import os
 import tomllib
+import warnings
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, get_args
+
+from ..aspects.logging import LogSink
 
 __all__ = ["Config", "load_config"]
 
@@ -32,6 +35,11 @@ class Config:
     log_rotation_when: str | None = None
     log_rotation_interval: int = 1
     log_rotation_utc: bool = False
+    version_packages: tuple[str, ...] = ("wanaspects",)
+    log_async: bool = False
+    log_queue_size: int = 10_000
+    log_queue_policy: str = "drop_oldest"  # drop_oldest|drop_newest|block
+    log_sink: LogSink = "stdlib"
 
 
 def _parse_bool(val: Any, default: bool = False) -> bool:
@@ -150,6 +158,30 @@ def load_config(pyproject_path: str | None = None) -> Config:  # noqa: PLR0915
         g("WANCHAIN_LOG_ROTATION_UTC", base.get("log_rotation_utc", False)),
         False,
     )
+    version_packages_raw = g(
+        "WANCHAIN_VERSION_PACKAGES", base.get("version_packages", ("wanaspects",))
+    )
+    if isinstance(version_packages_raw, str):
+        version_packages = tuple(x.strip() for x in version_packages_raw.split(",") if x.strip())
+    else:
+        version_packages = tuple(str(x).strip() for x in version_packages_raw if str(x).strip())
+    log_async = _parse_bool(g("WANCHAIN_LOG_ASYNC", base.get("log_async", False)))
+    log_queue_size = _to_int(g("WANCHAIN_LOG_QUEUE_SIZE", base.get("log_queue_size"))) or 10_000
+    log_queue_policy = str(
+        g("WANCHAIN_LOG_QUEUE_POLICY", base.get("log_queue_policy", "drop_oldest"))
+    ).lower()
+    log_sink_raw = str(g("WANCHAIN_LOG_SINK", base.get("log_sink", "stdlib"))).lower()
+    log_sink: LogSink = "stdlib"
+    for sink in get_args(LogSink):
+        if sink == log_sink_raw:
+            log_sink = sink
+            break
+    else:
+        warnings.warn(
+            f"unknown log_sink {log_sink_raw!r}, using 'stdlib'",
+            RuntimeWarning,
+            stacklevel=2,
+        )
 
     return Config(
         enabled=enabled,
@@ -174,4 +206,9 @@ def load_config(pyproject_path: str | None = None) -> Config:  # noqa: PLR0915
         log_rotation_when=str(log_rotation_when) if log_rotation_when is not None else None,
         log_rotation_interval=interval,
         log_rotation_utc=log_rotation_utc,
+        version_packages=version_packages,
+        log_async=log_async,
+        log_queue_size=log_queue_size,
+        log_queue_policy=log_queue_policy,
+        log_sink=log_sink,
     )
@@ -1,37 +1,46 @@
 from __future__ import annotations
 
-import contextvars
-
 from .core.context import AdviceContext
-
-_CURRENT_CONTEXT: contextvars.ContextVar[AdviceContext | None] = contextvars.ContextVar(
-    "wanaspects_current_context", default=None
-)
-_CURRENT_TOKEN: contextvars.ContextVar[contextvars.Token[AdviceContext | None] | None] = (
-    contextvars.ContextVar("wanaspects_current_context_token", default=None)
-)
+from .core.frame import _CURRENT_STATE, StepState
 
 
 def set_current_context(ctx: AdviceContext) -> None:
-    """Make ``ctx`` available to downstream helpers via contextvars."""
+    """Make ``ctx`` available to downstream helpers via contextvars.
 
-    token = _CURRENT_CONTEXT.set(ctx)
-    _CURRENT_TOKEN.set(token)
+    Pushes a new ambient state on top of the current one (inside a managed
+    step it keeps that step's frame); the matching :func:`reset_current_context`
+    pops it.
+    """
+
+    parent = _CURRENT_STATE.get()
+    if parent is None:
+        _CURRENT_STATE.set(StepState(None, ctx, False, None))
+    else:
+        _CURRENT_STATE.set(StepState(parent.frame, ctx, parent.allow_materialize, parent))
 
 
 def reset_current_context() -> None:
-    """Reset the current AdviceContext when the step finishes."""
+    """Reset the current AdviceContext when the step finishes.
+
+    Pops a state pushed by :func:`set_current_context`; at a managed step's own
+    level it restores the enclosing step's context instead.
+    """
 
-    token = _CURRENT_TOKEN.get()
-    if token is not None:
-        _CURRENT_CONTEXT.reset(token)
-    _CURRENT_TOKEN.set(None)
+    state = _CURRENT_STATE.get()
+    if state is None:
+        return
+    parent = state.parent
+    if state.frame is (None if parent is None else parent.frame):
+        _CURRENT_STATE.set(parent)
+    else:
+        _CURRENT_STATE.set(state._replace(context=None if parent is None else parent.context))
 
 
 def current_context() -> AdviceContext | None:
     """Return the AdviceContext for the active step, if any."""
 
-    return _CURRENT_CONTEXT.get()
+    state = _CURRENT_STATE.get()
+    return None if state is None else state.context
 
 
 __all__ = ["current_context", "set_current_context", "reset_current_context"]
@@ -1,5 +1,7 @@
 # Subpackage marker for core components
 
+from .batch import BatchResult
 from .context import AdviceContext, Boundary, ContainerShape
+from .factory import ContextFactory
 
-__all__ = ["AdviceContext", "Boundary", "ContainerShape"]
+__all__ = ["AdviceContext", "BatchResult", "Boundary", "ContainerShape", "ContextFactory"]
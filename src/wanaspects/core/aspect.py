@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
 from typing import Any, Protocol, TypeVar
 
 from .context import AdviceContext
 
 T = TypeVar("T")
+F = TypeVar("F", bound=Callable[..., Any])
+
+_NOOP_MARKER = "__wanaspects_noop__"
 
 
 class Aspect(Protocol):
@@ -19,3 +22,55 @@ class Aspect(Protocol):
         self, ctx: AdviceContext, result: Any, error: Exception | None
     ) -> None:  # pragma: no cover
         ...
+
+
+class AsyncAspect(Aspect, Protocol):
+    """Aspect whose ``around`` also has a native coroutine variant.
+
+    ``AspectManager.run_async`` awaits ``around_async`` so timers, spans and
+    contextvars cover the awaited body. Aspects without it fall back to their
+    synchronous ``around``, which then only wraps coroutine creation.
+    """
+
+    async def around_async(
+        self, ctx: AdviceContext, call: Callable[[], Awaitable[T]]
+    ) -> T:  # pragma: no cover - interface only
+        ...
+
+
+class StreamingAspect(Aspect, Protocol):
+    """Aspect that keeps its state active for the lifetime of a streamed step.
+
+    ``AspectManager.run_stream``/``run_astream`` pass the step's (async)
+    iterator through these hooks, which return a wrapping iterator. Aspects
+    without them only bracket creation of the iterator with ``around``.
+    """
+
+    def around_stream(
+        self, ctx: AdviceContext, stream: Iterator[T]
+    ) -> Iterator[T]:  # pragma: no cover - interface only
+        ...
+
+    def around_astream(
+        self, ctx: AdviceContext, stream: AsyncIterator[T]
+    ) -> AsyncIterator[T]:  # pragma: no cover - interface only
+        ...
+
+
+def noop_hook(fn: F) -> F:
+    """Declare an aspect hook as a no-op so managers leave it out of dispatch.
+
+    A no-op ``around`` must simply ``return call()``. Subclasses that override
+    the hook with real behaviour are dispatched normally.
+    """
+    setattr(fn, _NOOP_MARKER, True)
+    return fn
+
+
+def implements_hook(aspect: object, name: str) -> bool:
+    """Return True when ``aspect`` has a ``name`` hook that does real work."""
+    hook = getattr(aspect, name, None)
+    return hook is not None and not getattr(hook, _NOOP_MARKER, False)
+
+
+__all__ = ["Aspect", "AsyncAspect", "StreamingAspect", "implements_hook", "noop_hook"]
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
+__all__ = ["BatchResult", "run_batch"]
+
+
+class BatchResult(list[Any]):
+    """Results of a ``run_many`` batch, one entry per input item.
+
+    A plain list to callers; aspects recognise it in ``after`` to report item
+    counts. With per-item error accounting, failed items hold ``None`` and
+    their exceptions are kept in :attr:`errors` as ``(index, exc)`` pairs.
+    """
+
+    __slots__ = ("errors",)
+
+    def __init__(self, results: Iterable[Any] = ()) -> None:
+        super().__init__(results)
+        self.errors: list[tuple[int, Exception]] = []
+
+    @property
+    def items(self) -> int:
+        return len(self)
+
+    @property
+    def failed(self) -> int:
+        return len(self.errors)
+
+
+def run_batch(
+    fn: Callable[[Any], Any], items: Iterable[Any], collect_errors: bool = False
+) -> BatchResult:
+    """Apply ``fn`` to every item; the body executed inside a single step."""
+
+    if not collect_errors:
+        return BatchResult(map(fn, items))
+    results = BatchResult()
+    append = results.append
+    errors = results.errors
+    for index, item in enumerate(items):
+        try:
+            append(fn(item))
+        except Exception as exc:  # noqa: BLE001 - accounted per item
+            errors.append((index, exc))
+            append(None)
+    return results
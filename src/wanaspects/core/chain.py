@@ -0,0 +1,132 @@
+"""Hook dispatch planning and around-chain compilation shared by the managers."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Sequence
+from functools import partial
+from typing import Any, NamedTuple
+
+from .aspect import Aspect, implements_hook
+from .context import AdviceContext
+from .stream import AsyncStreamWrapper, StreamWrapper
+
+AroundChain = Callable[[AdviceContext, Callable[[], Any]], Any]
+AsyncAroundChain = Callable[[AdviceContext, Callable[[], Awaitable[Any]]], Awaitable[Any]]
+BeforeHook = Callable[[AdviceContext], None]
+AfterHook = Callable[[AdviceContext, Any, "Exception | None"], None]
+
+__all__ = [
+    "AroundChain",
+    "AsyncAroundChain",
+    "HookPlan",
+    "compile_around",
+    "compile_around_async",
+    "plan_hooks",
+]
+
+
+class HookPlan(NamedTuple):
+    """Per-phase dispatch tuples holding only the hooks that do real work."""
+
+    befores: tuple[BeforeHook, ...]
+    arounds: tuple[AroundChain, ...]
+    afters: tuple[AfterHook, ...]
+    arounds_async: tuple[AsyncAroundChain, ...]
+    # Streaming steps: aspects with ``around_stream``/``around_astream`` wrap the
+    # iteration; the plain ``around`` of the others only brackets creation.
+    streams: tuple[StreamWrapper, ...]
+    stream_arounds: tuple[AroundChain, ...]
+    astreams: tuple[AsyncStreamWrapper, ...]
+    astream_arounds: tuple[AroundChain, ...]
+
+
+def _adapt_sync_around(around: AroundChain) -> AsyncAroundChain:
+    # A synchronous around can only bracket coroutine creation; await outside it.
+    async def _around_async(ctx: AdviceContext, call: Callable[[], Awaitable[Any]]) -> Any:
+        return await around(ctx, call)
+
+    return _around_async
+
+
+def _async_around_of(aspect: Aspect) -> AsyncAroundChain | None:
+    if implements_hook(aspect, "around_async"):
+        hook: AsyncAroundChain = aspect.around_async  # type: ignore[attr-defined]
+        return hook
+    if implements_hook(aspect, "around"):
+        return _adapt_sync_around(aspect.around)
+    return None
+
+
+def plan_hooks(aspects: Sequence[Aspect]) -> HookPlan:
+    """Collect the bound hooks of ``aspects``, skipping those marked ``@noop_hook``."""
+    arounds_async = (_async_around_of(a) for a in aspects)
+    arounds = [a for a in aspects if implements_hook(a, "around")]
+    return HookPlan(
+        befores=tuple(a.before for a in aspects if implements_hook(a, "before")),
+        arounds=tuple(a.around for a in arounds),
+        afters=tuple(a.after for a in aspects if implements_hook(a, "after")),
+        arounds_async=tuple(h for h in arounds_async if h is not None),
+        streams=tuple(
+            a.around_stream  # type: ignore[attr-defined]
+            for a in aspects
+            if implements_hook(a, "around_stream")
+        ),
+        stream_arounds=tuple(a.around for a in arounds if not implements_hook(a, "around_stream")),
+        astreams=tuple(
+            a.around_astream  # type: ignore[attr-defined]
+            for a in aspects
+            if implements_hook(a, "around_astream")
+        ),
+        astream_arounds=tuple(
+            a.around for a in arounds if not implements_hook(a, "around_astream")
+        ),
+    )
+
+
+def _call_only(ctx: AdviceContext, call: Callable[[], Any]) -> Any:
+    return call()
+
+
+def _link(around: AroundChain, inner: AroundChain) -> AroundChain:
+    def _chain(ctx: AdviceContext, call: Callable[[], Any]) -> Any:
+        return around(ctx, partial(inner, ctx, call))
+
+    return _chain
+
+
+def compile_around(arounds: Sequence[AroundChain]) -> AroundChain:
+    """Fold ``around`` hooks into one reusable ``chain(ctx, call)``.
+
+    The first hook is outermost, matching the managers' historical ordering.
+    The chain is built once, at manager construction: ``ctx`` and ``call`` are
+    arguments rather than captured variables, so a step invocation allocates
+    only one ``functools.partial`` thunk per outer level (the innermost hook
+    receives ``call`` unchanged) instead of rebuilding N closures.
+    """
+    if not arounds:
+        return _call_only
+    chain: AroundChain = arounds[-1]
+    for around in reversed(arounds[:-1]):
+        chain = _link(around, chain)
+    return chain
+
+
+async def _await_only(ctx: AdviceContext, call: Callable[[], Awaitable[Any]]) -> Any:
+    return await call()
+
+
+def _link_async(around: AsyncAroundChain, inner: AsyncAroundChain) -> AsyncAroundChain:
+    async def _chain(ctx: AdviceContext, call: Callable[[], Awaitable[Any]]) -> Any:
+        return await around(ctx, partial(inner, ctx, call))
+
+    return _chain
+
+
+def compile_around_async(arounds: Sequence[AsyncAroundChain]) -> AsyncAroundChain:
+    """Coroutine counterpart of :func:`compile_around` for ``around_async`` hooks."""
+    if not arounds:
+        return _await_only
+    chain: AsyncAroundChain = arounds[-1]
+    for around in reversed(arounds[:-1]):
+        chain = _link_async(around, chain)
+    return chain
@@ -1,14 +1,26 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Literal
+from typing import Any, Literal
 
 ContainerShape = Literal["single", "batch", "workflow"]
 Boundary = Literal["none", "geo", "io"]
 
 
+class _ViewCache:
+    """Holds :class:`AdviceContext`'s derived views outside its dataclass fields.
+
+    The slot is not a field, so ``fields()``, ``asdict()``, ``replace()``,
+    equality, hashing and pickling ignore it; it is filled on first use.
+    """
+
+    __slots__ = ("_views",)
+
+    _views: dict[Any, Any]
+
+
 @dataclass(frozen=True, slots=True)
-class AdviceContext:
+class AdviceContext(_ViewCache):
     step_name: str
     container_shape: ContainerShape
     boundary: Boundary = "none"
@@ -18,3 +30,129 @@ class AdviceContext:
     span_id: str | None = None
     config_hash: str | None = None
     package_versions: dict[str, str] = field(default_factory=dict)
+
+    def child(
+        self,
+        step_name: str,
+        container_shape: ContainerShape | None = None,
+        boundary: Boundary | None = None,
+    ) -> AdviceContext:
+        """Derive the context of a nested step.
+
+        Run, tenant, trace and version fields are inherited by reference (the
+        ``package_versions`` dict is shared, not copied); shape and boundary
+        default to the parent's.
+        """
+        return AdviceContext(
+            step_name,
+            self.container_shape if container_shape is None else container_shape,
+            self.boundary if boundary is None else boundary,
+            self.run_id,
+            self.tenant,
+            self.trace_id,
+            self.span_id,
+            self.config_hash,
+            self.package_versions,
+        )
+
+    def with_trace(self, trace_id: str | None, span_id: str | None = None) -> AdviceContext:
+        """Return a copy correlated with ``trace_id``/``span_id``."""
+        if trace_id == self.trace_id and span_id == self.span_id:
+            return self
+        return AdviceContext(
+            self.step_name,
+            self.container_shape,
+            self.boundary,
+            self.run_id,
+            self.tenant,
+            trace_id,
+            span_id,
+            self.config_hash,
+            self.package_versions,
+        )
+
+    def _cache(self) -> dict[Any, Any]:
+        try:
+            return self._views
+        except AttributeError:
+            views: dict[Any, Any] = {}
+            object.__setattr__(self, "_views", views)
+            return views
+
+    @property
+    def log_fields(self) -> dict[str, Any]:
+        """Correlation fields for log records, computed once per context.
+
+        The dict is shared by every caller: copy it before adding keys.
+        """
+        views = self._cache()
+        data = views.get("log")
+        if data is None:
+            data = {
+                "step": self.step_name,
+                "shape": self.container_shape,
+                "boundary": self.boundary,
+            }
+            if self.run_id is not None:
+                data["run_id"] = self.run_id
+            if self.tenant is not None:
+                data["tenant"] = self.tenant
+            if self.trace_id is not None:
+                data["trace_id"] = self.trace_id
+            if self.span_id is not None:
+                data["span_id"] = self.span_id
+            if self.config_hash is not None:
+                data["config_hash"] = self.config_hash
+            if self.package_versions:
+                data["versions"] = self.package_versions
+            views["log"] = data
+        return data
+
+    @property
+    def span_attributes(self) -> dict[str, Any]:
+        """``wanchain.*`` span attributes, computed once per context (read-only)."""
+        views = self._cache()
+        attrs = views.get("span")
+        if attrs is None:
+            attrs = {
+                "wanchain.step.name": self.step_name,
+                "wanchain.container.shape": self.container_shape,
+                "wanchain.boundary": self.boundary,
+            }
+            if self.run_id is not None:
+                attrs["wanchain.run.id"] = self.run_id
+            if self.tenant is not None:
+                attrs["wanchain.tenant"] = self.tenant
+            if self.package_versions:
+                # Store as a string to keep attribute scalar
+                attrs["wanchain.versions"] = str(self.package_versions)
+            views["span"] = attrs
+        return attrs
+
+    def metric_attributes(self, status: str) -> dict[str, str]:
+        """Low-cardinality metric attributes for ``status`` (read-only, cached)."""
+        views = self._cache()
+        key = ("metric", status)
+        attrs = views.get(key)
+        if attrs is None:
+            attrs = views[key] = {
+                "step": self.step_name,
+                "shape": self.container_shape,
+                "boundary": self.boundary,
+                "status": status,
+            }
+        return attrs
+
+    def error_metric_attributes(self, error_kind: str) -> dict[str, str]:
+        """Metric attributes for an error counter (read-only, cached per kind)."""
+        views = self._cache()
+        key = ("error", error_kind)
+        attrs = views.get(key)
+        if attrs is None:
+            attrs = views[key] = {
+                "step": self.step_name,
+                "shape": self.container_shape,
+                "boundary": self.boundary,
+                "error_kind": error_kind,
+            }
+        return attrs
@@ -0,0 +1,150 @@
+"""Interning factory for :class:`AdviceContext` values."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from .context import AdviceContext, Boundary, ContainerShape
+
+__all__ = ["ContextFactory"]
+
+_DEFAULT_MAXSIZE = 4096
+
+VersionsKey = tuple[tuple[str, str], ...]
+VersionsSource = Mapping[str, str] | Callable[[], Mapping[str, str]] | None
+HashSource = str | Callable[[], str | None] | None
+
+
+class ContextFactory:
+    """Build :class:`AdviceContext` objects, reusing one instance per distinct value.
+
+    Workflow code tends to create a context per item with the same run, tenant
+    and version information. The factory hands back the same frozen instance
+    for equal values, so long batch runs keep one object (and one set of the
+    cached log/span/metric views) per distinct step instead of one per item.
+    Equal ``package_versions`` mappings are interned as well and shared by
+    every context the factory creates.
+
+    The intern table holds at most ``maxsize`` contexts; when it fills up it is
+    cleared, which bounds memory for unbounded key spaces (e.g. one ``run_id``
+    per request) at the cost of re-creating contexts afterwards.
+
+    ``package_versions`` and ``config_hash`` are stamped onto every context
+    that does not pass its own. Either may be a zero-argument callable, which
+    is resolved once, on the first :meth:`create`
+    (see :func:`wanaspects.provenance.default_context_factory`).
+    """
+
+    def __init__(
+        self,
+        maxsize: int = _DEFAULT_MAXSIZE,
+        *,
+        package_versions: VersionsSource = None,
+        config_hash: HashSource = None,
+    ) -> None:
+        if maxsize <= 0:
+            msg = f"maxsize must be positive, got {maxsize}"
+            raise ValueError(msg)
+        self._maxsize = maxsize
+        self._contexts: dict[tuple[Any, ...], AdviceContext] = {}
+        self._versions: dict[VersionsKey, dict[str, str]] = {}
+        self._default_sources: tuple[VersionsSource, HashSource] | None = (
+            package_versions,
+            config_hash,
+        )
+        self._default_versions: Mapping[str, str] | None = None
+        self._default_hash: str | None = None
+
+    def _resolve_defaults(self) -> None:
+        sources = self._default_sources
+        if sources is None:
+            return
+        versions, config_hash = sources
+        self._default_versions = versions() if callable(versions) else versions
+        self._default_hash = config_hash() if callable(config_hash) else config_hash
+        self._default_sources = None
+
+    def __len__(self) -> int:
+        return len(self._contexts)
+
+    def _intern_versions(self, versions: Mapping[str, str] | None) -> tuple[VersionsKey, Any]:
+        if not versions:
+            return (), None
+        key = tuple(sorted(versions.items()))
+        shared = self._versions.get(key)
+        if shared is None:
+            shared = self._versions[key] = dict(versions)
+        return key, shared
+
+    def create(  # noqa: PLR0913
+        self,
+        step_name: str,
+        container_shape: ContainerShape = "single",
+        boundary: Boundary = "none",
+        *,
+        run_id: str | None = None,
+        tenant: str | None = None,
+        trace_id: str | None = None,
+        span_id: str | None = None,
+        config_hash: str | None = None,
+        package_versions: Mapping[str, str] | None = None,
+    ) -> AdviceContext:
+        """Return the interned context for these field values.
+
+        ``config_hash`` and ``package_versions`` fall back to the factory's
+        defaults when omitted.
+        """
+        if self._default_sources is not None:
+            self._resolve_defaults()
+        if config_hash is None:
+            config_hash = self._default_hash
+        if package_versions is None:
+            package_versions = self._default_versions
+        versions_key, versions = self._intern_versions(package_versions)
+        key = (
+            step_name,
+            container_shape,
+            boundary,
+            run_id,
+            tenant,
+            trace_id,
+            span_id,
+            config_hash,
+            versions_key,
+        )
+        ctx = self._contexts.get(key)
+        if ctx is None:
+            ctx = AdviceContext(
+                step_name,
+                container_shape,
+                boundary,
+                run_id,
+                tenant,
+                trace_id,
+                span_id,
+                config_hash,
+                {} if versions is None else versions,
+            )
+            if len(self._contexts) >= self._maxsize:
+                self._contexts.clear()
+            self._contexts[key] = ctx
+        return ctx
+
+    def intern(self, ctx: AdviceContext) -> AdviceContext:
+        """Return the canonical instance equal to ``ctx`` (e.g. after ``ctx.child()``)."""
+        return self.create(
+            ctx.step_name,
+            ctx.container_shape,
+            ctx.boundary,
+            run_id=ctx.run_id,
+            tenant=ctx.tenant,
+            trace_id=ctx.trace_id,
+            span_id=ctx.span_id,
+            config_hash=ctx.config_hash,
+            package_versions=ctx.package_versions,
+        )
+
+    def clear(self) -> None:
+        self._contexts.clear()
+        self._versions.clear()
@@ -0,0 +1,129 @@
+"""Per-invocation state shared by the aspects of one step."""
+
+from __future__ import annotations
+
+import contextvars
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, NamedTuple
+
+from .context import AdviceContext
+
+__all__ = ["StepFrame", "StepState", "current_frame", "current_state"]
+
+
+class StepFrame:
+    """Timing record for a single step invocation.
+
+    The manager allocates one frame per call, times the wrapped call once
+    (``perf_counter_ns`` start/stop) and records the error, so aspects no longer
+    each run their own timer and hand results from ``around`` to ``after``
+    through ContextVars. ``scratch`` is a lazily created dict aspects may use to
+    pass their own state between hooks; key it by something unique to the
+    aspect (e.g. ``id(self)``) when several instances may share a frame.
+
+    The frame belongs to the call that created it and is only written by that
+    call's manager and hooks. What code running *inside* the step observes (its
+    context, the materialization permission) is the immutable
+    :class:`StepState` that points at the frame.
+    """
+
+    __slots__ = ("ctx", "start_ns", "end_ns", "error", "_scratch")
+
+    def __init__(self, ctx: AdviceContext) -> None:
+        self.ctx = ctx
+        self.start_ns = 0
+        self.end_ns = 0
+        self.error: Exception | None = None
+        self._scratch: dict[Any, Any] | None = None
+
+    @property
+    def scratch(self) -> dict[Any, Any]:
+        if self._scratch is None:
+            self._scratch = {}
+        return self._scratch
+
+    @property
+    def duration_ns(self) -> int | None:
+        if not self.end_ns:
+            return None
+        return self.end_ns - self.start_ns
+
+    @property
+    def duration_ms(self) -> float | None:
+        if not self.end_ns:
+            return None
+        return (self.end_ns - self.start_ns) / 1_000_000
+
+    @property
+    def duration_seconds(self) -> float | None:
+        if not self.end_ns:
+            return None
+        return (self.end_ns - self.start_ns) / 1_000_000_000
+
+
+class StepState(NamedTuple):
+    """Immutable ambient state of the innermost step, held in one ContextVar.
+
+    A managed step enters with one ``set`` of a state inheriting ``context`` and
+    ``allow_materialize`` from the enclosing state (``parent``) and leaves with
+    one ``reset``. Aspects that publish a context or grant materialization set
+    a *new* state instead of editing this one; the step's reset unwinds those
+    too. A copied context (``copy_context()``, thread pools) therefore keeps the
+    state it captured, whatever the submitting step does afterwards.
+
+    ``frame`` is the managed call's :class:`StepFrame`; states pushed by
+    :func:`~wanaspects.context.set_current_context` share their parent's frame.
+    """
+
+    frame: StepFrame | None
+    context: AdviceContext | None
+    allow_materialize: bool
+    parent: StepState | None
+
+
+_CURRENT_STATE: contextvars.ContextVar[StepState | None] = contextvars.ContextVar(
+    "wanaspects_step_state", default=None
+)
+
+
+def current_state() -> StepState | None:
+    """Return the ambient state of the innermost running step, if any."""
+
+    return _CURRENT_STATE.get()
+
+
+def current_frame() -> StepFrame | None:
+    """Return the frame of the innermost running step, if any."""
+
+    state = _CURRENT_STATE.get()
+    return None if state is None else state.frame
+
+
+def _push_frame(frame: StepFrame) -> contextvars.Token[StepState | None]:
+    # Enter a managed step: one state, inheriting from the enclosing one.
+    parent = _CURRENT_STATE.get()
+    if parent is None:
+        return _CURRENT_STATE.set(StepState(frame, None, False, None))
+    return _CURRENT_STATE.set(StepState(frame, parent.context, parent.allow_materialize, parent))
+
+
+def _owned_state(ctx: AdviceContext) -> tuple[StepState, StepFrame] | None:
+    # The current state and frame when they belong to the managed step running ``ctx``.
+    state = _CURRENT_STATE.get()
+    if state is None:
+        return None
+    frame = state.frame
+    if frame is None or frame.ctx is not ctx:
+        return None
+    return state, frame
+
+
+@contextmanager
+def _entered(state: StepState) -> Iterator[None]:
+    # Make ``state`` current again, e.g. for each item of a streamed step.
+    token = _CURRENT_STATE.set(state)
+    try:
+        yield
+    finally:
+        _CURRENT_STATE.reset(token)
@@ -0,0 +1,204 @@
+"""Streaming-step support: keep hooks active until a generator is exhausted."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import AbstractContextManager
+from functools import partial
+from typing import Any, TypeVar, cast
+
+from .context import AdviceContext
+from .frame import _CURRENT_STATE, StepFrame, StepState, _entered, _push_frame
+
+T = TypeVar("T")
+
+StreamWrapper = Callable[[AdviceContext, Iterator[Any]], Iterator[Any]]
+AsyncStreamWrapper = Callable[[AdviceContext, AsyncIterator[Any]], AsyncIterator[Any]]
+StreamOpener = Callable[[], Any]
+
+__all__ = [
+    "AsyncStreamWrapper",
+    "StreamResult",
+    "StreamWrapper",
+    "abracket_stream",
+    "astream_step",
+    "bracket_stream",
+    "stream_step",
+]
+
+
+class StreamResult:
+    """Summary of a streamed step, handed to ``after`` hooks as ``result``.
+
+    Durations cover the whole stream, from the first ``next()`` until it is
+    exhausted, fails or is closed by the consumer.
+    """
+
+    __slots__ = ("items", "first_item_ms", "duration_ms")
+
+    def __init__(self) -> None:
+        self.items = 0
+        self.first_item_ms: float | None = None
+        self.duration_ms: float = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"StreamResult(items={self.items}, first_item_ms={self.first_item_ms}, "
+            f"duration_ms={self.duration_ms})"
+        )
+
+
+def bracket_stream(
+    stream: Iterator[T], bracket: Callable[[], AbstractContextManager[Any]]
+) -> Iterator[T]:
+    """Yield from ``stream`` with ``bracket()`` entered around every ``next()``.
+
+    Generators run in their consumer's context, so per-step state (a current
+    span, the materialization permission) must be re-entered for each item
+    rather than held across ``yield``. Closing the wrapper closes ``stream``
+    inside the bracket too.
+    """
+    try:
+        while True:
+            with bracket():
+                try:
+                    item = next(stream)
+                except StopIteration:
+                    return
+            yield item
+    finally:
+        close = getattr(stream, "close", None)
+        if close is not None:
+            with bracket():
+                close()
+
+
+async def abracket_stream(
+    stream: AsyncIterator[T], bracket: Callable[[], AbstractContextManager[Any]]
+) -> AsyncIterator[T]:
+    """Async counterpart of :func:`bracket_stream`."""
+    try:
+        while True:
+            with bracket():
+                try:
+                    item = await stream.__anext__()
+                except StopAsyncIteration:
+                    return
+            yield item
+    finally:
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            with bracket():
+                await aclose()
+
+
+def _opened(create: Callable[[], Iterator[T]]) -> Iterator[T]:
+    # Defer creation to the first next() so it happens inside every wrapper.
+    yield from create()
+
+
+async def _aopened(create: Callable[[], AsyncIterator[T]]) -> AsyncIterator[T]:
+    stream = create()
+    try:
+        async for item in stream:
+            yield item
+    finally:
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def stream_step(  # noqa: PLR0913
+    befores: tuple[Callable[[AdviceContext], None], ...],
+    create: Callable[[AdviceContext, StreamOpener], Any],
+    wrappers: tuple[StreamWrapper, ...],
+    afters: tuple[Callable[[AdviceContext, Any, Exception | None], None], ...],
+    ctx: AdviceContext,
+    open_stream: StreamOpener,
+) -> Iterator[Any]:
+    """Run one streamed step; ``after`` hooks fire when the stream ends.
+
+    This is a generator, so ``before`` hooks only run on the first ``next()``.
+    ``create`` is the around chain of aspects without stream support and only
+    brackets creation of the underlying iterator.
+    """
+    frame = StepFrame(ctx)
+    token = _push_frame(frame)
+    try:
+        for before in befores:
+            before(ctx)
+        # The state as the befores left it (context published, permission set).
+        state = cast(StepState, _CURRENT_STATE.get())
+    finally:
+        _CURRENT_STATE.reset(token)
+    stats = StreamResult()
+    start = time.perf_counter()
+    # The state is re-entered for each item: the producer sees the step's context
+    # and materialization permission, the consumer never does.
+    stream: Iterator[Any] = bracket_stream(
+        _opened(lambda: create(ctx, open_stream)), partial(_entered, state)
+    )
+    for wrap in reversed(wrappers):
+        stream = wrap(ctx, stream)
+    try:
+        for item in stream:
+            if stats.first_item_ms is None:
+                stats.first_item_ms = (time.perf_counter() - start) * 1000.0
+            stats.items += 1
+            yield item
+    except Exception as exc:  # noqa: BLE001 - bubble after after()
+        frame.error = exc
+        raise
+    finally:
+        close = getattr(stream, "close", None)
+        if close is not None:
+            close()
+        stats.duration_ms = (time.perf_counter() - start) * 1000.0
+        with _entered(state):
+            for after in afters:
+                after(ctx, stats, frame.error)
+
+
+async def astream_step(  # noqa: PLR0913
+    befores: tuple[Callable[[AdviceContext], None], ...],
+    create: Callable[[AdviceContext, StreamOpener], Any],
+    wrappers: tuple[AsyncStreamWrapper, ...],
+    afters: tuple[Callable[[AdviceContext, Any, Exception | None], None], ...],
+    ctx: AdviceContext,
+    open_stream: StreamOpener,
+) -> AsyncIterator[Any]:
+    """Async counterpart of :func:`stream_step` for async generators."""
+    frame = StepFrame(ctx)
+    token = _push_frame(frame)
+    try:
+        for before in befores:
+            before(ctx)
+        # The state as the befores left it (context published, permission set).
+        state = cast(StepState, _CURRENT_STATE.get())
+    finally:
+        _CURRENT_STATE.reset(token)
+    stats = StreamResult()
+    start = time.perf_counter()
+    stream: AsyncIterator[Any] = abracket_stream(
+        _aopened(lambda: create(ctx, open_stream)), partial(_entered, state)
+    )
+    for wrap in reversed(wrappers):
+        stream = wrap(ctx, stream)
+    try:
+        async for item in stream:
+            if stats.first_item_ms is None:
+                stats.first_item_ms = (time.perf_counter() - start) * 1000.0
+            stats.items += 1
+            yield item
+    except Exception as exc:  # noqa: BLE001 - bubble after after()
+        frame.error = exc
+        raise
+    finally:
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+        stats.duration_ms = (time.perf_counter() - start) * 1000.0
+        with _entered(state):
+            for after in afters:
+                after(ctx, stats, frame.error)
@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 
 from .config import load_config
+from .provenance import config_hash, package_versions
 
 
 def diag() -> None:
@@ -21,6 +22,9 @@ def diag() -> None:
         "<none>" if cfg.dev_peek_max_rows is None else cfg.dev_peek_max_rows,
     )
     print("boundary_allow:", ",".join(cfg.boundary_allow))
+    print("config_hash:", config_hash(cfg))
+    versions = package_versions(cfg.version_packages)
+    print("package_versions:", ",".join(f"{k}={v}" for k, v in versions.items()) or "<none>")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,65 @@
+"""``concurrent.futures`` executors that keep step context in their workers."""
+
+from __future__ import annotations
+
+import contextvars
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from .propagation import Payload, _capture_payload, _restored
+
+T = TypeVar("T")
+
+__all__ = ["AspectProcessPoolExecutor", "AspectThreadPoolExecutor", "wrap_submit"]
+
+
+def wrap_submit(submit: Callable[..., Future[T]]) -> Callable[..., Future[T]]:
+    """Wrap any thread-based ``submit`` so tasks run in a copy of the caller's context.
+
+    The copy carries the current step (``current_context()``, the
+    materialization permission) and the active OTel span, which also lives in
+    contextvars. Both are immutable snapshots, so a task still sees them after
+    the submitting step has returned. Copying is one ``copy_context()`` per task.
+
+    Example:
+        submit = wrap_submit(pool.submit)
+        futures = [submit(load_tile, tile) for tile in tiles]
+    """
+
+    def submit_in_context(fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+        return submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+    return submit_in_context
+
+
+class AspectThreadPoolExecutor(ThreadPoolExecutor):
+    """ThreadPoolExecutor whose tasks see the submitting step's context and span.
+
+    ``map`` goes through :meth:`submit`, so it is covered as well.
+    """
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+        return super().submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+def _run_restored(
+    payload: Payload, fn: Callable[..., T], args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> T:
+    with _restored(payload):
+        return fn(*args, **kwargs)
+
+
+class AspectProcessPoolExecutor(ProcessPoolExecutor):
+    """ProcessPoolExecutor that re-establishes the submitting step in the worker.
+
+    contextvars cannot cross a process boundary, so each task carries a small
+    picklable snapshot: an :func:`~wanaspects.propagation.inject` carrier (W3C
+    ``traceparent``/``tracestate`` and the run identity), the ``AdviceContext``
+    fields and the materialization permission. The worker restores them around
+    the call, so ``current_context()`` works and spans it starts join the
+    submitter's trace.
+    """
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+        return super().submit(_run_restored, _capture_payload(), fn, args, kwargs)
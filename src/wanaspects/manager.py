@@ -1,34 +1,259 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
-from functools import reduce
-from typing import Any
+import functools
+import inspect
+import itertools
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from dataclasses import replace
+from time import perf_counter_ns
+from typing import Any, TypeVar, cast
 
+from .context import current_context
 from .core.aspect import Aspect
-from .core.context import AdviceContext
+from .core.batch import BatchResult, run_batch
+from .core.chain import (
+    AfterHook,
+    AroundChain,
+    AsyncAroundChain,
+    BeforeHook,
+    compile_around,
+    compile_around_async,
+    plan_hooks,
+)
+from .core.context import AdviceContext, Boundary, ContainerShape
+from .core.frame import _CURRENT_STATE, StepFrame, _push_frame
+from .core.stream import AsyncStreamWrapper, StreamWrapper, astream_step, stream_step
+
+T = TypeVar("T")
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _context_resolver(base: AdviceContext, fields: dict[str, Any]) -> Callable[[], AdviceContext]:
+    """Return a function yielding ``base``, re-derived only when run_id/tenant change.
+
+    Steps inherit ``run_id``/``tenant`` from the enclosing step's context unless
+    they were fixed at decoration time. The last derived context is cached, so
+    a steady stream of calls under the same run allocates nothing.
+    """
+    inherit_run_id = "run_id" not in fields
+    inherit_tenant = "tenant" not in fields
+    if not (inherit_run_id or inherit_tenant):
+        return lambda: base
+    cached: tuple[tuple[str | None, str | None], AdviceContext] = (
+        (base.run_id, base.tenant),
+        base,
+    )
+
+    def resolve() -> AdviceContext:
+        nonlocal cached
+        parent = current_context()
+        if parent is None:
+            return base
+        run_id = parent.run_id if inherit_run_id else base.run_id
+        tenant = parent.tenant if inherit_tenant else base.tenant
+        key = (run_id, tenant)
+        if key != cached[0]:
+            # Single tuple assignment keeps the cache consistent across threads.
+            cached = (key, replace(base, run_id=run_id, tenant=tenant))
+        return cached[1]
+
+    return resolve
 
 
 class AspectManager:
+    __slots__ = (
+        "_aspects",
+        "_befores",
+        "_around",
+        "_around_async",
+        "_afters",
+        "_streams",
+        "_stream_create",
+        "_astreams",
+        "_astream_create",
+    )
+
     def __init__(self, aspects: Iterable[Aspect] | None = None) -> None:
-        self._aspects: list[Aspect] = list(aspects or [])
+        self._aspects: tuple[Aspect, ...] = tuple(aspects or [])
+        # Compiled once; per call only the hooks that do real work run.
+        plan = plan_hooks(self._aspects)
+        self._befores: tuple[BeforeHook, ...] = plan.befores
+        self._around: AroundChain = compile_around(plan.arounds)
+        self._around_async: AsyncAroundChain = compile_around_async(plan.arounds_async)
+        self._afters: tuple[AfterHook, ...] = plan.afters
+        self._streams: tuple[StreamWrapper, ...] = plan.streams
+        self._stream_create: AroundChain = compile_around(plan.stream_arounds)
+        self._astreams: tuple[AsyncStreamWrapper, ...] = plan.astreams
+        self._astream_create: AroundChain = compile_around(plan.astream_arounds)
 
     def run(self, ctx: AdviceContext, call: Callable[[], Any]) -> Any:
-        for a in self._aspects:
-            a.before(ctx)
+        frame = StepFrame(ctx)
+        token = _push_frame(frame)
+        try:
+            for before in self._befores:
+                before(ctx)
 
-        def around_chain(inner: Callable[[], Any], aspect: Aspect) -> Callable[[], Any]:
-            return lambda: aspect.around(ctx, inner)
+            result: Any = None
+            frame.start_ns = perf_counter_ns()
+            try:
+                result = self._around(ctx, call)
+                return result
+            except Exception as exc:  # noqa: BLE001 - bubble after after()
+                frame.error = exc
+                raise
+            finally:
+                frame.end_ns = perf_counter_ns()
+                for after in self._afters:
+                    after(ctx, result, frame.error)
+        finally:
+            _CURRENT_STATE.reset(token)
 
-        wrapped_call = reduce(around_chain, reversed(self._aspects), call)
+    async def run_async(self, ctx: AdviceContext, call: Callable[[], Awaitable[T]]) -> T:
+        """Await ``call()`` through the aspects' ``around_async`` hooks.
 
-        error: Exception | None = None
-        result: Any = None
+        ``before``/``after`` run in the calling task, so contextvars they set
+        (e.g. :func:`current_context`) are visible for the whole awaited body,
+        and the frame's timer covers the awaited work.
+        """
+        frame = StepFrame(ctx)
+        token = _push_frame(frame)
         try:
-            result = wrapped_call()
-            return result
-        except Exception as exc:  # noqa: BLE001 - bubble after after()
-            error = exc
-            raise
+            for before in self._befores:
+                before(ctx)
+
+            result: Any = None
+            frame.start_ns = perf_counter_ns()
+            try:
+                result = await self._around_async(ctx, call)
+                return result  # type: ignore[no-any-return]
+            except Exception as exc:  # noqa: BLE001 - bubble after after()
+                frame.error = exc
+                raise
+            finally:
+                frame.end_ns = perf_counter_ns()
+                for after in self._afters:
+                    after(ctx, result, frame.error)
         finally:
-            for a in self._aspects:
-                a.after(ctx, result, error)
+            _CURRENT_STATE.reset(token)
+
+    def run_stream(self, ctx: AdviceContext, call: Callable[[], Iterable[T]]) -> Iterator[T]:
+        """Run a streaming step whose hooks stay active until the stream ends.
+
+        Nothing runs at call time: ``before`` hooks and ``call`` (typically a
+        generator function) run on the first ``next()``, so an aspect that
+        rejects the step (e.g. a contract violation) raises there, not here.
+        This keeps ``before``/``after`` paired for streams that are never
+        consumed. The step's frame (context, materialization permission) and
+        ``around_stream`` hooks such as tracing's span are re-entered for every
+        item; ``after`` hooks fire once the stream is exhausted, fails or is
+        closed, and receive a :class:`~wanaspects.core.stream.StreamResult`
+        with the item count, time-to-first-item and total duration.
+        """
+        return stream_step(
+            self._befores, self._stream_create, self._streams, self._afters, ctx, call
+        )
+
+    def run_astream(
+        self, ctx: AdviceContext, call: Callable[[], AsyncIterator[T]]
+    ) -> AsyncIterator[T]:
+        """Async-iterator counterpart of :meth:`run_stream` (``around_astream`` hooks).
+
+        As with :meth:`run_stream`, ``before`` hooks run on the first ``__anext__()``.
+        """
+        return astream_step(
+            self._befores, self._astream_create, self._astreams, self._afters, ctx, call
+        )
+
+    def run_many(
+        self,
+        ctx: AdviceContext,
+        fn: Callable[[Any], Any],
+        items: Iterable[Any],
+        *,
+        collect_errors: bool = False,
+    ) -> BatchResult:
+        """Apply ``fn`` to each of ``items`` inside a single step.
+
+        The hooks run once for the whole batch: one span, one log record and
+        one duration observation, with the item count reported by the aspects.
+        With ``collect_errors`` a failing item does not abort the batch; its
+        slot holds ``None`` and the exception is kept in ``result.errors``.
+        """
+        result: BatchResult = self.run(ctx, functools.partial(run_batch, fn, items, collect_errors))
+        return result
+
+    def iter_many(
+        self,
+        ctx: AdviceContext,
+        fn: Callable[[Any], Any],
+        items: Iterable[Any],
+        *,
+        chunk_size: int = 1000,
+        collect_errors: bool = False,
+    ) -> Iterator[Any]:
+        """Lazily yield ``fn(item)`` results, running the hooks once per chunk.
+
+        Memory stays bounded by ``chunk_size`` for unbounded inputs, at the
+        cost of one step (span, log record, histogram observation) per chunk.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+        iterator = iter(items)
+        while chunk := list(itertools.islice(iterator, chunk_size)):
+            yield from self.run_many(ctx, fn, chunk, collect_errors=collect_errors)
+
+    def step(
+        self,
+        name: str | None = None,
+        *,
+        shape: ContainerShape = "single",
+        boundary: Boundary = "none",
+        **fields: Any,
+    ) -> Callable[[F], F]:
+        """Decorate a step function so every call runs through this manager.
+
+        The :class:`AdviceContext` is built once, at decoration time (``name``
+        defaults to the function's qualified name; extra ``fields`` such as
+        ``config_hash`` are passed through). It is only re-derived when the
+        enclosing step's ``run_id``/``tenant`` change. Coroutine functions are
+        dispatched through :meth:`run_async`; generator and async generator
+        functions through :meth:`run_stream`/:meth:`run_astream`, so spans and
+        timers cover the whole stream.
+        """
+
+        def decorate(fn: F) -> F:
+            base = AdviceContext(
+                step_name=name or fn.__qualname__,
+                container_shape=shape,
+                boundary=boundary,
+                **fields,
+            )
+            resolve = _context_resolver(base, fields)
+
+            if inspect.iscoroutinefunction(fn):
+                run_async = self.run_async
+
+                @functools.wraps(fn)
+                async def async_step(*args: Any, **kwargs: Any) -> Any:
+                    if args or kwargs:
+                        return await run_async(resolve(), functools.partial(fn, *args, **kwargs))
+                    return await run_async(resolve(), fn)
+
+                return cast(F, async_step)
+
+            if inspect.isgeneratorfunction(fn):
+                run: Callable[[AdviceContext, Callable[[], Any]], Any] = self.run_stream
+            elif inspect.isasyncgenfunction(fn):
+                run = self.run_astream
+            else:
+                run = self.run
+
+            @functools.wraps(fn)
+            def sync_step(*args: Any, **kwargs: Any) -> Any:
+                if args or kwargs:
+                    return run(resolve(), functools.partial(fn, *args, **kwargs))
+                return run(resolve(), fn)
+
+            return cast(F, sync_step)
+
+        return decorate
@@ -1,79 +1,70 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterable
+from time import perf_counter_ns
 from typing import Any
 
-from .core.aspect import Aspect
+from .core.aspect import Aspect, implements_hook
 from .core.context import AdviceContext
+from .core.frame import _CURRENT_STATE, StepFrame, _push_frame
+from .manager import AspectManager
 
 
-class OptimizedAspectManager:
-    """Performance-optimized AspectManager with fast paths.
+class OptimizedAspectManager(AspectManager):
+    """AspectManager with a direct-call fast path for inert bundles.
 
-    Optimizations:
-    - Fast path for 0 aspects (direct call)
-    - Fast path for 1 aspect (avoid loops and reduce)
-    - __slots__ for memory efficiency
-    - Local variable caching
-    - Tuple instead of list (immutable, faster)
-    - Proper closure capture for around chain
-    - Optimized exception handling (separate success/error paths)
+    When no aspect implements a hook that does real work (every hook is absent
+    or ``@noop_hook``), ``run`` calls the step directly: no frame, no timer.
+    ``scripts/bench_managers.py`` measures this at roughly a tenth of
+    :class:`AspectManager`'s cost for three no-op aspects.
+
+    With active hooks it dispatches exactly like :class:`AspectManager` (the
+    around chain is precompiled by both) and costs the same per call; use
+    :class:`CompiledAspectManager` when that per-call overhead matters.
     """
 
-    __slots__ = ("_aspects", "_count", "_single_aspect")
+    __slots__ = ("_passthrough",)
 
     def __init__(self, aspects: Iterable[Aspect] | None = None) -> None:
-        # Use tuple for faster iteration and immutability
-        self._aspects: tuple[Aspect, ...] = tuple(aspects or [])
-        self._count: int = len(self._aspects)
-        # Cache single aspect for fast path
-        self._single_aspect: Aspect | None = self._aspects[0] if self._count == 1 else None
+        super().__init__(aspects)
+        # Cache whether any hook does real work for the ultra-fast path
+        self._passthrough: bool = not (
+            self._befores
+            or self._afters
+            or any(implements_hook(a, "around") for a in self._aspects)
+        )
 
     def run(self, ctx: AdviceContext, call: Callable[[], Any]) -> Any:
-        # Ultra-fast path: no aspects
-        if self._count == 0:
+        # Ultra-fast path: nothing to dispatch
+        if self._passthrough:
             return call()
 
-        # Fast path: single aspect (avoid all overhead)
-        if self._single_aspect is not None:
-            a = self._single_aspect
-            a.before(ctx)
+        # Local cache for faster access
+        afters = self._afters
+
+        # One frame per call: shared timer and error for all aspects
+        frame = StepFrame(ctx)
+        token = _push_frame(frame)
+        try:
+            # Execute all before hooks
+            for before in self._befores:
+                before(ctx)
+
+            # Optimized exception handling (separate success/error paths)
+            frame.start_ns = perf_counter_ns()
             try:
-                result = a.around(ctx, call)
-                a.after(ctx, result, None)
-                return result
+                result = self._around(ctx, call)
             except Exception as exc:
-                a.after(ctx, None, exc)
+                # Error path: call after with exception
+                frame.end_ns = perf_counter_ns()
+                frame.error = exc
+                for after in afters:
+                    after(ctx, None, exc)
                 raise
-
-        # Optimized multi-aspect path
-        aspects = self._aspects  # Local cache for faster access
-
-        # Execute all before hooks
-        for a in aspects:
-            a.before(ctx)
-
-        # Build around chain with proper closure capture
-        wrapped_call = call
-        for aspect in reversed(aspects):
-            # Build a wrapped call using a nested function instead of a lambda
-            def _make_wrapped(a: Aspect, inner_call: Callable[[], Any]) -> Callable[[], Any]:
-                def _inner() -> Any:
-                    return a.around(ctx, inner_call)
-
-                return _inner
-
-            wrapped_call = _make_wrapped(aspect, wrapped_call)
-
-        # Optimized exception handling (separate success/error paths)
-        try:
-            result = wrapped_call()
             # Success path: avoid storing error variable
-            for a in aspects:
-                a.after(ctx, result, None)
+            frame.end_ns = perf_counter_ns()
+            for after in afters:
+                after(ctx, result, None)
             return result
-        except Exception as exc:
-            # Error path: call after with exception
-            for a in aspects:
-                a.after(ctx, None, exc)
-            raise
+        finally:
+            _CURRENT_STATE.reset(token)
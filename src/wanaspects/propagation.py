@@ -0,0 +1,216 @@
+"""Carry a step's ambient state across process boundaries.
+
+Two carriers are supported:
+
+- a plain ``dict`` (``inject()``/``extract()``) to pickle into a
+  multiprocessing payload or queue message;
+- environment variables (``inject_env()``/``extract_env()``) for
+  ``subprocess`` workers: ``TRACEPARENT``/``TRACESTATE`` (W3C trace context)
+  plus ``WANCHAIN_RUN_ID``, ``WANCHAIN_TENANT`` and ``WANCHAIN_CONFIG_HASH``.
+
+:class:`~wanaspects.executors.AspectProcessPoolExecutor` ships the ``dict``
+carrier together with the full ``AdviceContext`` of the submitting step.
+
+A worker calls nothing itself: :class:`ContextPropagationAspect` reads
+:func:`inherited` once when it is created and applies it to root steps, so their
+spans become children of the spawning step's span.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import re
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, fields, replace
+from typing import Any
+
+from .core.context import AdviceContext
+from .core.frame import _CURRENT_STATE, StepState
+
+# optional OpenTelemetry integration
+_otel_context: Any | None
+_otel_propagate: Any | None
+_otel_trace: Any | None
+try:  # pragma: no cover - import environment dependent
+    from opentelemetry import context as _otel_context
+    from opentelemetry import propagate as _otel_propagate
+    from opentelemetry import trace as _otel_trace
+except Exception:  # pragma: no cover
+    _otel_context = None
+    _otel_propagate = None
+    _otel_trace = None
+
+__all__ = [
+    "PropagatedContext",
+    "extract",
+    "extract_env",
+    "inherited",
+    "inject",
+    "inject_env",
+]
+
+_CONTEXT_FIELDS = tuple(f.name for f in fields(AdviceContext) if f.init)
+
+_ENV_KEYS = {
+    "traceparent": "TRACEPARENT",
+    "tracestate": "TRACESTATE",
+    "run_id": "WANCHAIN_RUN_ID",
+    "tenant": "WANCHAIN_TENANT",
+    "config_hash": "WANCHAIN_CONFIG_HASH",
+}
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+_TRACE_ID = re.compile(r"^[0-9a-f]{32}$")
+_SPAN_ID = re.compile(r"^[0-9a-f]{16}$")
+
+
+@dataclass(frozen=True)
+class PropagatedContext:
+    """Step identity and trace context received from a parent process."""
+
+    run_id: str | None = None
+    tenant: str | None = None
+    config_hash: str | None = None
+    traceparent: str | None = None
+    tracestate: str | None = None
+
+    @property
+    def trace_id(self) -> str | None:
+        match = _TRACEPARENT.match(self.traceparent or "")
+        return match.group(1) if match else None
+
+    def apply(self, ctx: AdviceContext) -> AdviceContext:
+        """Return ``ctx`` with its missing run/tenant/config/trace ids filled in."""
+        changes: dict[str, Any] = {}
+        if ctx.run_id is None and self.run_id is not None:
+            changes["run_id"] = self.run_id
+        if ctx.tenant is None and self.tenant is not None:
+            changes["tenant"] = self.tenant
+        if ctx.config_hash is None and self.config_hash is not None:
+            changes["config_hash"] = self.config_hash
+        if ctx.trace_id is None and self.trace_id is not None:
+            changes["trace_id"] = self.trace_id
+        return replace(ctx, **changes) if changes else ctx
+
+    def attach(self) -> Any | None:
+        """Make the parent span current for OTel; returns a token for :meth:`detach`.
+
+        Does nothing when a local span is already active.
+        """
+        if self.traceparent is None or _otel_propagate is None or _otel_context is None:
+            return None
+        if _otel_trace is not None and _otel_trace.get_current_span().get_span_context().is_valid:
+            return None
+        headers = {"traceparent": self.traceparent}
+        if self.tracestate is not None:
+            headers["tracestate"] = self.tracestate
+        return _otel_context.attach(_otel_propagate.extract(headers))
+
+    @staticmethod
+    def detach(token: Any | None) -> None:
+        if token is not None and _otel_context is not None:
+            _otel_context.detach(token)
+
+
+def inject(carrier: dict[str, str] | None = None) -> dict[str, str]:
+    """Add the current step's trace context and identity to ``carrier``.
+
+    Keys are ``traceparent``/``tracestate`` (from the active OTel span, or from
+    the context's W3C-shaped ``trace_id``/``span_id`` without OTel) and
+    ``run_id``, ``tenant``, ``config_hash`` when set. The dict is picklable.
+    """
+    carrier = {} if carrier is None else carrier
+    state = _CURRENT_STATE.get()
+    ctx = None
+    if state is not None:
+        ctx = state.context
+        if ctx is None and state.frame is not None:
+            ctx = state.frame.ctx
+    if ctx is not None:
+        for name in ("run_id", "tenant", "config_hash"):
+            value = getattr(ctx, name)
+            if value is not None:
+                carrier[name] = value
+    if _otel_propagate is not None:
+        _otel_propagate.inject(carrier)
+    if (
+        "traceparent" not in carrier
+        and ctx is not None
+        and _TRACE_ID.match(ctx.trace_id or "")
+        and _SPAN_ID.match(ctx.span_id or "")
+    ):
+        carrier["traceparent"] = f"00-{ctx.trace_id}-{ctx.span_id}-01"
+    return carrier
+
+
+def extract(carrier: Mapping[str, str]) -> PropagatedContext | None:
+    """Read a carrier written by :func:`inject`; None when it holds nothing."""
+    values = {name: carrier.get(name) or None for name in _ENV_KEYS}
+    if not any(values.values()):
+        return None
+    return PropagatedContext(**values)
+
+
+def inject_env(env: Mapping[str, str] | None = None) -> dict[str, str]:
+    """Return a copy of ``env`` (default ``os.environ``) for a child process.
+
+    Example:
+        subprocess.run([sys.executable, "-m", "worker"], env=inject_env(), check=True)
+    """
+    child = dict(os.environ if env is None else env)
+    for key, value in inject().items():
+        name = _ENV_KEYS.get(key)
+        if name is not None:
+            child[name] = value
+    return child
+
+
+def extract_env(env: Mapping[str, str] | None = None) -> PropagatedContext | None:
+    """Read what :func:`inject_env` wrote (default: this process's environment)."""
+    source = os.environ if env is None else env
+    return extract({key: source.get(name, "") for key, name in _ENV_KEYS.items()})
+
+
+@functools.lru_cache(maxsize=1)
+def inherited() -> PropagatedContext | None:
+    """Context passed down by the parent process, read from the environment once."""
+    return extract_env()
+
+
+# (inject() carrier, context field values or None, materialization permission)
+Payload = tuple[dict[str, str], tuple[Any, ...] | None, bool]
+
+
+def _capture_payload() -> Payload:
+    """Snapshot the current step as a small picklable tuple.
+
+    The trace context travels in an :func:`inject` carrier; the tuple only adds
+    what the carrier does not hold: the full context and the permission.
+    """
+    state = _CURRENT_STATE.get()
+    values: tuple[Any, ...] | None = None
+    allow = False
+    if state is not None:
+        allow = state.allow_materialize
+        if state.context is not None:
+            values = tuple(getattr(state.context, name) for name in _CONTEXT_FIELDS)
+    return inject(), values, allow
+
+
+@contextmanager
+def _restored(payload: Payload) -> Iterator[AdviceContext | None]:
+    """Re-establish a captured step in this process for the duration of the block."""
+    carrier, values, allow = payload
+    ctx = AdviceContext(*values) if values is not None else None
+    parent = extract(carrier)
+    otel_token = None if parent is None else parent.attach()
+    token = None
+    if ctx is not None or allow:
+        token = _CURRENT_STATE.set(StepState(None, ctx, allow, _CURRENT_STATE.get()))
+    try:
+        yield ctx
+    finally:
+        if token is not None:
+            _CURRENT_STATE.reset(token)
+        PropagatedContext.detach(otel_token)
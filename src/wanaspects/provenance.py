@@ -0,0 +1,78 @@
+"""Process-wide correlation data: package versions and a configuration hash."""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import hashlib
+import json
+import threading
+from collections.abc import Iterable
+from importlib import metadata
+
+from .config import Config, load_config
+from .core.factory import ContextFactory
+
+__all__ = ["config_hash", "default_context_factory", "package_versions"]
+
+_HASH_LENGTH = 16
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_versions(distributions: tuple[str, ...]) -> dict[str, str]:
+    versions: dict[str, str] = {}
+    for name in distributions:
+        try:
+            versions[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            continue
+    return versions
+
+
+def package_versions(distributions: Iterable[str] | None = None) -> dict[str, str]:
+    """Return ``{distribution: version}`` for the installed ``distributions``.
+
+    Defaults to ``Config.version_packages``. Lookups go through
+    ``importlib.metadata`` once per process per set of names; distributions
+    that are not installed are left out. The returned dict is shared: treat it
+    as read-only.
+    """
+    names = load_config().version_packages if distributions is None else distributions
+    return _resolve_versions(tuple(names))
+
+
+@functools.lru_cache(maxsize=32)
+def _hash_config(cfg: Config) -> str:
+    payload = json.dumps(dataclasses.asdict(cfg), sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:_HASH_LENGTH]
+
+
+def config_hash(cfg: Config | None = None) -> str:
+    """Return a stable short hash of ``cfg`` (default: the loaded configuration).
+
+    Equal configurations hash identically across processes and hosts, so the
+    value can be used to group telemetry by effective settings.
+    """
+    return _hash_config(load_config() if cfg is None else cfg)
+
+
+_DEFAULT: dict[str, ContextFactory] = {}
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_context_factory() -> ContextFactory:
+    """Return the process-wide :class:`ContextFactory`, creating it on first use.
+
+    Contexts it creates carry ``package_versions`` and ``config_hash`` by
+    default. Both are resolved lazily, when the first context is created, and
+    then reused for the life of the process.
+    """
+    factory = _DEFAULT.get("factory")
+    if factory is not None:
+        return factory
+    with _DEFAULT_LOCK:
+        if "factory" not in _DEFAULT:
+            _DEFAULT["factory"] = ContextFactory(
+                package_versions=package_versions, config_hash=config_hash
+            )
+        return _DEFAULT["factory"]
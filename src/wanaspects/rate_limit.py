@@ -0,0 +1,75 @@
+"""Per-key token buckets for rate-limiting repetitive log records."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+__all__ = ["KeyedRateLimiter"]
+
+K = TypeVar("K", bound=Hashable)
+
+_DEFAULT_MAX_KEYS = 4096
+
+
+class _Bucket:
+    __slots__ = ("suppressed", "tokens", "updated")
+
+    def __init__(self, tokens: float, updated: float) -> None:
+        self.tokens = tokens
+        self.updated = updated
+        self.suppressed = 0
+
+
+class KeyedRateLimiter(Generic[K]):
+    """Allow ``rate`` events per second per key, with bursts of up to ``burst``.
+
+    :meth:`acquire` returns ``None`` when the event should be dropped (and
+    counts it), or the number of events dropped for that key since the last
+    one allowed, so the next record can report them; :meth:`drain` hands over
+    the counts no such record has reported yet. At most ``max_keys``
+    buckets are kept; the table is cleared when it fills up.
+    """
+
+    def __init__(self, rate: float, burst: int = 10, *, max_keys: int = _DEFAULT_MAX_KEYS) -> None:
+        if rate <= 0:
+            msg = f"rate must be positive, got {rate}"
+            raise ValueError(msg)
+        if burst < 1:
+            msg = f"burst must be at least 1, got {burst}"
+            raise ValueError(msg)
+        self.rate = rate
+        self.burst = burst
+        self._max_keys = max_keys
+        self._buckets: dict[K, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: K) -> int | None:
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= self._max_keys:
+                    self._buckets.clear()
+                bucket = self._buckets[key] = _Bucket(self.burst, now)
+            else:
+                bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.updated) * self.rate)
+                bucket.updated = now
+            if bucket.tokens < 1:
+                bucket.suppressed += 1
+                return None
+            bucket.tokens -= 1
+            suppressed, bucket.suppressed = bucket.suppressed, 0
+            return suppressed
+
+    def drain(self) -> dict[K, int]:
+        """Take the per-key counts of dropped events not reported yet."""
+        pending: dict[K, int] = {}
+        with self._lock:
+            for key, bucket in self._buckets.items():
+                if bucket.suppressed:
+                    pending[key] = bucket.suppressed
+                    bucket.suppressed = 0
+        return pending
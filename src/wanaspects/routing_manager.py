@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Any, TypeVar
+
+from .core.aspect import Aspect
+from .core.context import AdviceContext, Boundary, ContainerShape
+from .manager import AspectManager
+from .optimized_manager import OptimizedAspectManager
+
+T = TypeVar("T")
+
+RouteKey = tuple[str, str, str]
+
+_DEFAULT_MAXSIZE = 4096
+
+
+@dataclass(frozen=True)
+class Route:
+    """Send matching steps to a subset of aspects.
+
+    ``step`` is a glob pattern (``fnmatch``, case-sensitive) on ``step_name``;
+    ``shape`` and ``boundary`` match exactly when given, anything when None.
+    """
+
+    aspects: Sequence[Aspect]
+    step: str = "*"
+    shape: ContainerShape | None = None
+    boundary: Boundary | None = None
+
+    def matches(self, key: RouteKey) -> bool:
+        step_name, shape, boundary = key
+        return (
+            (self.shape is None or self.shape == shape)
+            and (self.boundary is None or self.boundary == boundary)
+            and fnmatchcase(step_name, self.step)
+        )
+
+
+class RoutingAspectManager(AspectManager):
+    """Dispatch each step to the aspects of the first matching :class:`Route`.
+
+    Every route is compiled into its own manager once; the route chosen for a
+    ``(step_name, container_shape, boundary)`` key is cached in a dict, so a
+    call costs one lookup before the selected aspects run — steps that only
+    need sampled metrics never pay for logging or tracing.
+
+    The dispatch table holds at most ``maxsize`` keys; when it fills up it is
+    cleared (like :class:`~wanaspects.core.factory.ContextFactory`'s intern
+    table), so dynamic step names cannot grow it without bound.
+
+    Example:
+        manager = RoutingAspectManager(
+            [
+                Route([LoggingAspect(), TracingAspect()], boundary="io"),
+                Route([SampledMetricsAspect(sample_rate=0.01)], boundary="none"),
+            ],
+            default=prod_bundle(),
+        )
+    """
+
+    def __init__(
+        self,
+        routes: Iterable[Route],
+        default: Iterable[Aspect] | None = None,
+        manager_factory: Callable[[Iterable[Aspect]], AspectManager] = OptimizedAspectManager,
+        *,
+        maxsize: int = _DEFAULT_MAXSIZE,
+    ) -> None:
+        if maxsize <= 0:
+            msg = f"maxsize must be positive, got {maxsize}"
+            raise ValueError(msg)
+        super().__init__()
+        self._maxsize = maxsize
+        self._routes: tuple[tuple[Route, AspectManager], ...] = tuple(
+            (route, manager_factory(route.aspects)) for route in routes
+        )
+        self._default: AspectManager = manager_factory(default or ())
+        self._dispatch: dict[RouteKey, AspectManager] = {}
+
+    def _resolve(self, key: RouteKey) -> AspectManager:
+        target = self._default
+        for route, manager in self._routes:
+            if route.matches(key):
+                target = manager
+                break
+        if len(self._dispatch) >= self._maxsize:
+            self._dispatch.clear()
+        self._dispatch[key] = target
+        return target
+
+    def manager_for(self, ctx: AdviceContext) -> AspectManager:
+        """Return the compiled manager that handles ``ctx``."""
+        key = (ctx.step_name, ctx.container_shape, ctx.boundary)
+        try:
+            return self._dispatch[key]
+        except KeyError:
+            return self._resolve(key)
+
+    def run(self, ctx: AdviceContext, call: Callable[[], Any]) -> Any:
+        return self.manager_for(ctx).run(ctx, call)
+
+    async def run_async(self, ctx: AdviceContext, call: Callable[[], Awaitable[T]]) -> T:
+        return await self.manager_for(ctx).run_async(ctx, call)
+
+    def run_stream(self, ctx: AdviceContext, call: Callable[[], Iterable[T]]) -> Iterator[T]:
+        return self.manager_for(ctx).run_stream(ctx, call)
+
+    def run_astream(
+        self, ctx: AdviceContext, call: Callable[[], AsyncIterator[T]]
+    ) -> AsyncIterator[T]:
+        return self.manager_for(ctx).run_astream(ctx, call)
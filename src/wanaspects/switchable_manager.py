@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from typing import Any, TypeVar
+
+from .config import load_config
+from .core.aspect import Aspect
+from .core.context import AdviceContext
+from .manager import AspectManager
+from .optimized_manager import OptimizedAspectManager
+
+T = TypeVar("T")
+
+__all__ = ["SwitchableAspectManager", "global_manager"]
+
+
+class SwitchableAspectManager(AspectManager):
+    """Manager whose aspect set can be replaced atomically at runtime.
+
+    The active bundle lives behind a single attribute: :meth:`swap` compiles
+    the new bundle first, then rebinds it in one assignment, so in-flight
+    steps finish on the manager they started with and no worker restarts are
+    needed. When disabled, a step costs one attribute check before ``call()``.
+    """
+
+    def __init__(
+        self,
+        aspects: Iterable[Aspect] | AspectManager | None = None,
+        manager_factory: Callable[[Iterable[Aspect]], AspectManager] = OptimizedAspectManager,
+    ) -> None:
+        super().__init__()
+        self._factory = manager_factory
+        self._active: AspectManager | None = None
+        self.swap(aspects)
+
+    @property
+    def enabled(self) -> bool:
+        return self._active is not None
+
+    def swap(self, aspects: Iterable[Aspect] | AspectManager | None) -> None:
+        """Install a new bundle (or a ready manager); ``None`` disables all aspects."""
+        if aspects is None or isinstance(aspects, AspectManager):
+            self._active = aspects
+        else:
+            self._active = self._factory(aspects)
+
+    def disable(self) -> None:
+        self._active = None
+
+    def run(self, ctx: AdviceContext, call: Callable[[], Any]) -> Any:
+        active = self._active
+        if active is None:
+            return call()
+        return active.run(ctx, call)
+
+    async def run_async(self, ctx: AdviceContext, call: Callable[[], Awaitable[T]]) -> T:
+        active = self._active
+        if active is None:
+            return await call()
+        return await active.run_async(ctx, call)
+
+    def run_stream(self, ctx: AdviceContext, call: Callable[[], Iterable[T]]) -> Iterator[T]:
+        active = self._active
+        if active is None:
+            return _stream(call)
+        return active.run_stream(ctx, call)
+
+    def run_astream(
+        self, ctx: AdviceContext, call: Callable[[], AsyncIterator[T]]
+    ) -> AsyncIterator[T]:
+        active = self._active
+        if active is None:
+            return _astream(call)
+        return active.run_astream(ctx, call)
+
+
+# Disabled streams still start ``call()`` on first iteration, as managed ones do.
+def _stream(call: Callable[[], Iterable[T]]) -> Iterator[T]:
+    yield from call()
+
+
+async def _astream(call: Callable[[], AsyncIterator[T]]) -> AsyncIterator[T]:
+    async for item in call():
+        yield item
+
+
+_GLOBAL: dict[str, SwitchableAspectManager] = {}
+_GLOBAL_LOCK = threading.Lock()
+
+
+def global_manager() -> SwitchableAspectManager:
+    """Return the process-wide switchable manager, creating it on first use.
+
+    It starts with ``bundle_from_config()`` when ``WANCHAIN_ASPECTS_ENABLED``
+    is true and disabled otherwise; call :meth:`SwitchableAspectManager.swap`
+    to change bundles (e.g. ``prod_bundle()``) while workers keep running.
+    """
+    manager = _GLOBAL.get("manager")
+    if manager is not None:
+        return manager
+    with _GLOBAL_LOCK:
+        if "manager" not in _GLOBAL:
+            from . import bundle_from_config  # noqa: PLC0415 - avoid import cycle
+
+            bundle = bundle_from_config() if load_config().enabled else None
+            _GLOBAL["manager"] = SwitchableAspectManager(bundle)  # type: ignore[arg-type]
+        return _GLOBAL["manager"]
@@ -0,0 +1,138 @@
+"""Tail-triggered log buffering: keep a step's chatter unless the step goes wrong.
+
+:func:`enable_tail_buffering` puts a logger's handlers (default: root) behind a
+:class:`TailBufferHandler`. While a step run by
+:class:`~wanaspects.aspects.tail_buffer.TailBufferAspect` is active, records
+below ``flush_level`` from any logger are appended to a bounded ring buffer on
+the step's frame instead of being written. When the step fails or is slow the
+buffer is written out, in order; otherwise it is discarded. A record at or
+above ``flush_level`` writes the buffer and itself immediately.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+
+from .core.frame import _CURRENT_STATE
+
+__all__ = ["TailBufferHandler", "disable_tail_buffering", "enable_tail_buffering"]
+
+# Key of the step's buffer in ``StepFrame.scratch``.
+_BUFFER_KEY = "wanaspects.tail_buffer"
+_BUFFERING, _PASSING, _DROPPING = 0, 1, 2
+
+
+class _TailBuffer:
+    """Records held for one outermost buffered step (nested steps share it)."""
+
+    __slots__ = ("mode", "records")
+
+    def __init__(self, capacity: int) -> None:
+        self.records: deque[tuple[TailBufferHandler, logging.LogRecord]] = deque(maxlen=capacity)
+        self.mode = _BUFFERING
+
+    def flush(self) -> None:
+        # popleft is atomic, so records appended by other threads meanwhile are
+        # either written here or stay for the next flush.
+        records = self.records
+        while records:
+            try:
+                handler, record = records.popleft()
+            except IndexError:
+                return
+            handler._forward(record)
+
+    def finish(self, *, keep: bool) -> None:
+        """Write (``keep``) or drop what is buffered; later records follow suit."""
+        if keep:
+            self.flush()
+            self.mode = _PASSING
+        else:
+            self.mode = _DROPPING
+            self.records.clear()
+
+
+def _active_buffer() -> _TailBuffer | None:
+    state = _CURRENT_STATE.get()
+    while state is not None:
+        frame = state.frame
+        if frame is not None and frame._scratch:
+            buffer = frame._scratch.get(_BUFFER_KEY)
+            if buffer is not None:
+                return buffer  # type: ignore[no-any-return]
+        state = state.parent
+    return None
+
+
+class TailBufferHandler(logging.Handler):
+    """Hold records emitted inside buffered steps; forward everything else.
+
+    ``handlers`` receive the records that are written, honouring their own
+    levels. Install it with :func:`enable_tail_buffering` rather than directly.
+    """
+
+    def __init__(self, handlers: list[logging.Handler], flush_level: int = logging.WARNING) -> None:
+        super().__init__()
+        self.handlers = handlers
+        self.flush_level = flush_level
+
+    def _forward(self, record: logging.LogRecord) -> None:
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        buffer = _active_buffer()
+        if buffer is None or buffer.mode == _PASSING:
+            self._forward(record)
+            return
+        if record.levelno >= self.flush_level:
+            buffer.flush()
+            self._forward(record)
+        elif buffer.mode == _BUFFERING:
+            buffer.records.append((self, record))
+
+    def flush(self) -> None:
+        for handler in self.handlers:
+            handler.flush()
+
+
+def _installed(target: logging.Logger) -> TailBufferHandler | None:
+    for handler in target.handlers:
+        if isinstance(handler, TailBufferHandler):
+            return handler
+    return None
+
+
+def enable_tail_buffering(
+    logger: logging.Logger | None = None, *, flush_level: int = logging.WARNING
+) -> TailBufferHandler:
+    """Move ``logger``'s handlers (default: root) behind a :class:`TailBufferHandler`.
+
+    Steps are only buffered when a ``TailBufferAspect`` runs them. With
+    :func:`~wanaspects.async_logging.enable_async_logging`, enable async
+    logging first, so buffered records are flushed into the queue. Calling it
+    again returns the installed handler unchanged.
+    """
+    target = logging.getLogger() if logger is None else logger
+    existing = _installed(target)
+    if existing is not None:
+        return existing
+    handlers = list(target.handlers)
+    for moved in handlers:
+        target.removeHandler(moved)
+    handler = TailBufferHandler(handlers, flush_level)
+    target.addHandler(handler)
+    return handler
+
+
+def disable_tail_buffering(logger: logging.Logger | None = None) -> None:
+    """Put the original handlers back on ``logger``; records still buffered are dropped."""
+    target = logging.getLogger() if logger is None else logger
+    handler = _installed(target)
+    if handler is None:
+        return
+    target.removeHandler(handler)
+    for restored in handler.handlers:
+        target.addHandler(restored)
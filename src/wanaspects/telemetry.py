@@ -4,6 +4,7 @@ import logging
 import os
 from typing import Any
 
+from .async_logging import disable_async_logging, enable_async_logging
 from .config import Config, load_config
 from .config.rotation import setup_log_rotation
 from .filters import RedactionFilter
@@ -190,6 +191,20 @@ def _configure_rotation(cfg: Config) -> None:
     setup_log_rotation(cfg, logging.getLogger())
 
 
+def _configure_async(cfg: Config) -> None:
+    """Put the root handlers configured above behind a bounded queue."""
+    if not cfg.log_async:
+        return
+    try:
+        enable_async_logging(
+            maxsize=cfg.log_queue_size,
+            policy=cfg.log_queue_policy,  # type: ignore[arg-type]
+        )
+    except ValueError:
+        # Unknown policy: keep synchronous logging rather than fail start-up.
+        return
+
+
 def _try_init_metrics(cfg: Config) -> None:
     """Install a global MeterProvider so the metrics aspect's instruments export.
 
@@ -314,9 +329,13 @@ def init_telemetry() -> None:
     Safe to call multiple times. No-op if optional deps are not installed.
     """
     cfg = load_config()
+    if cfg.log_async:
+        # Restore the real handlers so the steps below see and adjust them.
+        disable_async_logging()
     _configure_redaction(cfg)
     _configure_unicode(cfg)
     _configure_rotation(cfg)
+    _configure_async(cfg)
     if not cfg.enabled:
         return
     _try_init_structlog(cfg)
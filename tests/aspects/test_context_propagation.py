@@ -1,6 +1,10 @@
+import contextvars
+
 from wanaspects.aspects.context import ContextPropagationAspect
-from wanaspects.context import current_context
+from wanaspects.aspects.contract import ContractAspect
+from wanaspects.context import current_context, reset_current_context, set_current_context
 from wanaspects.core.context import AdviceContext
+from wanaspects.guards import materialize
 from wanaspects.manager import AspectManager
 
 
@@ -15,3 +19,53 @@ def test_context_propagation_sets_and_resets_context() -> None:
 
     assert manager.run(ctx, check) == "ok"
     assert current_context() is None
+
+
+def test_nested_steps_restore_their_own_parent() -> None:
+    manager = AspectManager([ContextPropagationAspect(), ContractAspect()])
+    outer = AdviceContext(step_name="outer", container_shape="workflow", boundary="io")
+    inner = AdviceContext(step_name="inner", container_shape="single")
+
+    def inner_body() -> None:
+        assert current_context() is inner
+        assert current_context() is not outer
+
+    def outer_body() -> str:
+        manager.run(inner, inner_body)
+        manager.run(inner, inner_body)
+        # Back in the outer step: its context and permission are intact.
+        assert current_context() is outer
+        return str(materialize(lambda: "ok"))
+
+    assert manager.run(outer, outer_body) == "ok"
+    assert current_context() is None
+
+
+def test_set_current_context_outside_a_step_nests() -> None:
+    a = AdviceContext(step_name="a", container_shape="single")
+    b = AdviceContext(step_name="b", container_shape="single")
+    set_current_context(a)
+    set_current_context(b)
+    assert current_context() is b
+    reset_current_context()
+    assert current_context() is a
+    reset_current_context()
+    assert current_context() is None
+
+
+def test_copied_context_keeps_its_snapshot() -> None:
+    manager = AspectManager([ContextPropagationAspect(), ContractAspect()])
+    outer = AdviceContext(step_name="outer", container_shape="single", boundary="io")
+    copies: list[contextvars.Context] = []
+
+    def body() -> None:
+        copies.append(contextvars.copy_context())
+        # A worker resetting its copy leaves the submitting step alone.
+        contextvars.copy_context().run(reset_current_context)
+        assert current_context() is outer
+
+    manager.run(outer, body)
+    assert current_context() is None
+    # The step has finished; the copy still sees the state it captured.
+    assert copies[0].run(current_context) is outer
+    assert copies[0].run(materialize, lambda: "ok") == "ok"
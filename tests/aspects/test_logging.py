@@ -3,6 +3,7 @@ import logging
 import pytest
 
 from wanaspects.aspects.logging import LoggingAspect
+from wanaspects.aspects.smart_logging import SmartLoggingAspect
 from wanaspects.core.context import AdviceContext
 from wanaspects.manager import AspectManager
 
@@ -76,3 +77,169 @@ def test_logging_aspect_captures_error_metadata() -> None:
     assert end.status == "error"  # type: ignore[attr-defined]
     assert end.error_kind == "ValueError"  # type: ignore[attr-defined]
     assert end.error_msg == "boom"  # type: ignore[attr-defined]
+
+
+def test_native_sink_emits_each_event_once() -> None:
+    logger, handler = _capture_logger()
+    ctx = AdviceContext(step_name="s", container_shape="single", boundary="none")
+
+    def failing() -> None:
+        raise ValueError("boom")
+
+    try:
+        m = AspectManager([LoggingAspect(sink="native")])
+        with pytest.raises(ValueError):
+            m.run(ctx, failing)
+    finally:
+        logger.removeHandler(handler)
+
+    assert [r.msg for r in handler.records] == ["step_start", "step_end"]
+    end = handler.records[1]
+    assert end.levelno == logging.ERROR
+    assert end.step == "s"  # type: ignore[attr-defined]
+    assert end.error_kind == "ValueError"  # type: ignore[attr-defined]
+    assert end.lineno == 0
+
+
+def test_structlog_sink_skips_stdlib(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[tuple[int, str, dict[str, object]]] = []
+
+    class _BoundLogger:
+        def log(self, level: int, event: str, **fields: object) -> None:
+            calls.append((level, event, fields))
+
+    class _Structlog:
+        @staticmethod
+        def get_logger(name: str) -> _BoundLogger:
+            return _BoundLogger()
+
+    monkeypatch.setattr("wanaspects.aspects.logging._structlog", _Structlog)
+    logger, handler = _capture_logger()
+    ctx = AdviceContext(step_name="s", container_shape="single", boundary="none")
+    try:
+        AspectManager([LoggingAspect(sink="structlog")]).run(ctx, lambda: "ok")
+    finally:
+        logger.removeHandler(handler)
+
+    assert handler.records == []
+    assert [event for _, event, _ in calls] == ["step_start", "step_end"]
+    assert calls[1][2]["status"] == "ok"
+
+
+def test_structlog_sink_falls_back_to_stdlib(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("wanaspects.aspects.logging._structlog", None)
+    assert LoggingAspect(sink="structlog").sink == "stdlib"
+    with pytest.raises(ValueError, match="sink"):
+        LoggingAspect(sink="print")  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    ("level", "expected"),
+    [
+        (logging.DEBUG, ["step_start", "step_end"]),
+        (logging.INFO, ["step_end"]),
+        (logging.ERROR, []),
+    ],
+)
+def test_fields_are_built_only_for_enabled_levels(
+    monkeypatch: pytest.MonkeyPatch, level: int, expected: list[str]
+) -> None:
+    logger, handler = _capture_logger()
+    logger.setLevel(level)
+    aspect = LoggingAspect()
+    built: list[str | None] = []
+    event_fields = aspect._event_fields
+
+    def counting(ctx: AdviceContext, status: str | None = None, *args: object) -> dict:
+        built.append(status)
+        return event_fields(ctx, status, *args)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(aspect, "_event_fields", counting)
+    ctx = AdviceContext(step_name="s", container_shape="single", boundary="none")
+    try:
+        AspectManager([aspect]).run(ctx, lambda: "ok")
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(logging.DEBUG)
+
+    assert [r.msg for r in handler.records] == expected
+    assert len(built) == len(expected)
+
+
+def test_smart_logging_aggregate_tier_summarises_successes() -> None:
+    logger, handler = _capture_logger()
+    aspect = SmartLoggingAspect(tier="aggregate")
+    ctx = AdviceContext(step_name="s", container_shape="single", boundary="io")
+    try:
+        manager = AspectManager([aspect])
+        for _ in range(5):
+            manager.run(ctx, lambda: "ok")
+        assert handler.records == []
+        aspect.flush_summaries()
+    finally:
+        logger.removeHandler(handler)
+        aspect.close()
+
+    (summary,) = handler.records
+    assert summary.msg == "step_summary"
+    assert summary.boundary == "io"  # type: ignore[attr-defined]
+    assert summary.count == 5  # type: ignore[attr-defined]  # noqa: PLR2004
+    assert summary.duration_min_ms <= summary.duration_max_ms  # type: ignore[attr-defined]
+
+
+def test_error_records_are_rate_limited_per_step_and_kind(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    now = [0.0]
+    monkeypatch.setattr("wanaspects.rate_limit.time.monotonic", lambda: now[0])
+    logger, handler = _capture_logger()
+    aspect = SmartLoggingAspect(tier="production", error_rate=1.0, error_burst=1)
+    ctx = AdviceContext(step_name="s", container_shape="single", boundary="none")
+
+    def failing() -> None:
+        raise ConnectionError("down")
+
+    try:
+        manager = AspectManager([aspect])
+        for _ in range(4):
+            with pytest.raises(ConnectionError):
+                manager.run(ctx, failing)
+        now[0] = 1.0
+        with pytest.raises(ConnectionError):
+            manager.run(ctx, failing)
+    finally:
+        logger.removeHandler(handler)
+
+    ends = [r for r in handler.records if r.msg == "step_end"]
+    assert len(ends) == 2  # noqa: PLR2004
+    assert not hasattr(ends[0], "suppressed")
+    assert ends[1].suppressed == 3  # type: ignore[attr-defined]  # noqa: PLR2004
+
+
+def test_suppressed_errors_are_reported_after_the_storm_ends(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("wanaspects.rate_limit.time.monotonic", lambda: 0.0)
+    logger, handler = _capture_logger()
+    aspect = SmartLoggingAspect(tier="production", error_rate=1.0, error_burst=1)
+    ctx = AdviceContext(step_name="s", container_shape="single", boundary="none")
+
+    def failing() -> None:
+        raise ConnectionError("down")
+
+    try:
+        manager = AspectManager([aspect])
+        for _ in range(3):
+            with pytest.raises(ConnectionError):
+                manager.run(ctx, failing)
+        aspect.close()
+        aspect.flush_suppressed()
+    finally:
+        logger.removeHandler(handler)
+
+    assert [r.msg for r in handler.records] == ["step_end", "step_errors_suppressed"]
+    report = handler.records[-1]
+    assert report.levelno == logging.ERROR
+    assert report.step == "s"  # type: ignore[attr-defined]
+    assert report.error_kind == "ConnectionError"  # type: ignore[attr-defined]
+    assert report.suppressed == 2  # type: ignore[attr-defined]  # noqa: PLR2004
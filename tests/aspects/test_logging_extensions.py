@@ -127,3 +127,113 @@ def test_log_api_call_failure_defaults_status(capture_logger: LoggerCapture) ->
     assert payload["success"] is False
     assert payload["error_kind"] == "TimeoutError"
     assert payload["error_message"] == "deadline exceeded"
+
+
+def test_fingerprint_sql_strips_literals_and_comments() -> None:
+    select = "SELECT * FROM t1 WHERE id IN (1, 2, 3) /* hint */ AND name = 'o''brien'"
+    assert domain_logging.fingerprint_sql(select) == "SELECT * FROM t1 WHERE id IN (?) AND name = ?"
+    insert = "INSERT INTO t (a, b)\n  VALUES (1, 'x'), (2, 'y') -- bulk"
+    assert domain_logging.fingerprint_sql(insert) == "INSERT INTO t (a, b) VALUES (?)"
+    assert domain_logging.fingerprint_sql("SELECT :id, $1, %s") == "SELECT :id, $1, %s"
+
+
+def test_log_db_query_aggregates_by_fingerprint(capture_logger: LoggerCapture) -> None:
+    logger, handler = capture_logger
+    aggregator = domain_logging.DbQueryAggregator(logger, slow_query_ms=100.0)
+    try:
+        for user_id, rows in ((1, 2), (2, 3), (3, 0)):
+            domain_logging.log_db_query(
+                logger,
+                f"SELECT * FROM user WHERE id = {user_id}",
+                duration_ms=5.0,
+                row_count=rows,
+                aggregator=aggregator,
+            )
+        assert handler.records == []
+
+        domain_logging.log_db_query(
+            logger, "SELECT * FROM user WHERE id = 4", duration_ms=250.0, aggregator=aggregator
+        )
+        slow = latest(handler)
+        assert slow.levelno == logging.WARNING
+        assert slow.db["fingerprint"] == "SELECT * FROM user WHERE id = ?"
+
+        domain_logging.log_db_query(
+            logger, "DELETE FROM user", error=RuntimeError("locked"), aggregator=aggregator
+        )
+        assert latest(handler).levelno == logging.ERROR
+        aggregator.flush()
+    finally:
+        aggregator.close()
+
+    summaries = {r.db["fingerprint"]: r.db for r in handler.records if r.msg == "db.query.summary"}
+    select = summaries["SELECT * FROM user WHERE id = ?"]
+    assert select["count"] == 4  # noqa: PLR2004
+    assert select["row_count"] == 5  # noqa: PLR2004
+    assert select["duration_max_ms"] == pytest.approx(250.0)
+    assert summaries["DELETE FROM user"]["errors"] == {"RuntimeError": 1}
+
+
+def test_log_cache_operation_aggregates_per_namespace(capture_logger: LoggerCapture) -> None:
+    logger, handler = capture_logger
+    aggregator = domain_logging.CacheOperationAggregator(logger)
+    try:
+        for hit in (True, True, True, False):
+            domain_logging.log_cache_operation(
+                logger,
+                operation="get",
+                key="users:1",
+                namespace="users",
+                hit=hit,
+                duration_ms=0.2,
+                aggregator=aggregator,
+            )
+        domain_logging.log_cache_operation(
+            logger, operation="set", key="users:1", namespace="users", aggregator=aggregator
+        )
+        domain_logging.log_cache_operation(
+            logger, operation="invalidate", key="k", aggregator=aggregator
+        )
+        assert handler.records == []
+
+        domain_logging.log_cache_operation(
+            logger,
+            operation="get",
+            key="users:2",
+            namespace="users",
+            error=TimeoutError("slow"),
+            aggregator=aggregator,
+        )
+        assert latest(handler).levelno == logging.ERROR
+        assert aggregator.snapshot()["users"]["count"] == 6  # noqa: PLR2004
+        aggregator.flush()
+    finally:
+        aggregator.close()
+
+    summaries = {
+        r.cache_event["namespace"]: r.cache_event
+        for r in handler.records
+        if r.msg == "cache.summary"
+    }
+    users = summaries["users"]
+    assert (users["get"], users["set"], users["hits"], users["misses"]) == (5, 1, 3, 1)
+    assert users["hit_ratio"] == pytest.approx(0.75)
+    assert users["errors"] == {"TimeoutError": 1}
+    assert users["duration_p50_ms"] == pytest.approx(0.2, rel=0.2)
+    assert summaries["default"]["invalidate"] == 1
+    assert "hit_ratio" not in summaries["default"]
+
+
+def test_cache_aggregator_folds_extra_namespaces_into_other(capture_logger: LoggerCapture) -> None:
+    logger, _ = capture_logger
+    aggregator = domain_logging.CacheOperationAggregator(logger, max_namespaces=2)
+    try:
+        for namespace in ("a", "b", "c", "d", "a"):
+            aggregator.record("get", namespace=namespace, hit=True)
+        snapshot = aggregator.snapshot()
+    finally:
+        aggregator.close()
+
+    assert sorted(snapshot) == ["a", "b", "other"]
+    assert snapshot["other"]["count"] == 2  # noqa: PLR2004
+    assert snapshot["a"]["count"] == 2  # noqa: PLR2004
@@ -0,0 +1,159 @@
+import logging
+
+import pytest
+
+from wanaspects.aspects.logging import LoggingAspect
+from wanaspects.aspects.observability import ObservabilityAspect
+from wanaspects.core.context import AdviceContext
+from wanaspects.manager import AspectManager
+
+
+def _run_logged(
+    caplog: pytest.LogCaptureFixture, aspect: object, ctx: AdviceContext
+) -> list[logging.LogRecord]:
+    caplog.set_level(logging.DEBUG, logger="wanaspects")
+    caplog.clear()
+    assert AspectManager([aspect]).run(ctx, lambda: "ok") == "ok"
+    return list(caplog.records)
+
+
+def test_observability_matches_logging_schema(caplog: pytest.LogCaptureFixture) -> None:
+    ctx = AdviceContext(
+        step_name="s",
+        container_shape="single",
+        run_id="r1",
+        tenant="t1",
+        config_hash="cfg-1",
+        package_versions={"wanaspects": "0.1.0"},
+    )
+    fused = _run_logged(caplog, ObservabilityAspect(), ctx)
+    plain = _run_logged(caplog, LoggingAspect(), ctx)
+
+    assert [r.msg for r in fused] == [r.msg for r in plain] == ["step_start", "step_end"]
+    fused_end, plain_end = fused[-1].__dict__, plain[-1].__dict__
+    assert fused_end.keys() - {"created", "msecs", "relativeCreated"} == (
+        plain_end.keys() - {"created", "msecs", "relativeCreated"}
+    )
+    assert fused_end["duration_ms"] > 0
+
+
+def test_observability_counts_metrics_and_errors() -> None:
+    aspect = ObservabilityAspect(tier="production")
+    ctx = AdviceContext(step_name="s", container_shape="single")
+    manager = AspectManager([aspect])
+
+    assert manager.run(ctx, lambda: 1) == 1
+
+    def failing() -> None:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        manager.run(ctx, failing)
+
+    assert aspect._metrics._steps_total[("s", "single", "none", "ok")] == 1
+    assert aspect._metrics._steps_total[("s", "single", "none", "error")] == 1
+    assert aspect._metrics._step_errors_total[("s", "single", "none", "ValueError")] == 1
+
+
+def test_observability_samples_successes_but_keeps_errors() -> None:
+    aspect = ObservabilityAspect(tier="production", metrics_sample_rate=0.25)
+    ctx = AdviceContext(step_name="s", container_shape="single")
+    manager = AspectManager([aspect])
+
+    for _ in range(8):
+        manager.run(ctx, lambda: None)
+
+    def failing() -> None:
+        raise KeyError("k")
+
+    for _ in range(3):
+        with pytest.raises(KeyError):
+            manager.run(ctx, failing)
+
+    assert aspect._metrics._steps_total[("s", "single", "none", "ok")] == 2  # noqa: PLR2004
+    assert aspect._metrics._steps_total[("s", "single", "none", "error")] == 3  # noqa: PLR2004
+
+
+def test_observability_samples_success_records_but_keeps_errors(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    aspect = ObservabilityAspect(log_sample_rate=0.5)
+    ctx = AdviceContext(step_name="s", container_shape="single")
+    records: list[logging.LogRecord] = []
+    for _ in range(4):
+        records += _run_logged(caplog, aspect, ctx)
+    ends = [r for r in records if r.msg == "step_end"]
+    assert len(ends) == 2  # noqa: PLR2004
+
+    def failing() -> None:
+        raise ValueError("boom")
+
+    caplog.clear()
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            AspectManager([aspect]).run(ctx, failing)
+    assert [r.status for r in caplog.records if r.msg == "step_end"] == ["error"] * 2  # type: ignore[attr-defined]
+
+
+def test_observability_production_tier_skips_internal_successes(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    internal = AdviceContext(step_name="s", container_shape="single", boundary="none")
+    io = AdviceContext(step_name="s", container_shape="single", boundary="io")
+    aspect = ObservabilityAspect(tier="production")
+
+    assert _run_logged(caplog, aspect, internal) == []
+    assert [r.msg for r in _run_logged(caplog, aspect, io)] == ["step_end"]
+
+
+@pytest.mark.parametrize("kwarg", ["log_sample_rate", "metrics_sample_rate"])
+def test_observability_rejects_bad_sample_rate(kwarg: str) -> None:
+    with pytest.raises(ValueError, match=kwarg):
+        ObservabilityAspect(**{kwarg: 0.0})  # type: ignore[arg-type]
+
+
+def test_aggregate_tier_writes_interval_summaries(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.DEBUG, logger="wanaspects")
+    aspect = ObservabilityAspect(tier="aggregate")
+    ctx = AdviceContext(step_name="s", container_shape="single")
+
+    def failing() -> None:
+        raise KeyError("k")
+
+    try:
+        manager = AspectManager([aspect])
+        for _ in range(3):
+            manager.run(ctx, lambda: 1)
+        with pytest.raises(KeyError):
+            manager.run(ctx, failing)
+        assert [r.msg for r in caplog.records] == ["step_end"]
+        aspect._logging.flush_summaries()
+    finally:
+        aspect.close()
+
+    summaries = {
+        r.status: r  # type: ignore[attr-defined]
+        for r in caplog.records
+        if r.msg == "step_summary"
+    }
+    assert summaries["ok"].count == 3  # type: ignore[attr-defined]  # noqa: PLR2004
+    assert summaries["ok"].duration_p99_ms > 0  # type: ignore[attr-defined]
+    assert summaries["error"].errors == {"KeyError": 1}  # type: ignore[attr-defined]
+
+
+def test_error_log_rate_limits_records_but_not_metrics(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.DEBUG, logger="wanaspects")
+    aspect = ObservabilityAspect(tier="production", error_log_rate=0.001, error_log_burst=1)
+    ctx = AdviceContext(step_name="s", container_shape="single")
+
+    def failing() -> None:
+        raise ValueError("boom")
+
+    manager = AspectManager([aspect])
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            manager.run(ctx, failing)
+
+    assert [r.msg for r in caplog.records] == ["step_end"]
+    errors = aspect._metrics._step_errors_total
+    assert errors[("s", "single", "none", "ValueError")] == 3  # noqa: PLR2004
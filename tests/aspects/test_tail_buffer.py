@@ -0,0 +1,94 @@
+import logging
+from logging.handlers import BufferingHandler
+
+import pytest
+
+from wanaspects.aspects.logging import LoggingAspect
+from wanaspects.aspects.tail_buffer import TailBufferAspect
+from wanaspects.core.context import AdviceContext
+from wanaspects.manager import AspectManager
+from wanaspects.tail_buffer import disable_tail_buffering, enable_tail_buffering
+
+CTX = AdviceContext(step_name="s", container_shape="single", boundary="none")
+INNER = AdviceContext(step_name="inner", container_shape="single", boundary="none")
+
+
+@pytest.fixture()
+def captured():
+    logger = logging.getLogger("wanaspects")
+    logger.setLevel(logging.DEBUG)
+    handler = BufferingHandler(capacity=1000)
+    logger.addHandler(handler)
+    enable_tail_buffering(logger)
+    try:
+        yield handler
+    finally:
+        disable_tail_buffering(logger)
+        logger.removeHandler(handler)
+
+
+def _body(fail: bool = False):
+    def body() -> str:
+        app = logging.getLogger("wanaspects.app")
+        app.debug("loading")
+        app.info("loaded")
+        if fail:
+            raise RuntimeError("boom")
+        return "ok"
+
+    return body
+
+
+def _messages(handler: BufferingHandler) -> list[str]:
+    return [r.getMessage() for r in handler.buffer]
+
+
+def test_successful_step_discards_buffered_records(captured):
+    manager = AspectManager([TailBufferAspect(), LoggingAspect()])
+    assert manager.run(CTX, _body()) == "ok"
+    logging.getLogger("wanaspects.app").info("outside")
+
+    assert _messages(captured) == ["outside"]
+
+
+def test_failing_step_writes_buffer_in_order(captured):
+    manager = AspectManager([TailBufferAspect(), LoggingAspect()])
+    with pytest.raises(RuntimeError):
+        manager.run(CTX, _body(fail=True))
+
+    assert _messages(captured) == ["step_start", "loading", "loaded", "step_end"]
+    assert captured.buffer[-1].levelno == logging.ERROR
+
+
+def test_slow_step_is_written(captured):
+    manager = AspectManager([TailBufferAspect(latency_threshold_ms=0), LoggingAspect()])
+    manager.run(CTX, _body())
+
+    assert _messages(captured) == ["step_start", "loading", "loaded", "step_end"]
+
+
+def test_warning_flushes_immediately_and_capacity_bounds_buffer(captured):
+    def body() -> None:
+        app = logging.getLogger("wanaspects.app")
+        for i in range(5):
+            app.debug("debug %d", i)
+        app.warning("careful")
+        app.info("after warning")
+
+    AspectManager([TailBufferAspect(capacity=2)]).run(CTX, body)
+
+    assert _messages(captured) == ["debug 3", "debug 4", "careful"]
+
+
+def test_failing_nested_step_flushes_shared_buffer(captured):
+    manager = AspectManager([TailBufferAspect()])
+
+    def outer() -> None:
+        logging.getLogger("wanaspects.app").info("outer work")
+        with pytest.raises(RuntimeError):
+            manager.run(INNER, _body(fail=True))
+        logging.getLogger("wanaspects.app").info("recovered")
+
+    manager.run(CTX, outer)
+
+    assert _messages(captured) == ["outer work", "loading", "loaded"]
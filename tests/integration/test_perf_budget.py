@@ -3,7 +3,7 @@ import time
 
 import pytest
 
-from wanaspects import AspectManager, default_bundle
+from wanaspects import AspectManager, CompiledAspectManager, default_bundle
 from wanaspects.core.context import AdviceContext
 
 
@@ -33,3 +33,35 @@ def test_wrapper_overhead_budget() -> None:
     # Basic budget: wrapped overhead should be < 5x baseline in this synthetic test
     MAX_MULTIPLIER = 300.0
     assert wrapped / base < MAX_MULTIPLIER
+
+
+class _PassThrough:
+    def before(self, ctx: AdviceContext) -> None:
+        pass
+
+    def around(self, ctx: AdviceContext, call):  # type: ignore[no-untyped-def]
+        return call()
+
+    def after(self, ctx: AdviceContext, result, error):  # type: ignore[no-untyped-def]
+        pass
+
+
+@pytest.mark.skipif(
+    os.getenv("WANASPECTS_RUN_PERF_TESTS", "false").lower() not in {"1", "true", "yes", "on"},
+    reason="perf tests disabled; set WANASPECTS_RUN_PERF_TESTS=true to enable",
+)
+@pytest.mark.parametrize("count", [3, 5, 8])
+def test_compiled_manager_not_slower_than_aspect_manager(count: int) -> None:
+    ctx = AdviceContext(step_name="perf", container_shape="single", boundary="none")
+    iters = 50_000
+
+    def measure(manager: AspectManager) -> float:
+        t0 = time.perf_counter()
+        for _ in range(iters):
+            manager.run(ctx, int)
+        return time.perf_counter() - t0
+
+    baseline = measure(AspectManager([_PassThrough() for _ in range(count)]))
+    compiled = measure(CompiledAspectManager([_PassThrough() for _ in range(count)]))
+    # Generous margin: CI machines are noisy, the generated runner should win outright.
+    assert compiled < baseline * 1.2
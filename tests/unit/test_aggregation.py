@@ -0,0 +1,92 @@
+import gc
+import time
+import weakref
+
+import pytest
+
+from wanaspects import aggregation
+from wanaspects.aggregation import Aggregator, LatencyHistogram
+
+
+def test_histogram_percentiles_are_close_and_clamped() -> None:
+    histogram = LatencyHistogram()
+    for value in range(1, 1001):
+        histogram.record(float(value))
+
+    summary = histogram.summary()
+    assert summary["min_ms"] == 1.0  # noqa: PLR2004
+    assert summary["max_ms"] == 1000.0  # noqa: PLR2004
+    assert summary["mean_ms"] == pytest.approx(500.5)
+    assert summary["p50_ms"] == pytest.approx(500, rel=0.2)
+    assert summary["p99_ms"] == pytest.approx(990, rel=0.2)
+    assert summary["p99_ms"] <= summary["max_ms"]
+    assert LatencyHistogram().percentile(50) is None
+
+
+def test_aggregator_flushes_per_interval(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(aggregation.time, "monotonic", lambda: now[0])
+    emitted: list[tuple[str, dict]] = []
+    aggregator: Aggregator[str] = Aggregator(
+        lambda k, f: emitted.append((k, f)), 10.0, idle_flush=False
+    )
+    try:
+        aggregator.record("a", 2.0, totals={"rows": 3})
+        aggregator.record("a", 4.0, error_kind="ValueError", totals={"rows": 1})
+        aggregator.record("b")
+        assert emitted == []
+        assert aggregator.snapshot()["a"]["count"] == 2  # noqa: PLR2004
+
+        now[0] = 110.0
+        aggregator.record("b")
+    finally:
+        aggregator.close()
+
+    summaries = dict(emitted)
+    assert summaries["a"]["count"] == 2  # noqa: PLR2004
+    assert summaries["a"]["rows"] == 4  # noqa: PLR2004
+    assert summaries["a"]["errors"] == {"ValueError": 1}
+    assert summaries["a"]["duration_max_ms"] == 4.0  # noqa: PLR2004
+    assert summaries["a"]["interval_s"] == 10.0  # noqa: PLR2004
+    assert summaries["b"]["count"] == 2  # noqa: PLR2004
+    assert "duration_p50_ms" not in summaries["b"]
+
+
+def test_aggregator_flushes_early_at_max_keys() -> None:
+    emitted: list[str] = []
+    aggregator: Aggregator[str] = Aggregator(lambda k, f: emitted.append(k), max_keys=2)
+    try:
+        aggregator.record("a")
+        aggregator.record("b")
+        assert sorted(emitted) == ["a", "b"]
+        aggregator.record("c")
+        assert aggregator.snapshot() == {"c": {"count": 1}}
+    finally:
+        aggregator.close()
+    assert emitted[-1] == "c"
+    with pytest.raises(ValueError, match="interval_s"):
+        Aggregator(lambda k, f: None, 0)
+
+
+def test_idle_aggregator_flushes_without_traffic(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(aggregation, "_IDLE_TICK_S", 0.01)
+    emitted: list[str] = []
+    aggregator: Aggregator[str] = Aggregator(lambda k, f: emitted.append(k), 0.05)
+    try:
+        aggregator.record("a")
+        deadline = time.monotonic() + 5.0
+        while not emitted and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert emitted == ["a"]
+    finally:
+        aggregator.close()
+    assert emitted == ["a"]
+
+
+def test_aggregators_are_tracked_weakly() -> None:
+    aggregator: Aggregator[str] = Aggregator(lambda k, f: None)
+    assert aggregator in aggregation._LIVE
+    ref = weakref.ref(aggregator)
+    del aggregator
+    gc.collect()
+    assert ref() is None
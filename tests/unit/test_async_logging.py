@@ -0,0 +1,159 @@
+import logging
+import threading
+
+import pytest
+
+from wanaspects.async_logging import (
+    _SENTINEL,
+    AsyncLogHandler,
+    disable_async_logging,
+    enable_async_logging,
+)
+from wanaspects.config import Config
+from wanaspects.filters.redaction import RedactionFilter
+from wanaspects.telemetry import init_telemetry
+
+
+class _Recorder(logging.Handler):
+    def __init__(self, gate: threading.Event | None = None) -> None:
+        super().__init__()
+        self.gate = gate
+        self.records: list[logging.LogRecord] = []
+        self.threads: set[str] = set()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.threads.add(threading.current_thread().name)
+        self.records.append(record)
+
+
+@pytest.fixture()
+def isolated_logger():
+    logger = logging.getLogger("wanaspects.tests.async")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    try:
+        yield logger
+    finally:
+        disable_async_logging(logger)
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+        for existing in list(logger.filters):
+            logger.removeFilter(existing)
+
+
+def test_records_are_written_by_listener_thread(isolated_logger):
+    recorder = _Recorder()
+    isolated_logger.addHandler(recorder)
+
+    original = list(isolated_logger.handlers)
+    handler = enable_async_logging(isolated_logger)
+    assert isolated_logger.handlers == [handler]
+    assert enable_async_logging(isolated_logger) is handler
+
+    isolated_logger.info("hello %s", "world")
+    disable_async_logging(isolated_logger)
+
+    assert [r.getMessage() for r in recorder.records] == ["hello world"]
+    assert threading.current_thread().name not in recorder.threads
+    assert isolated_logger.handlers == original
+
+
+def test_redaction_filter_moves_to_listener(isolated_logger):
+    recorder = _Recorder()
+    isolated_logger.addHandler(recorder)
+    redaction = RedactionFilter()
+    isolated_logger.addFilter(redaction)
+
+    enable_async_logging(isolated_logger)
+    assert redaction not in isolated_logger.filters
+    isolated_logger.info("login password=hunter2")
+    disable_async_logging(isolated_logger)
+
+    assert "hunter2" not in recorder.records[0].getMessage()
+    assert redaction in isolated_logger.filters
+
+
+def test_arguments_and_tracebacks_are_rendered_when_logged(isolated_logger):
+    gate = threading.Event()
+    recorder = _Recorder(gate)
+    isolated_logger.addHandler(recorder)
+    isolated_logger.addFilter(RedactionFilter())
+
+    enable_async_logging(isolated_logger)
+    items = ["a"]
+    isolated_logger.info("items %s", items)
+    items.append("b")
+    isolated_logger.info("user %(password)s", {"password": "hunter2"})
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        isolated_logger.exception("failed")
+    gate.set()
+    disable_async_logging(isolated_logger)
+
+    first, second, third = recorder.records
+    assert first.getMessage() == "items ['a']"
+    assert first.args is None
+    assert "hunter2" not in second.getMessage()
+    assert third.exc_info is None
+    assert "ValueError: boom" in (third.exc_text or "")
+
+
+@pytest.mark.parametrize("policy", ["drop_newest", "drop_oldest"])
+def test_full_queue_drops_and_counts(isolated_logger, policy):
+    gate = threading.Event()
+    recorder = _Recorder(gate)
+    isolated_logger.addHandler(recorder)
+
+    handler = enable_async_logging(isolated_logger, maxsize=2, policy=policy)
+    # The listener takes the first record and blocks on the gate; two more fill
+    # the queue and the remaining three overflow.
+    for i in range(6):
+        isolated_logger.info("event %d", i)
+    gate.set()
+    disable_async_logging(isolated_logger)
+
+    messages = [r.getMessage() for r in recorder.records]
+    assert handler.dropped == 6 - len(messages)
+    assert handler.dropped >= 2  # noqa: PLR2004
+    if policy == "drop_newest":
+        assert messages[-1] != "event 5"
+    else:
+        assert messages[-1] == "event 5"
+
+
+def test_drop_oldest_never_drops_the_stop_sentinel():
+    handler = AsyncLogHandler(maxsize=1, policy="drop_oldest")
+    handler.queue.put(_SENTINEL)  # type: ignore[arg-type]
+    handler.enqueue(logging.makeLogRecord({"msg": "late"}))
+    assert handler.dropped == 1
+    assert handler.queue.get_nowait() is _SENTINEL
+    assert handler.queue.empty()
+
+
+def test_invalid_settings_raise():
+    with pytest.raises(ValueError, match="policy"):
+        AsyncLogHandler(policy="spill")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="maxsize"):
+        AsyncLogHandler(maxsize=0)
+
+
+def test_init_telemetry_enables_async_logging(monkeypatch):
+    root = logging.getLogger()
+    recorder = _Recorder()
+    root.addHandler(recorder)
+    monkeypatch.setattr(
+        "wanaspects.telemetry.load_config",
+        lambda: Config(enable_redaction=False, unicode_safe=False, log_async=True),
+    )
+    try:
+        init_telemetry()
+        init_telemetry()
+        installed = [h for h in root.handlers if isinstance(h, AsyncLogHandler)]
+        assert len(installed) == 1
+        assert recorder not in root.handlers
+    finally:
+        disable_async_logging()
+        root.removeHandler(recorder)
@@ -0,0 +1,65 @@
+import linecache
+
+import pytest
+
+from wanaspects.compiled_manager import CompiledAspectManager
+from wanaspects.core.context import AdviceContext
+from wanaspects.manager import AspectManager
+
+
+class _OrderAspect:
+    def __init__(self, seen: list[str], name: str) -> None:
+        self.seen = seen
+        self.name = name
+
+    def before(self, ctx: AdviceContext) -> None:
+        self.seen.append(f"before:{self.name}")
+
+    def around(self, ctx: AdviceContext, call):  # type: ignore[no-untyped-def]
+        self.seen.append(f"around:{self.name}")
+        return call()
+
+    def after(self, ctx: AdviceContext, result, error):  # type: ignore[no-untyped-def]
+        self.seen.append(f"after:{self.name}:{type(error).__name__ if error else result}")
+
+
+CTX = AdviceContext(step_name="s", container_shape="single", boundary="none")
+
+
+@pytest.mark.parametrize("count", [0, 1, 3, 8])
+def test_compiled_manager_matches_aspect_manager(count: int) -> None:
+    expected: list[str] = []
+    seen: list[str] = []
+    reference = AspectManager([_OrderAspect(expected, f"a{i}") for i in range(count)])
+    compiled = CompiledAspectManager([_OrderAspect(seen, f"a{i}") for i in range(count)])
+
+    assert reference.run(CTX, lambda: "ok") == "ok"
+    assert compiled.run(CTX, lambda: "ok") == "ok"
+    assert seen == expected
+
+
+def test_compiled_manager_error_tail() -> None:
+    seen: list[str] = []
+    compiled = CompiledAspectManager([_OrderAspect(seen, f"a{i}") for i in range(3)])
+
+    def failing() -> None:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        compiled.run(CTX, failing)
+    assert [x for x in seen if x.startswith("after:")] == [
+        "after:a0:ValueError",
+        "after:a1:ValueError",
+        "after:a2:ValueError",
+    ]
+
+
+def test_compiled_runners_of_one_shape_share_a_linecache_entry() -> None:
+    seen: list[str] = []
+    first = CompiledAspectManager([_OrderAspect(seen, "a")])
+    cached = len(linecache.cache)
+    second = CompiledAspectManager([_OrderAspect(seen, "b")])
+
+    assert len(linecache.cache) == cached
+    assert first.run.__code__ is second.run.__code__  # type: ignore[attr-defined]
+    assert first.run.__code__.co_filename in linecache.cache  # type: ignore[attr-defined]
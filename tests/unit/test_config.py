@@ -1,3 +1,6 @@
+import pytest
+
+from wanaspects import bundle_from_config
 from wanaspects.config import load_config
 
 TRACE_SAMPLING_OVERRIDE = 0.25
@@ -109,3 +112,15 @@ log_rotation_utc = true
     assert cfg_disk.log_rotation_when == "midnight"
     assert cfg_disk.log_rotation_interval == 1
     assert cfg_disk.log_rotation_utc is True
+
+
+def test_load_config_unknown_log_sink_falls_back(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("WANCHAIN_LOG_SINK", "Native")
+    assert load_config().log_sink == "native"
+
+    monkeypatch.setenv("WANCHAIN_LOG_SINK", "bogus")
+    with pytest.warns(RuntimeWarning, match="bogus"):
+        assert load_config().log_sink == "stdlib"
+    with pytest.warns(RuntimeWarning):
+        assert bundle_from_config()
@@ -1,4 +1,8 @@
+import pickle
+from dataclasses import asdict, fields, replace
+
 from wanaspects.core.context import AdviceContext
+from wanaspects.core.factory import ContextFactory
 
 
 def test_advice_context_basics() -> None:
@@ -6,3 +10,73 @@ def test_advice_context_basics() -> None:
     assert ctx.step_name == "s"
     assert ctx.container_shape == "single"
     assert ctx.boundary == "none"
+
+
+def test_advice_context_views_are_cached_per_instance() -> None:
+    ctx = AdviceContext(
+        step_name="s",
+        container_shape="single",
+        run_id="r1",
+        package_versions={"wanaspects": "0.1.0"},
+    )
+    assert ctx.log_fields is ctx.log_fields
+    assert ctx.log_fields == {
+        "step": "s",
+        "shape": "single",
+        "boundary": "none",
+        "run_id": "r1",
+        "versions": {"wanaspects": "0.1.0"},
+    }
+    assert ctx.span_attributes["wanchain.versions"] == "{'wanaspects': '0.1.0'}"
+    assert ctx.metric_attributes("ok") is ctx.metric_attributes("ok")
+    assert ctx.metric_attributes("error")["status"] == "error"
+    assert ctx.error_metric_attributes("KeyError")["error_kind"] == "KeyError"
+
+    derived = replace(ctx, step_name="t")
+    assert derived.log_fields["step"] == "t"
+    assert derived == replace(ctx, step_name="t")
+    assert "_views" not in repr(ctx)
+    assert "_views" not in {f.name for f in fields(ctx)}
+    assert "_views" not in asdict(ctx)
+    assert pickle.loads(pickle.dumps(ctx)) == ctx
+
+
+def test_context_factory_interns_equal_values() -> None:
+    factory = ContextFactory()
+    a = factory.create("s", "batch", run_id="r1", package_versions={"x": "1"})
+    b = factory.create("s", "batch", run_id="r1", package_versions={"x": "1"})
+    c = factory.create("t", "batch", run_id="r1", package_versions={"x": "1"})
+    assert a is b
+    assert c is not a
+    assert c.package_versions is a.package_versions
+    assert factory.intern(a.child("t")) is c
+    assert len(factory) == 2  # noqa: PLR2004
+
+
+def test_context_factory_clears_when_full() -> None:
+    factory = ContextFactory(maxsize=2)
+    first = factory.create("a")
+    factory.create("b")
+    factory.create("c")
+    assert len(factory) == 1
+    assert factory.create("a") is not first
+
+
+def test_child_and_with_trace_share_versions() -> None:
+    parent = AdviceContext(
+        step_name="p",
+        container_shape="workflow",
+        boundary="io",
+        run_id="r1",
+        tenant="t1",
+        package_versions={"wanaspects": "0.1.0"},
+    )
+    child = parent.child("c", container_shape="single")
+    assert (child.step_name, child.container_shape, child.boundary) == ("c", "single", "io")
+    assert (child.run_id, child.tenant) == ("r1", "t1")
+    assert child.package_versions is parent.package_versions
+
+    traced = child.with_trace("trace-1", "span-1")
+    assert (traced.trace_id, traced.span_id) == ("trace-1", "span-1")
+    assert traced.package_versions is parent.package_versions
+    assert traced.with_trace("trace-1", "span-1") is traced
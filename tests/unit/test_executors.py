@@ -0,0 +1,103 @@
+import multiprocessing
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from wanaspects.aspects.context import ContextPropagationAspect
+from wanaspects.aspects.contract import ContractAspect
+from wanaspects.context import current_context
+from wanaspects.core.context import AdviceContext
+from wanaspects.executors import (
+    AspectProcessPoolExecutor,
+    AspectThreadPoolExecutor,
+    wrap_submit,
+)
+from wanaspects.guards import materialize
+from wanaspects.manager import AspectManager
+from wanaspects.propagation import _capture_payload, _restored
+
+CTX = AdviceContext(
+    step_name="fan_out",
+    container_shape="batch",
+    boundary="io",
+    run_id="r1",
+    tenant="t1",
+    package_versions={"wanaspects": "0.1.0"},
+)
+
+
+def _observe(value: int) -> tuple[int, AdviceContext | None, object]:
+    ctx = current_context()
+    return value, ctx, materialize(lambda: value * 2)
+
+
+def test_thread_pool_workers_see_step_context() -> None:
+    manager = AspectManager([ContextPropagationAspect(), ContractAspect()])
+
+    def body() -> list[tuple[int, AdviceContext | None, object]]:
+        with AspectThreadPoolExecutor(max_workers=2) as pool:
+            return list(pool.map(_observe, range(4)))
+
+    results = manager.run(CTX, body)
+    assert [r[0] for r in results] == [0, 1, 2, 3]
+    assert all(ctx is CTX for _, ctx, _ in results)
+    assert [r[2] for r in results] == [0, 2, 4, 6]
+
+
+def test_wrap_submit_copies_context_per_task() -> None:
+    manager = AspectManager([ContextPropagationAspect()])
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        submit = wrap_submit(pool.submit)
+        future = manager.run(CTX, lambda: submit(current_context))
+        assert future.result() is CTX
+        # Outside the step nothing leaks into new tasks.
+        assert submit(current_context).result() is None
+
+
+def test_thread_task_keeps_context_after_step_returns() -> None:
+    manager = AspectManager([ContextPropagationAspect(), ContractAspect()])
+    release = threading.Event()
+
+    def late() -> tuple[AdviceContext | None, object]:
+        release.wait()
+        return current_context(), materialize(lambda: "ok")
+
+    with AspectThreadPoolExecutor(max_workers=1) as pool:
+        future = manager.run(CTX, lambda: pool.submit(late))
+        release.set()
+        assert future.result() == (CTX, "ok")
+
+
+def test_payload_round_trip_restores_context_and_guard() -> None:
+    manager = AspectManager([ContextPropagationAspect(), ContractAspect()])
+    payload = manager.run(CTX, _capture_payload)
+    assert current_context() is None
+
+    carrier = payload[0]
+    assert (carrier["run_id"], carrier["tenant"]) == ("r1", "t1")
+    with _restored(payload) as ctx:
+        assert ctx == CTX
+        assert current_context() == CTX
+        assert materialize(lambda: "ok") == "ok"
+    assert current_context() is None
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="needs fork start method"
+)
+def test_process_pool_workers_see_step_context() -> None:
+    manager = AspectManager([ContextPropagationAspect(), ContractAspect()])
+
+    def body() -> list[tuple[int, AdviceContext | None, object]]:
+        with AspectProcessPoolExecutor(
+            max_workers=2, mp_context=multiprocessing.get_context("fork")
+        ) as pool:
+            return list(pool.map(_observe, range(3)))
+
+    results = manager.run(CTX, body)
+    assert [(value, ctx, doubled) for value, ctx, doubled in results] == [
+        (0, CTX, 0),
+        (1, CTX, 2),
+        (2, CTX, 4),
+    ]
@@ -1,5 +1,16 @@
+from typing import Any
+
+import pytest
+
+from wanaspects import default_bundle
+from wanaspects.compiled_manager import CompiledAspectManager
+from wanaspects.context import reset_current_context, set_current_context
+from wanaspects.core.aspect import noop_hook
+from wanaspects.core.chain import plan_hooks
 from wanaspects.core.context import AdviceContext
+from wanaspects.core.frame import StepFrame, current_frame
 from wanaspects.manager import AspectManager
+from wanaspects.optimized_manager import OptimizedAspectManager
 
 
 class _OrderAspect:
@@ -31,3 +42,98 @@ def test_manager_ordering() -> None:
     # around is applied inner-most last (a2 wraps a1 wraps call)
     assert [x for x in seen if x.startswith("around:")] == ["around:a1", "around:a2"]
     assert seen[-1] == "after:a2"
+
+
+def test_optimized_manager_matches_ordering_with_precompiled_chain() -> None:
+    seen: list[str] = []
+    m = OptimizedAspectManager([_OrderAspect(seen, f"a{i}") for i in range(3)])
+    ctx = AdviceContext(step_name="s", container_shape="single", boundary="none")
+    # The chain is compiled once and reused across calls.
+    assert m.run(ctx, lambda: 1) == 1
+    assert m.run(ctx, lambda: 2) == 2  # noqa: PLR2004
+    arounds = [x for x in seen if x.startswith("around:")]
+    assert arounds == ["around:a0", "around:a1", "around:a2"] * 2
+
+
+def test_manager_skips_hooks_marked_noop() -> None:
+    class _NoopBefore(_OrderAspect):
+        @noop_hook
+        def before(self, ctx: AdviceContext) -> None:
+            raise AssertionError("no-op hook must not be dispatched")
+
+    seen: list[str] = []
+    m = AspectManager([_NoopBefore(seen, "a1"), _OrderAspect(seen, "a2")])
+    ctx = AdviceContext(step_name="s", container_shape="single", boundary="none")
+    assert m.run(ctx, lambda: "ok") == "ok"
+    assert seen == ["before:a2", "around:a1", "around:a2", "after:a1", "after:a2"]
+
+
+def test_default_bundle_dispatch_plan_drops_noops() -> None:
+    plan = plan_hooks(default_bundle())
+    # context+observability+contract before, observability around (timing lives
+    # on the StepFrame, the materialization permission on the StepState),
+    # context+observability after: 6 of 9 hooks do real work.
+    assert (len(plan.befores), len(plan.arounds), len(plan.afters)) == (3, 1, 2)
+
+
+@pytest.mark.parametrize("factory", [AspectManager, OptimizedAspectManager, CompiledAspectManager])
+def test_step_frame_is_shared_timed_and_scoped(factory: Any) -> None:
+    frames: list[tuple[StepFrame | None, Exception | None, float | None]] = []
+
+    class _Probe(_OrderAspect):
+        def after(self, ctx: AdviceContext, result: Any, error: Exception | None) -> None:
+            frame = current_frame()
+            assert frame is not None and frame.ctx is ctx
+            frames.append((frame, frame.error, frame.duration_ms))
+
+    m = factory([_Probe([], "p")])
+    outer = AdviceContext(step_name="outer", container_shape="single")
+    inner = AdviceContext(step_name="inner", container_shape="single")
+
+    def body() -> int:
+        return m.run(inner, lambda: 1) + 1
+
+    assert m.run(outer, body) == 2  # noqa: PLR2004
+    assert current_frame() is None
+    (inner_frame, _, inner_ms), (outer_frame, _, outer_ms) = frames
+    assert inner_frame is not outer_frame
+    assert inner_ms is not None and outer_ms is not None and outer_ms >= inner_ms
+
+    boom = RuntimeError("boom")
+
+    def fail() -> None:
+        raise boom
+
+    with pytest.raises(RuntimeError):
+        m.run(outer, fail)
+    assert frames[-1][1] is boom
+
+
+def test_step_decorator_reuses_context_until_run_changes() -> None:
+    seen: list[AdviceContext] = []
+
+    class _Capture(_OrderAspect):
+        def before(self, ctx: AdviceContext) -> None:
+            seen.append(ctx)
+
+    m = AspectManager([_Capture([], "c")])
+
+    @m.step(shape="batch", boundary="io")
+    def child(x: int) -> int:
+        return x * 2
+
+    assert child(2) == 4  # noqa: PLR2004
+    assert child(3) == 6  # noqa: PLR2004
+    assert seen[0] is seen[1]
+    assert seen[0].step_name.endswith("child")
+    assert (seen[0].container_shape, seen[0].boundary) == ("batch", "io")
+
+    for run_id in ("r1", "r1", "r2"):
+        parent = AdviceContext(step_name="parent", container_shape="workflow", run_id=run_id)
+        set_current_context(parent)
+        try:
+            child(1)
+        finally:
+            reset_current_context()
+    assert [c.run_id for c in seen[2:]] == ["r1", "r1", "r2"]
+    assert seen[2] is seen[3]
@@ -0,0 +1,74 @@
+import asyncio
+import logging
+
+import pytest
+
+from wanaspects import default_bundle
+from wanaspects.aspects.contract import ContractAspect
+from wanaspects.aspects.logging import LoggingAspect
+from wanaspects.context import current_context
+from wanaspects.core.context import AdviceContext
+from wanaspects.guards import materialize
+from wanaspects.manager import AspectManager
+
+SLEEP_SECONDS = 0.02
+
+
+def test_run_async_times_the_awaited_body(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.DEBUG, logger="wanaspects")
+    ctx = AdviceContext(step_name="a", container_shape="single")
+
+    async def body() -> str:
+        await asyncio.sleep(SLEEP_SECONDS)
+        return "ok"
+
+    assert asyncio.run(AspectManager([LoggingAspect()]).run_async(ctx, body)) == "ok"
+
+    end = next(r for r in caplog.records if r.msg == "step_end")
+    assert end.duration_ms >= SLEEP_SECONDS * 1000 * 0.9  # type: ignore[attr-defined]
+
+
+def test_run_async_keeps_context_and_guard_across_await() -> None:
+    manager = AspectManager(default_bundle())
+
+    async def body(ctx: AdviceContext) -> str:
+        await asyncio.sleep(0)
+        assert current_context() == ctx
+        return str(materialize(lambda: ctx.step_name))
+
+    async def main() -> list[str]:
+        contexts = [
+            AdviceContext(step_name=f"s{i}", container_shape="single", boundary="io")
+            for i in range(50)
+        ]
+        return await asyncio.gather(
+            *(manager.run_async(c, lambda c=c: body(c)) for c in contexts)  # type: ignore[misc]
+        )
+
+    assert asyncio.run(main()) == [f"s{i}" for i in range(50)]
+    assert current_context() is None
+
+
+def test_run_async_reports_errors_to_after_hooks() -> None:
+    manager = AspectManager([ContractAspect()])
+    ctx = AdviceContext(step_name="s", container_shape="single", boundary="none")
+
+    async def body() -> None:
+        await asyncio.sleep(0)
+        materialize(lambda: None)
+
+    with pytest.raises(Exception, match="Materialization not allowed"):
+        asyncio.run(manager.run_async(ctx, body))
+
+
+def test_step_decorator_dispatches_coroutines() -> None:
+    manager = AspectManager(default_bundle())
+
+    @manager.step("fetch", boundary="io")
+    async def fetch(value: int) -> int:
+        await asyncio.sleep(0)
+        ctx = current_context()
+        assert ctx is not None and ctx.step_name == "fetch"
+        return value + 1
+
+    assert asyncio.run(fetch(1)) == 2  # noqa: PLR2004
@@ -0,0 +1,90 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from wanaspects.aspects.context import ContextPropagationAspect
+from wanaspects.context import current_context
+from wanaspects.core.context import AdviceContext
+from wanaspects.manager import AspectManager
+from wanaspects.propagation import (
+    PropagatedContext,
+    extract,
+    extract_env,
+    inject,
+    inject_env,
+)
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+SPAN_ID = "00f067aa0ba902b7"
+PARENT = AdviceContext(
+    step_name="parent",
+    container_shape="workflow",
+    run_id="r1",
+    tenant="t1",
+    config_hash="cfg",
+    trace_id=TRACE_ID,
+    span_id=SPAN_ID,
+)
+SRC = Path(__file__).resolve().parents[2] / "src"
+
+
+def test_inject_carries_identity_and_traceparent() -> None:
+    manager = AspectManager([ContextPropagationAspect()])
+    carrier = manager.run(PARENT, inject)
+
+    assert carrier["run_id"] == "r1"
+    assert carrier["tenant"] == "t1"
+    assert carrier["config_hash"] == "cfg"
+    assert carrier["traceparent"] == f"00-{TRACE_ID}-{SPAN_ID}-01"
+    propagated = extract(carrier)
+    assert propagated is not None and propagated.trace_id == TRACE_ID
+    assert extract({}) is None
+
+
+def test_inject_env_round_trip() -> None:
+    manager = AspectManager([ContextPropagationAspect()])
+    env = manager.run(PARENT, lambda: inject_env({"PATH": "/bin"}))
+
+    assert env["PATH"] == "/bin"
+    assert env["WANCHAIN_RUN_ID"] == "r1"
+    assert env["TRACEPARENT"].startswith(f"00-{TRACE_ID}")
+    assert extract_env(env) == PropagatedContext(
+        run_id="r1", tenant="t1", config_hash="cfg", traceparent=env["TRACEPARENT"]
+    )
+
+
+def test_root_steps_adopt_the_inherited_identity() -> None:
+    parent = PropagatedContext(run_id="r1", tenant="t1", traceparent=f"00-{TRACE_ID}-{SPAN_ID}-01")
+    manager = AspectManager([ContextPropagationAspect(inherited_context=parent)])
+    root = AdviceContext(step_name="root", container_shape="single")
+    nested = AdviceContext(step_name="nested", container_shape="single")
+    seen: list[AdviceContext | None] = []
+
+    def body() -> None:
+        seen.append(current_context())
+        manager.run(nested, lambda: seen.append(current_context()))
+
+    manager.run(root, body)
+    published, inner = seen
+    assert published is not None
+    assert (published.step_name, published.run_id, published.tenant) == ("root", "r1", "t1")
+    assert published.trace_id == TRACE_ID
+    assert inner is nested
+    assert current_context() is None
+
+
+def test_subprocess_worker_reads_the_environment() -> None:
+    manager = AspectManager([ContextPropagationAspect()])
+    env = manager.run(PARENT, inject_env)
+    env["PYTHONPATH"] = str(SRC)
+    script = (
+        "import json\n"
+        "from wanaspects.propagation import inherited\n"
+        "p = inherited()\n"
+        "print(json.dumps([p.run_id, p.tenant, p.config_hash, p.trace_id]))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True
+    )
+    assert json.loads(out.stdout) == ["r1", "t1", "cfg", TRACE_ID]
@@ -0,0 +1,64 @@
+from importlib import metadata
+
+import pytest
+
+from wanaspects import provenance
+from wanaspects.config import Config, load_config
+from wanaspects.core.factory import ContextFactory
+
+
+def test_package_versions_resolves_once_and_skips_missing(monkeypatch) -> None:
+    calls: list[str] = []
+
+    def fake_version(name: str) -> str:
+        calls.append(name)
+        if name == "missing":
+            raise metadata.PackageNotFoundError(name)
+        return "1.2.3"
+
+    provenance._resolve_versions.cache_clear()
+    monkeypatch.setattr(provenance.metadata, "version", fake_version)
+    try:
+        first = provenance.package_versions(["pkg", "missing"])
+        second = provenance.package_versions(["pkg", "missing"])
+    finally:
+        provenance._resolve_versions.cache_clear()
+
+    assert first == {"pkg": "1.2.3"}
+    assert second is first
+    assert calls == ["pkg", "missing"]
+
+
+def test_config_hash_is_stable_and_sensitive() -> None:
+    assert provenance.config_hash(Config()) == provenance.config_hash(Config())
+    assert provenance.config_hash(Config()) != provenance.config_hash(Config(bundle="prod"))
+    assert len(provenance.config_hash(Config())) == 16  # noqa: PLR2004
+
+
+def test_factory_stamps_lazy_defaults() -> None:
+    resolved: list[str] = []
+
+    def versions() -> dict[str, str]:
+        resolved.append("versions")
+        return {"pkg": "1.0"}
+
+    factory = ContextFactory(package_versions=versions, config_hash=lambda: "abc")
+    assert resolved == []
+
+    ctx = factory.create("s")
+    other = factory.create("t", run_id="r1")
+    assert resolved == ["versions"]
+    assert ctx.package_versions == {"pkg": "1.0"}
+    assert ctx.config_hash == "abc"
+    assert other.package_versions is ctx.package_versions
+    assert factory.create("s", config_hash="override").config_hash == "override"
+
+
+@pytest.mark.parametrize("raw", ["wanaspects, pytest", "pytest"])
+def test_version_packages_env(monkeypatch, raw: str) -> None:
+    monkeypatch.setenv("WANCHAIN_VERSION_PACKAGES", raw)
+    assert load_config().version_packages == tuple(x.strip() for x in raw.split(","))
+
+
+def test_default_context_factory_is_shared() -> None:
+    assert provenance.default_context_factory() is provenance.default_context_factory()
@@ -0,0 +1,37 @@
+import pytest
+
+from wanaspects import rate_limit
+from wanaspects.rate_limit import KeyedRateLimiter
+
+
+def test_token_bucket_reports_suppressed_count(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [0.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+    limiter: KeyedRateLimiter[str] = KeyedRateLimiter(rate=1.0, burst=2)
+
+    assert [limiter.acquire("a") for _ in range(5)] == [0, 0, None, None, None]
+    assert limiter.acquire("b") == 0
+
+    now[0] = 1.0
+    assert limiter.acquire("a") == 3  # noqa: PLR2004
+    assert limiter.acquire("a") is None
+    now[0] = 5.0
+    assert limiter.acquire("a") == 1
+    assert limiter.acquire("a") == 0
+
+
+def test_drain_takes_unreported_counts(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: 0.0)
+    limiter: KeyedRateLimiter[str] = KeyedRateLimiter(rate=1.0, burst=1)
+    for key in ("a", "a", "a", "b"):
+        limiter.acquire(key)
+
+    assert limiter.drain() == {"a": 2}
+    assert limiter.drain() == {}
+
+
+def test_invalid_limits_raise() -> None:
+    with pytest.raises(ValueError, match="rate"):
+        KeyedRateLimiter(rate=0)
+    with pytest.raises(ValueError, match="burst"):
+        KeyedRateLimiter(rate=1, burst=0)
@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from wanaspects.aspects.metrics import MetricsAspect
+from wanaspects.core.context import AdviceContext
+from wanaspects.routing_manager import Route, RoutingAspectManager
+
+
+def _steps(metrics: MetricsAspect) -> list[str]:
+    return [key[0] for key in metrics._steps_total]  # type: ignore[attr-defined]
+
+
+def test_routes_by_boundary_pattern_and_default() -> None:
+    io, load, default = MetricsAspect(), MetricsAspect(), MetricsAspect()
+    manager = RoutingAspectManager(
+        [Route([io], boundary="io"), Route([load], step="load_*", shape="batch")],
+        default=[default],
+    )
+
+    def run(step: str, shape: str = "single", boundary: str = "none") -> None:
+        ctx = AdviceContext(
+            step_name=step,
+            container_shape=shape,  # type: ignore[arg-type]
+            boundary=boundary,  # type: ignore[arg-type]
+        )
+        assert manager.run(ctx, lambda: step) == step
+
+    run("write", boundary="io")
+    run("load_tiles", shape="batch")
+    run("load_tiles")
+    run("load_tiles", shape="batch", boundary="io")
+    assert _steps(io) == ["write", "load_tiles"]
+    assert _steps(load) == ["load_tiles"]
+    assert _steps(default) == ["load_tiles"]
+
+
+def test_dispatch_is_cached_and_reused_by_run_variants() -> None:
+    metrics = MetricsAspect()
+    manager = RoutingAspectManager([Route([metrics], step="x")])
+    ctx = AdviceContext(step_name="x", container_shape="single")
+
+    first = manager.manager_for(ctx)
+    assert manager.manager_for(ctx) is first
+
+    async def body() -> int:
+        return 1
+
+    assert asyncio.run(manager.run_async(ctx, body)) == 1
+    assert manager.run_many(ctx, abs, [-1, -2]) == [1, 2]
+    assert list(manager.run_stream(ctx, lambda: iter("ab"))) == ["a", "b"]
+    assert sum(metrics._steps_total.values()) == 3  # type: ignore[attr-defined]  # noqa: PLR2004
+
+
+def test_dispatch_table_is_bounded() -> None:
+    metrics = MetricsAspect()
+    manager = RoutingAspectManager([Route([metrics], step="x*")], maxsize=2)
+    for i in range(5):
+        manager.run(AdviceContext(step_name=f"x{i}", container_shape="single"), lambda: None)
+    assert len(manager._dispatch) <= 2  # noqa: PLR2004
+    assert _steps(metrics) == [f"x{i}" for i in range(5)]
+
+    with pytest.raises(ValueError):
+        RoutingAspectManager([], maxsize=0)
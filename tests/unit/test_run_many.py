@@ -0,0 +1,98 @@
+import logging
+
+import pytest
+
+from wanaspects.aspects.logging import LoggingAspect
+from wanaspects.aspects.metrics import MetricsAspect
+from wanaspects.core.batch import BatchResult
+from wanaspects.core.context import AdviceContext
+from wanaspects.manager import AspectManager
+
+CTX = AdviceContext(step_name="b", container_shape="batch", boundary="none")
+ITEMS = 10
+
+
+def test_run_many_runs_hooks_once_per_batch() -> None:
+    metrics = MetricsAspect()
+    manager = AspectManager([metrics])
+
+    result = manager.run_many(CTX, lambda x: x * 2, range(ITEMS))
+
+    assert result == [x * 2 for x in range(ITEMS)]
+    assert isinstance(result, BatchResult) and result.failed == 0
+    assert metrics._steps_total[("b", "batch", "none", "ok")] == 1  # type: ignore[attr-defined]
+    batch_items = metrics._batch_items_total  # type: ignore[attr-defined]
+    assert batch_items[("b", "batch", "none", "ok")] == ITEMS
+
+
+def test_run_many_collects_per_item_errors() -> None:
+    metrics = MetricsAspect()
+    manager = AspectManager([metrics])
+
+    def fn(x: int) -> int:
+        if x % 5 == 0:
+            raise KeyError(x)
+        return x
+
+    result = manager.run_many(CTX, fn, range(ITEMS), collect_errors=True)
+
+    assert result[:3] == [None, 1, 2]
+    assert [i for i, _ in result.errors] == [0, 5]
+    batch_items = metrics._batch_items_total  # type: ignore[attr-defined]
+    step_errors = metrics._step_errors_total  # type: ignore[attr-defined]
+    assert batch_items[("b", "batch", "none", "error")] == 2  # noqa: PLR2004
+    assert step_errors[("b", "batch", "none", "KeyError")] == 2  # noqa: PLR2004
+
+    with pytest.raises(KeyError):
+        manager.run_many(CTX, fn, range(ITEMS))
+
+
+class _Counter:
+    def __init__(self) -> None:
+        self.adds: list[tuple[int, dict[str, str]]] = []
+
+    def add(self, amount: int, attributes: dict[str, str]) -> None:
+        self.adds.append((amount, attributes))
+
+
+def test_run_many_item_errors_reach_otel_error_counter() -> None:
+    metrics = MetricsAspect()
+    errors = _Counter()
+    metrics._otel = True  # type: ignore[attr-defined]
+    metrics._counter_errors = errors  # type: ignore[attr-defined]
+
+    def fn(x: int) -> int:
+        if x % 5 == 0:
+            raise KeyError(x)
+        return x
+
+    AspectManager([metrics]).run_many(CTX, fn, range(ITEMS), collect_errors=True)
+
+    assert [amount for amount, _ in errors.adds] == [1, 1]
+    assert {attrs["error_kind"] for _, attrs in errors.adds} == {"KeyError"}
+
+
+def test_run_many_logs_item_counts(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.DEBUG, logger="wanaspects")
+    AspectManager([LoggingAspect()]).run_many(CTX, str, range(ITEMS))
+
+    end = next(r for r in caplog.records if r.msg == "step_end")
+    assert end.items == ITEMS  # type: ignore[attr-defined]
+    assert end.failed == 0  # type: ignore[attr-defined]
+
+
+def test_iter_many_is_lazy_and_chunked() -> None:
+    metrics = MetricsAspect()
+    manager = AspectManager([metrics])
+    consumed: list[int] = []
+
+    def source():  # type: ignore[no-untyped-def]
+        for i in range(ITEMS):
+            consumed.append(i)
+            yield i
+
+    it = manager.iter_many(CTX, lambda x: x + 1, source(), chunk_size=4)
+    assert next(it) == 1
+    assert len(consumed) == 4  # noqa: PLR2004
+    assert list(it) == list(range(2, ITEMS + 1))
+    assert metrics._steps_total[("b", "batch", "none", "ok")] == 3  # type: ignore[attr-defined]  # noqa: PLR2004
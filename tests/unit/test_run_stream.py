@@ -0,0 +1,131 @@
+import asyncio
+import logging
+import time
+
+import pytest
+
+from wanaspects.aspects.context import ContextPropagationAspect
+from wanaspects.aspects.contract import ContractAspect
+from wanaspects.aspects.logging import LoggingAspect
+from wanaspects.context import current_context
+from wanaspects.core.context import AdviceContext
+from wanaspects.core.stream import StreamResult
+from wanaspects.guards import materialize
+from wanaspects.manager import AspectManager
+
+CTX = AdviceContext(step_name="stream", container_shape="batch", boundary="io")
+ITEMS = 3
+SLEEP_SECONDS = 0.01
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.results: list[object] = []
+
+    def before(self, ctx: AdviceContext) -> None:
+        pass
+
+    def around(self, ctx: AdviceContext, call):  # type: ignore[no-untyped-def]
+        return call()
+
+    def after(self, ctx: AdviceContext, result, error):  # type: ignore[no-untyped-def]
+        self.results.append((result, error))
+
+
+def test_run_stream_defers_after_until_exhausted() -> None:
+    recorder = _Recorder()
+    manager = AspectManager([ContextPropagationAspect(), ContractAspect(), recorder])
+
+    def produce():  # type: ignore[no-untyped-def]
+        for i in range(ITEMS):
+            assert current_context() == CTX
+            yield materialize(lambda i=i: i)  # type: ignore[misc]
+            time.sleep(SLEEP_SECONDS)
+
+    stream = manager.run_stream(CTX, produce)
+    assert recorder.results == []
+    assert next(stream) == 0
+    assert recorder.results == []
+    assert list(stream) == [1, 2]
+
+    [(summary, error)] = recorder.results
+    assert error is None
+    assert isinstance(summary, StreamResult)
+    assert summary.items == ITEMS
+    assert summary.first_item_ms is not None
+    assert summary.duration_ms >= SLEEP_SECONDS * 1000 * ITEMS * 0.9
+    assert current_context() is None
+
+
+def test_run_stream_reports_errors_and_early_close() -> None:
+    recorder = _Recorder()
+    manager = AspectManager([recorder])
+
+    def failing():  # type: ignore[no-untyped-def]
+        yield 1
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        list(manager.run_stream(CTX, failing))
+    summary, error = recorder.results[-1]
+    assert isinstance(error, ValueError) and summary.items == 1
+
+    stream = manager.run_stream(CTX, lambda: iter(range(ITEMS)))
+    next(stream)
+    stream.close()  # type: ignore[attr-defined]
+    summary, error = recorder.results[-1]
+    assert error is None and summary.items == 1
+
+
+def test_run_stream_runs_befores_on_first_next() -> None:
+    class _Reject:
+        def before(self, ctx: AdviceContext) -> None:
+            raise PermissionError(ctx.step_name)
+
+    recorder = _Recorder()
+    stream = AspectManager([_Reject(), recorder]).run_stream(CTX, lambda: iter(range(ITEMS)))
+    with pytest.raises(PermissionError):
+        next(stream)
+    assert recorder.results == []
+
+
+def test_step_decorator_streams_generators_with_logging() -> None:
+    logger = logging.getLogger("wanaspects")
+    logger.setLevel(logging.DEBUG)
+    records: list[logging.LogRecord] = []
+    handler = logging.Handler()
+    handler.emit = records.append  # type: ignore[method-assign]
+    logger.addHandler(handler)
+    manager = AspectManager([LoggingAspect()])
+
+    @manager.step("numbers")
+    def numbers(n: int):  # type: ignore[no-untyped-def]
+        for i in range(n):
+            time.sleep(SLEEP_SECONDS)
+            yield i
+
+    try:
+        assert list(numbers(ITEMS)) == [0, 1, 2]
+    finally:
+        logger.removeHandler(handler)
+
+    end = next(r for r in records if r.msg == "step_end")
+    assert end.items == ITEMS  # type: ignore[attr-defined]
+    assert end.duration_ms >= SLEEP_SECONDS * 1000 * ITEMS * 0.9  # type: ignore[attr-defined]
+
+
+def test_run_astream_keeps_guard_for_each_item() -> None:
+    recorder = _Recorder()
+    manager = AspectManager([ContractAspect(), recorder])
+
+    async def produce():  # type: ignore[no-untyped-def]
+        for i in range(ITEMS):
+            await asyncio.sleep(0)
+            yield materialize(lambda i=i: i)  # type: ignore[misc]
+
+    async def consume() -> list[int]:
+        return [item async for item in manager.run_astream(CTX, produce)]
+
+    assert asyncio.run(consume()) == [0, 1, 2]
+    summary, error = recorder.results[-1]
+    assert error is None and summary.items == ITEMS
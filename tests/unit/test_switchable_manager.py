@@ -0,0 +1,81 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+from wanaspects import switchable_manager
+from wanaspects.aspects.metrics import MetricsAspect
+from wanaspects.core.context import AdviceContext
+from wanaspects.switchable_manager import SwitchableAspectManager, global_manager
+
+CTX = AdviceContext(step_name="s", container_shape="single")
+
+
+OK = ("s", "single", "none", "ok")
+
+
+def test_swap_and_disable() -> None:
+    first, second = MetricsAspect(), MetricsAspect()
+    manager = SwitchableAspectManager([first])
+    assert manager.run(CTX, lambda: 1) == 1
+
+    manager.swap([second])
+    manager.run(CTX, lambda: 1)
+    manager.disable()
+    assert not manager.enabled
+    assert manager.run(CTX, lambda: 2) == 2  # noqa: PLR2004
+    assert manager.run_many(CTX, abs, [-1]) == [1]
+    assert list(manager.run_stream(CTX, lambda: iter("ab"))) == ["a", "b"]
+
+    async def body() -> int:
+        return 3
+
+    assert asyncio.run(manager.run_async(CTX, body)) == 3  # noqa: PLR2004
+    assert first._steps_total[OK] == second._steps_total[OK] == 1  # type: ignore[attr-defined]
+
+
+def test_disabled_streams_start_on_first_iteration() -> None:
+    calls: list[str] = []
+
+    def produce() -> list[str]:
+        calls.append("sync")
+        return ["a"]
+
+    async def aproduce() -> AsyncIterator[str]:
+        calls.append("async")
+        yield "b"
+
+    async def consume(stream: AsyncIterator[str]) -> list[str]:
+        return [item async for item in stream]
+
+    manager = SwitchableAspectManager()
+    stream = manager.run_stream(CTX, produce)
+    astream = manager.run_astream(CTX, aproduce)
+    assert calls == []
+    assert next(stream) == "a"
+    assert asyncio.run(consume(astream)) == ["b"]
+    assert calls == ["sync", "async"]
+
+
+def test_step_decorator_follows_swaps() -> None:
+    metrics = MetricsAspect()
+    manager = SwitchableAspectManager()
+
+    @manager.step("s")
+    def step() -> str:
+        return "ok"
+
+    assert step() == "ok"
+    manager.swap([metrics])
+    assert step() == "ok"
+    assert metrics._steps_total[OK] == 1  # type: ignore[attr-defined]
+
+
+def test_global_manager_disabled_unless_enabled(monkeypatch) -> None:
+    monkeypatch.setattr(switchable_manager, "_GLOBAL", {})
+    monkeypatch.setenv("WANCHAIN_ASPECTS_ENABLED", "false")
+    manager = global_manager()
+    assert manager is global_manager()
+    assert not manager.enabled
+
+    monkeypatch.setattr(switchable_manager, "_GLOBAL", {})
+    monkeypatch.setenv("WANCHAIN_ASPECTS_ENABLED", "true")
+    assert global_manager().enabled